@@ -0,0 +1,97 @@
+import logging
+import math
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 2 ** 14 registers, for a relative standard error of 1.04 / sqrt(2 ** 14), about 0.8%
+DEFAULT_HYPERLOGLOG_PRECISION = 14
+
+
+class HyperLogLog:
+    """A mergeable HyperLogLog sketch, estimating the number of distinct values in a stream of values in a single pass
+    with 2 ** precision bytes of memory.
+
+    Each value is hashed to 64 bits: the first precision bits select a register, which keeps the largest position of
+    the first set bit among the remaining bits of the hashes it has seen. The relative standard error of the estimate
+    is 1.04 / sqrt(2 ** precision); small cardinalities are estimated by linear counting, which is nearly exact.
+
+    Sketches of separate chunks or partitions of a column can be combined with merge, and serialized with
+    to_json_dict so that they can be stored and merged later.
+    """
+
+    # Below this precision, the remaining bits of the hash do not fit exactly in a float
+    MIN_PRECISION = 11
+    MAX_PRECISION = 18
+
+    def __init__(self, precision: int = DEFAULT_HYPERLOGLOG_PRECISION):
+        if not self.MIN_PRECISION <= precision <= self.MAX_PRECISION:
+            raise ValueError(
+                f"precision must be between {self.MIN_PRECISION} and {self.MAX_PRECISION}"
+            )
+        self._precision = precision
+        self._registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_standard_error(self) -> float:
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values: Iterable) -> None:
+        """Adds the (non-null) values to the sketch."""
+        values = pd.Series(values) if not isinstance(values, pd.Series) else values
+        values = values[values.notnull()]
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).values
+        remaining_bits = 64 - self._precision
+        register_indices = (hashes >> np.uint64(remaining_bits)).astype(np.int64)
+        remainders = hashes & np.uint64((1 << remaining_bits) - 1)
+        # The position of the first set bit is the number of leading zeros among the remaining bits, plus one;
+        # frexp gives the bit length of the remainders, which fit exactly in a float
+        _, bit_lengths = np.frexp(remainders.astype(np.float64))
+        ranks = remaining_bits - bit_lengths + 1
+        maximum_ranks = pd.Series(ranks).groupby(register_indices).max()
+        self._registers[maximum_ranks.index.values] = np.maximum(
+            self._registers[maximum_ranks.index.values],
+            maximum_ranks.values.astype(np.uint8),
+        )
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Folds the values summarized by other into this sketch."""
+        if other.precision != self._precision:
+            raise ValueError("Only HyperLogLog sketches of the same precision merge")
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        """Returns the estimated number of distinct values added to the sketch."""
+        n_registers = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / n_registers)
+        estimate = (
+            alpha
+            * n_registers ** 2
+            / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        )
+        empty_registers = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * n_registers and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = n_registers * math.log(n_registers / empty_registers)
+        return int(round(estimate))
+
+    def to_json_dict(self) -> dict:
+        return {
+            "precision": self._precision,
+            "registers": self._registers.tolist(),
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: dict) -> "HyperLogLog":
+        sketch = cls(precision=sketch_dict["precision"])
+        sketch._registers = np.asarray(sketch_dict["registers"], dtype=np.uint8)
+        return sketch
@@ -0,0 +1,200 @@
+import logging
+import math
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# The rank error used when allow_relative_error is True rather than a specific error
+DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR = 0.01
+
+
+def get_quantile_sketch_relative_error(
+    allow_relative_error: Union[bool, float, None]
+) -> Optional[float]:
+    """Translates the allow_relative_error argument of quantile metrics into the rank error of a QuantileSketch:
+    None (exact quantiles) for False, DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR for True, or the given float."""
+    if allow_relative_error is None or allow_relative_error is False:
+        return None
+    if allow_relative_error is True:
+        return DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+    if (
+        not isinstance(allow_relative_error, (int, float))
+        or allow_relative_error < 0
+        or allow_relative_error >= 1
+    ):
+        raise ValueError(
+            "allow_relative_error must be a boolean or a number between 0 and 1."
+        )
+    if allow_relative_error == 0:
+        return None
+    return float(allow_relative_error)
+
+
+class QuantileSketch:
+    """A mergeable quantile sketch (KLL), computing approximate quantiles of a stream of values in a single pass with
+    bounded memory.
+
+    Values are kept in a hierarchy of compactors: once a level holds more values than its capacity, it is sorted and
+    every other value is promoted to the next level, where it stands for twice as many values. The rank of the value
+    returned for a quantile q of n values is within relative_error * n of q * (n - 1). Until the first compaction, and
+    always when relative_error is None, the sketch holds every value and quantiles are exact (matching
+    pandas.Series.quantile(interpolation="nearest")). The minimum and maximum are always exact.
+
+    Sketches of separate chunks or partitions of a column can be combined with merge, and serialized with
+    to_json_dict so that they can be stored and merged later.
+    """
+
+    # The capacity of each level below the top, relative to the level above it
+    CAPACITY_DECAY = 2.0 / 3.0
+    MIN_CAPACITY = 8
+
+    def __init__(self, relative_error: Optional[float] = None):
+        """
+        Args:
+            relative_error: the maximum rank error of the quantiles, as a fraction of the number of values; None for
+                exact quantiles (which holds every value)
+        """
+        if relative_error is not None and not 0 < relative_error < 1:
+            raise ValueError("relative_error must be None or between 0 and 1")
+        self._relative_error = relative_error
+        if relative_error is None:
+            self._k = None
+        else:
+            self._k = max(self.MIN_CAPACITY, int(math.ceil(2.0 / relative_error)))
+        self._levels: List[np.ndarray] = [np.array([])]
+        self._count = 0
+        self._min = None
+        self._max = None
+        self._compactions = 0
+
+    @property
+    def relative_error(self) -> Optional[float]:
+        return self._relative_error
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self._levels) == 1
+
+    def _capacity(self, level: int) -> int:
+        if self._k is None:
+            return np.inf
+        depth = len(self._levels) - level - 1
+        return max(
+            self.MIN_CAPACITY, int(math.ceil(self._k * self.CAPACITY_DECAY ** depth)),
+        )
+
+    def update(self, values: Iterable) -> None:
+        """Adds the (non-null) values to the sketch."""
+        values = np.asarray(values)
+        if values.dtype.kind == "f":
+            values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self._update_extrema(values.min(), values.max())
+        self._count += len(values)
+        self._levels[0] = self._concatenate(self._levels[0], values)
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Folds the values summarized by other into this sketch."""
+        if other.count == 0:
+            return
+        self._update_extrema(other._min, other._max)
+        self._count += other.count
+        for level, values in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.array([]))
+            self._levels[level] = self._concatenate(self._levels[level], values)
+        self._compress()
+
+    @staticmethod
+    def _concatenate(values: np.ndarray, other_values: np.ndarray) -> np.ndarray:
+        if len(values) == 0:
+            return np.asarray(other_values)
+        if len(other_values) == 0:
+            return values
+        return np.concatenate([values, other_values])
+
+    def _update_extrema(self, minimum, maximum) -> None:
+        self._min = minimum if self._min is None else min(self._min, minimum)
+        self._max = maximum if self._max is None else max(self._max, maximum)
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            if len(self._levels[level]) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.array([]))
+                values = np.sort(self._levels[level], kind="mergesort")
+                # With an odd number of values, one stays behind at this level
+                split = len(values) % 2
+                remaining, values = values[:split], values[split:]
+                # Alternating which half is promoted keeps the rank error of successive compactions from adding up
+                offset = self._compactions % 2
+                self._compactions += 1
+                self._levels[level + 1] = self._concatenate(
+                    self._levels[level + 1], values[offset::2]
+                )
+                self._levels[level] = remaining
+            level += 1
+
+    def get_quantiles(self, quantiles: Iterable[float]) -> list:
+        """Returns the value at each of the quantiles (None for all of them if no values were added)."""
+        quantiles = list(quantiles)
+        if self._count == 0:
+            return [None for _ in quantiles]
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_values), 2 ** level)
+                for level, level_values in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="mergesort")
+        values = values[order]
+        cumulative_weights = np.cumsum(weights[order])
+
+        results = []
+        for quantile in quantiles:
+            if quantile <= 0:
+                value = self._min
+            elif quantile >= 1:
+                value = self._max
+            else:
+                rank = np.around(quantile * (self._count - 1))
+                index = np.searchsorted(cumulative_weights, rank, side="right")
+                value = values[min(index, len(values) - 1)]
+            results.append(value.item() if isinstance(value, np.generic) else value)
+        return results
+
+    def to_json_dict(self) -> dict:
+        return {
+            "relative_error": self._relative_error,
+            "count": self._count,
+            "min": self._as_json_value(self._min),
+            "max": self._as_json_value(self._max),
+            "compactions": self._compactions,
+            "levels": [level_values.tolist() for level_values in self._levels],
+        }
+
+    @staticmethod
+    def _as_json_value(value):
+        return value.item() if isinstance(value, np.generic) else value
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: dict) -> "QuantileSketch":
+        sketch = cls(relative_error=sketch_dict["relative_error"])
+        sketch._count = sketch_dict["count"]
+        sketch._min = sketch_dict["min"]
+        sketch._max = sketch_dict["max"]
+        sketch._compactions = sketch_dict["compactions"]
+        sketch._levels = [
+            np.asarray(level_values) for level_values in sketch_dict["levels"]
+        ]
+        return sketch
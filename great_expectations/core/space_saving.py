@@ -0,0 +1,99 @@
+import logging
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# The number of values tracked for each of the k most common values requested
+SPACE_SAVING_CAPACITY_FACTOR = 10
+
+
+class SpaceSavingSketch:
+    """A mergeable Space-Saving sketch, tracking the most common values of a stream of values with a bounded number of
+    counters.
+
+    The sketch keeps a count for at most capacity values. A value that is not tracked, once every counter is in use,
+    takes over the counter with the smallest count, and adds its count to it. Counts are therefore overestimated by
+    at most the smallest tracked count (the error returned with them), and every value occurring more than
+    (number of values / capacity) times is tracked. Until capacity distinct values have been seen, counts are exact.
+
+    Sketches of separate chunks or partitions of a column can be combined with merge.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self._capacity = capacity
+        self._counts = pd.Series([], dtype="int64")
+        self._errors = pd.Series([], dtype="int64")
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self._errors) == 0 or self._errors.max() == 0
+
+    def update(self, values: Iterable) -> None:
+        """Adds the (non-null) values to the sketch."""
+        values = pd.Series(values) if not isinstance(values, pd.Series) else values
+        counts = values.value_counts()
+        self._merge_counts(counts, pd.Series(0, index=counts.index, dtype="int64"))
+
+    def merge(self, other: "SpaceSavingSketch") -> None:
+        """Folds the values summarized by other into this sketch."""
+        self._merge_counts(other._counts, other._errors, other._minimum_count())
+
+    def _minimum_count(self) -> int:
+        # The count any untracked value may have had
+        if len(self._counts) < self._capacity:
+            return 0
+        return int(self._counts.min())
+
+    def _merge_counts(
+        self, counts: pd.Series, errors: pd.Series, other_minimum_count: int = 0
+    ) -> None:
+        if len(counts) == 0:
+            return
+        # A value tracked by only one side may have been counted by the other, up to its smallest count
+        minimum_count = self._minimum_count()
+        merged_counts = self._counts.add(counts, fill_value=0)
+        merged_errors = self._errors.add(errors, fill_value=0)
+        untracked = ~merged_counts.index.isin(self._counts.index)
+        merged_counts[untracked] += minimum_count
+        merged_errors[untracked] += minimum_count
+        not_in_other = ~merged_counts.index.isin(counts.index)
+        merged_counts[not_in_other] += other_minimum_count
+        merged_errors[not_in_other] += other_minimum_count
+
+        kept = merged_counts.sort_values(ascending=False, kind="mergesort").index[
+            : self._capacity
+        ]
+        self._counts = merged_counts[kept].astype("int64")
+        self._errors = merged_errors[kept].astype("int64")
+
+    def get_top_k(self, k: int) -> pd.Series:
+        """Returns the (estimated) counts of the k most common values, most common first."""
+        return get_top_k_counts(self._counts, k)
+
+    def get_errors(self) -> pd.Series:
+        """Returns the largest overestimate of the count of each tracked value."""
+        return self._errors
+
+
+def get_top_k_counts(counts: pd.Series, k: int) -> pd.Series:
+    """Returns the k largest of the counts (indexed by value), most common first, with ties broken by value where
+    values are comparable."""
+    try:
+        counts = counts.sort_index(kind="mergesort")
+    except TypeError:
+        # Values of multiple types in an object column cannot be compared
+        pass
+    # A stable sort on the negated counts keeps ties in order (a descending sort would reverse them)
+    counts = counts.iloc[np.argsort(-counts.values, kind="mergesort")[:k]]
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
@@ -62,7 +62,8 @@ from great_expectations.data_context.util import (
     substitute_all_config_variables,
     substitute_config_variable,
 )
-from great_expectations.dataset import Dataset
+from great_expectations.dataset import Dataset, SqlAlchemyDataset
+from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
 from great_expectations.datasource import LegacyDatasource
 from great_expectations.datasource.new_datasource import BaseDatasource, Datasource
 from great_expectations.marshmallow__shade import ValidationError
@@ -1938,6 +1939,8 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        # Metrics are written to the store at once, in a single transaction on database store backends
+        metric_values = {}
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -1959,7 +1962,7 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
+                        metric_values[
                             ValidationMetricIdentifier(
                                 run_id=run_id,
                                 data_asset_name=data_asset_name,
@@ -1970,9 +1973,8 @@ class BaseDataContext:
                                 metric_kwargs_id=get_metric_kwargs_id(
                                     metric_name, metric_kwargs
                                 ),
-                            ),
-                            metric_value,
-                        )
+                            )
+                        ] = metric_value
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
                         logger.debug(
@@ -1980,6 +1982,9 @@ class BaseDataContext:
                             "this validation result.".format(metric_name)
                         )
 
+        if metric_values:
+            self.stores[target_store_name].set_many(metric_values)
+
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
     ):
@@ -2042,7 +2047,7 @@ class BaseDataContext:
         Args:
             data_asset_name: name of data asset for which to get validation result
             expectation_suite_name: expectation_suite name for which to get validation result (default: "default")
-            run_id: run_id for which to get validation result (if None, fetch the latest result by alphanumeric sort)
+            run_id: run_id for which to get validation result (if None, fetch the latest result by run time)
             validations_store_name: the name of the store from which to get validation results
             failed_only: if True, filter the result to return only failed expectations
 
@@ -2055,33 +2060,18 @@ class BaseDataContext:
         selected_store = self.stores[validations_store_name]
 
         if run_id is None or batch_identifier is None:
-            # Get most recent run id
-            # NOTE : This method requires a (potentially very inefficient) list_keys call.
-            # It should probably move to live in an appropriate Store class,
-            # but when we do so, that Store will need to function as more than just a key-value Store.
-            key_list = selected_store.list_keys()
-            filtered_key_list = []
-            for key in key_list:
-                if run_id is not None and key.run_id != run_id:
-                    continue
-                if (
-                    batch_identifier is not None
-                    and key.batch_identifier != batch_identifier
-                ):
-                    continue
-                filtered_key_list.append(key)
-
-            # run_id_set = set([key.run_id for key in filtered_key_list])
-            if len(filtered_key_list) == 0:
+            # Get the most recent validation result of the suite, from the index of the store if it has one
+            latest_key = selected_store.get_latest_key(
+                expectation_suite_name,
+                run_id=run_id,
+                batch_identifier=batch_identifier,
+            )
+            if latest_key is None:
                 logger.warning("No valid run_id values found.")
                 return {}
 
-            filtered_key_list = sorted(filtered_key_list, key=lambda x: x.run_id)
-
-            if run_id is None:
-                run_id = filtered_key_list[-1].run_id
-            if batch_identifier is None:
-                batch_identifier = filtered_key_list[-1].batch_identifier
+            run_id = latest_key.run_id
+            batch_identifier = latest_key.batch_identifier
 
         key = ValidationResultIdentifier(
             expectation_suite_identifier=ExpectationSuiteIdentifier(
@@ -2731,13 +2721,24 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
 
         checkpoint = self.get_checkpoint(checkpoint_name)
 
-        batches_to_validate = []
+        # Each distinct batch is loaded once, and validated against all of the suites listed for it
+        suite_names_by_batch_kwargs_id = OrderedDict()
+        batch_kwargs_by_id = {}
         for batch in checkpoint["batches"]:
-            batch_kwargs = batch["batch_kwargs"]
-            for suite_name in batch["expectation_suite_names"]:
-                suite = self.get_expectation_suite(suite_name)
-                batch = self.get_batch(batch_kwargs, suite)
-                batches_to_validate.append(batch)
+            batch_kwargs = BatchKwargs(batch["batch_kwargs"])
+            batch_kwargs_id = batch_kwargs.to_id()
+            batch_kwargs_by_id[batch_kwargs_id] = batch_kwargs
+            suite_names_by_batch_kwargs_id.setdefault(batch_kwargs_id, []).extend(
+                batch["expectation_suite_names"]
+            )
+
+        batches_to_validate = []
+        for batch_kwargs_id, suite_names in suite_names_by_batch_kwargs_id.items():
+            batches_to_validate.extend(
+                self._get_batches_for_expectation_suites(
+                    batch_kwargs_by_id[batch_kwargs_id], suite_names
+                )
+            )
 
         results = self.run_validation_operator(
             checkpoint["validation_operator_name"],
@@ -2751,6 +2752,58 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
         )
         return results
 
+    def _get_batches_for_expectation_suites(
+        self, batch_kwargs: Union[dict, BatchKwargs], expectation_suite_names: List[str]
+    ) -> List[DataAsset]:
+        """Loads the batch of data described by batch_kwargs once, and returns a DataAsset for each of the expectation
+        suites, all validating that same data.
+
+        The DataAssets also share the cached values of their getters (see Dataset.hashable_getters), so that metrics
+        that several suites need, such as the row count of the batch or the null counts of a column, are computed
+        once.
+        """
+        if isinstance(batch_kwargs, dict):
+            batch_kwargs = BatchKwargs(batch_kwargs)
+        datasource = self.get_datasource(batch_kwargs.get("datasource"))
+        batch = datasource.get_batch(batch_kwargs=batch_kwargs)
+        data_asset_type = datasource.config.get("data_asset_type")
+
+        data_assets = []
+        for expectation_suite_name in expectation_suite_names:
+            validator = BridgeValidator(
+                batch=batch,
+                expectation_suite=self.get_expectation_suite(expectation_suite_name),
+                expectation_engine=data_asset_type,
+            )
+            data_asset = validator.get_dataset()
+            if not data_assets:
+                if (
+                    isinstance(data_asset, SqlAlchemyDataset)
+                    and data_asset.generated_table_name is not None
+                ):
+                    # The query of the batch was materialized in a temporary table, which the other suites reuse
+                    batch = Batch(
+                        datasource_name=batch.datasource_name,
+                        batch_kwargs=batch.batch_kwargs,
+                        data=SqlAlchemyBatchReference(
+                            engine=data_asset.engine,
+                            table_name=data_asset.generated_table_name,
+                            schema=data_asset._table.schema,
+                        ),
+                        batch_parameters=batch.batch_parameters,
+                        batch_markers=batch.batch_markers,
+                        data_context=batch.data_context,
+                    )
+            elif (
+                isinstance(data_asset, Dataset)
+                and data_asset.caching
+                and data_assets[0].caching
+            ):
+                for getter in data_asset.hashable_getters:
+                    setattr(data_asset, getter, getattr(data_assets[0], getter))
+            data_assets.append(data_asset)
+        return data_assets
+
     def _list_ymls_in_checkpoints_directory(self):
         checkpoints_dir = os.path.join(self.root_directory, self.CHECKPOINTS_DIR)
         files = glob.glob(os.path.join(checkpoints_dir, "*.yml"), recursive=False)
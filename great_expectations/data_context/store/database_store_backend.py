@@ -17,6 +17,7 @@ try:
         and_,
         column,
         create_engine,
+        or_,
         select,
         text,
     )
@@ -30,8 +31,21 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# The largest number of bound parameters in one statement, under the lowest limit of supported dialects (SQLite's)
+MAX_BIND_PARAMETERS = 900
+
 
 class DatabaseStoreBackend(StoreBackend):
+    """Stores values in a database table, with a column for each element of the (fixed-length) keys.
+
+    Several keys are read with one SELECT per batch (get_many), and written in one transaction (set_many), with a
+    statement executed for all the keys at once:
+      - PostgreSQL: INSERT ... ON CONFLICT DO UPDATE
+      - MySQL: INSERT ... ON DUPLICATE KEY UPDATE
+      - SQLite: INSERT OR REPLACE (the table only has the key columns and the value, so replacing a row updates it)
+      - other dialects: a batched lookup of the existing keys, followed by an UPDATE of those and an INSERT of the others
+    """
+
     def __init__(
         self,
         table_name,
@@ -214,18 +228,19 @@ class DatabaseStoreBackend(StoreBackend):
             create_engine_kwargs,
         )
 
+    def _get_key_condition(self, key):
+        return and_(
+            *[
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            ]
+        )
+
     def _get(self, key):
         sel = (
             select([column("value")])
             .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    ]
-                )
-            )
+            .where(self._get_key_condition(key))
         )
         try:
             return self.engine.execute(sel).fetchone()[0]
@@ -233,22 +248,101 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug("Error fetching value: " + str(e))
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
 
-    def _set(self, key, value, allow_update=True):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
-
-        if allow_update:
-            if self.has_key(key):
-                ins = (
+    def _get_batches(self, keys):
+        batch_size = max(1, MAX_BIND_PARAMETERS // len(self.key_columns))
+        for start in range(0, len(keys), batch_size):
+            yield keys[start : start + batch_size]
+
+    def _select_values(self, connection, keys) -> dict:
+        values = {}
+        for batch in self._get_batches(keys):
+            sel = select(
+                [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+                + [self._table.columns.value]
+            ).where(or_(*[self._get_key_condition(key) for key in batch]))
+            for row in connection.execute(sel).fetchall():
+                values[tuple(row[:-1])] = row[-1]
+        return values
+
+    def _get_many(self, keys):
+        try:
+            with self.engine.connect() as connection:
+                values = self._select_values(connection, keys)
+        except SQLAlchemyError as e:
+            logger.debug("Error fetching values: " + str(e))
+            raise ge_exceptions.StoreError("Unable to fetch values for keys")
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            raise ge_exceptions.StoreError(
+                "Unable to fetch value for key: " + str(missing_keys[0])
+            )
+        return {key: values[key] for key in keys}
+
+    def _get_row(self, key, value) -> dict:
+        row = {k: v for (k, v) in zip(self.key_columns, key)}
+        row["value"] = value
+        return row
+
+    def _upsert(self, connection, values) -> None:
+        rows = [self._get_row(key, value) for key, value in values.items()]
+        dialect_name = self.engine.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+
+            statement = insert(self._table)
+            statement = statement.on_conflict_do_update(
+                index_elements=self.key_columns,
+                set_={"value": statement.excluded.value},
+            )
+            connection.execute(statement, rows)
+        elif dialect_name == "sqlite":
+            # The table only has the key columns and the value, so replacing a row is updating its value
+            connection.execute(self._table.insert().prefix_with("OR REPLACE"), rows)
+        elif dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(self._table)
+            statement = statement.on_duplicate_key_update(
+                value=statement.inserted.value
+            )
+            connection.execute(statement, rows)
+        else:
+            existing_keys = set(self._select_values(connection, list(values)))
+            updated_rows = [
+                dict(
+                    {f"key_{key_col}": row[key_col] for key_col in self.key_columns},
+                    new_value=row["value"],
+                )
+                for key, row in zip(values, rows)
+                if key in existing_keys
+            ]
+            inserted_rows = [
+                row for key, row in zip(values, rows) if key not in existing_keys
+            ]
+            if updated_rows:
+                update = (
                     self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
+                    .where(
+                        and_(
+                            *[
+                                getattr(self._table.columns, key_col)
+                                == sa.bindparam(f"key_{key_col}")
+                                for key_col in self.key_columns
+                            ]
+                        )
+                    )
+                    .values(value=sa.bindparam("new_value"))
                 )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
+                connection.execute(update, updated_rows)
+            if inserted_rows:
+                connection.execute(self._table.insert(), inserted_rows)
+
+    def _set(self, key, value, allow_update=True):
+        if allow_update:
+            self._set_many({key: value})
+            return
 
+        ins = self._table.insert().values(**self._get_row(key, value))
         try:
             self.engine.execute(ins)
         except IntegrityError as e:
@@ -259,6 +353,22 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _set_many(self, values, allow_update=True):
+        if not allow_update:
+            for key, value in values.items():
+                self._set(key, value, allow_update=False)
+            return
+
+        if not values:
+            return
+        try:
+            with self.engine.begin() as connection:
+                self._upsert(connection, values)
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to store keys: got sqlalchemy error {str(e)}"
+            )
+
     def _move(self):
         raise NotImplementedError
 
@@ -284,14 +394,7 @@ class DatabaseStoreBackend(StoreBackend):
         sel = (
             select([sa.func.count(column("value"))])
             .select_from(self._table)
-            .where(
-                and_(
-                    *[
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    ]
-                )
-            )
+            .where(self._get_key_condition(key))
         )
         try:
             return self.engine.execute(sel).fetchone()[0] == 1
@@ -315,14 +418,7 @@ class DatabaseStoreBackend(StoreBackend):
         return [tuple(row) for row in self.engine.execute(sel).fetchall()]
 
     def remove_key(self, key):
-        delete_statement = self._table.delete().where(
-            and_(
-                *[
-                    getattr(self._table.columns, key_col) == val
-                    for key_col, val in zip(self.key_columns, key)
-                ]
-            )
-        )
+        delete_statement = self._table.delete().where(self._get_key_condition(key))
         try:
             return self.engine.execute(delete_statement)
         except SQLAlchemyError as e:
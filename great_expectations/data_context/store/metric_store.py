@@ -86,8 +86,11 @@ class EvaluationParameterStore(MetricStore):
         super().__init__(store_backend=store_backend, store_name=store_name)
 
     def get_bind_params(self, run_id):
-        params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
-            key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)
-        return params
+        keys = [
+            self.tuple_to_key(k)
+            for k in self._store_backend.list_keys(run_id.to_tuple())
+        ]
+        return {
+            key.to_evaluation_parameter_urn(): value
+            for key, value in self.get_many(keys).items()
+        }
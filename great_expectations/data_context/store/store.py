@@ -134,6 +134,29 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value)
             )
 
+    def get_many(self, keys):
+        """Returns the values of the keys, read from the store backend at once where it supports it."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        key_tuples = [self.key_to_tuple(key) for key in keys]
+        values = self._store_backend.get_many(key_tuples)
+        return {
+            key: self.deserialize(key, values[key_tuple]) if values[key_tuple] else None
+            for key, key_tuple in zip(keys, key_tuples)
+        }
+
+    def set_many(self, values):
+        """Sets the values of several keys, written to the store backend at once where it supports it."""
+        for key in values:
+            self._validate_key(key)
+        return self._store_backend.set_many(
+            {
+                self.key_to_tuple(key): self.serialize(key, value)
+                for key, value in values.items()
+            }
+        )
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError, StoreError
 
@@ -17,6 +17,9 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Store backends that can read or write several keys at once (for example in a single query) may also override
+    _get_many and _set_many, which otherwise get and set each key in turn.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -119,6 +122,26 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys: Iterable[tuple], **kwargs) -> Dict[tuple, object]:
+        """Returns the values of the keys, raising the same errors as get for keys that do not exist."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, values: Dict[tuple, object], **kwargs):
+        """Sets the values of several keys, inserting the keys that do not exist and updating those that do."""
+        for key, value in values.items():
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._set_many(values, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -162,6 +185,12 @@ class StoreBackend(metaclass=ABCMeta):
     def _set(self, key, value, **kwargs):
         raise NotImplementedError
 
+    def _get_many(self, keys, **kwargs):
+        return {key: self._get(key, **kwargs) for key in keys}
+
+    def _set_many(self, values, **kwargs):
+        return [self._set(key, value, **kwargs) for key, value in values.items()]
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs):
         raise NotImplementedError
@@ -1,10 +1,14 @@
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
+import concurrent.futures
 import logging
 import os
 import random
 import re
 import shutil
+import threading
+import time
 from abc import ABCMeta
+from typing import Callable, List, Optional
 
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
@@ -390,6 +394,71 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         )
 
 
+class KeyIndexCache:
+    """The keys listed from a remote store backend, reused for ttl_seconds after they were listed.
+
+    Keys set through the store backend in the meantime are added to the index, and the index is discarded when keys
+    are removed or moved, so that a store backend always sees its own writes.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self._ttl_seconds = ttl_seconds
+        self._keys = None
+        self._timestamp = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[List[tuple]]:
+        """Returns the indexed keys, or None if they were never listed or the index has expired."""
+        with self._lock:
+            if (
+                self._keys is None
+                or time.monotonic() - self._timestamp > self._ttl_seconds
+            ):
+                return None
+            return list(self._keys)
+
+    def set(self, keys: List[tuple]) -> None:
+        with self._lock:
+            # A dict keeps the keys in the order in which they were listed
+            self._keys = dict.fromkeys(keys)
+            self._timestamp = time.monotonic()
+
+    def add(self, key: tuple) -> None:
+        with self._lock:
+            if self._keys is not None:
+                self._keys[key] = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = None
+            self._timestamp = None
+
+
+def list_object_names_by_prefix(
+    list_object_names: Callable[[str], List[str]],
+    list_object_names_and_prefixes: Callable[[str], tuple],
+    prefix: str,
+    max_workers: int,
+) -> List[str]:
+    """Lists the names of the objects under prefix by listing the objects directly under it, and the objects under each
+    of its sub-prefixes (the "directories" under prefix) in parallel on max_workers threads.
+
+    Args:
+        list_object_names: lists (every page of) the names of the objects under a prefix
+        list_object_names_and_prefixes: lists the names of the objects directly under a prefix, and its sub-prefixes
+        prefix: the prefix under which to list objects, ending with the delimiter unless it is empty
+        max_workers: the number of sub-prefixes listed at once
+
+    Returns:
+        The names of the objects, those directly under prefix first and then those under each sub-prefix, in order
+    """
+    object_names, sub_prefixes = list_object_names_and_prefixes(prefix)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for sub_prefix_object_names in executor.map(list_object_names, sub_prefixes):
+            object_names.extend(sub_prefix_object_names)
+    return object_names
+
+
 class TupleS3StoreBackend(TupleStoreBackend):
     """
     Uses an S3 bucket as a store.
@@ -397,6 +466,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    Keys are listed page by page. With list_keys_max_workers, the "directories" directly under the prefix are listed
+    in parallel, on as many threads. With list_keys_cache_ttl_seconds, listed keys are kept in a KeyIndexCache and
+    reused for that long.
     """
 
     def __init__(
@@ -414,6 +487,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        list_keys_max_workers: Optional[int] = None,
+        list_keys_cache_ttl_seconds: Optional[float] = None,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -437,6 +512,13 @@ class TupleS3StoreBackend(TupleStoreBackend):
             prefix = prefix.strip("/")
         self.prefix = prefix
         self.endpoint_url = endpoint_url
+        self.list_keys_max_workers = list_keys_max_workers
+        self._key_index = (
+            KeyIndexCache(list_keys_cache_ttl_seconds)
+            if list_keys_cache_ttl_seconds is not None
+            else None
+        )
+        self._s3_client = None
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -458,10 +540,16 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 s3_object_key = self._convert_key_to_filepath(key)
         return s3_object_key
 
-    def _get(self, key):
-        import boto3
+    def _get_s3_client(self):
+        # boto3 clients are thread-safe, so a single client serves every call, including parallel listings
+        if self._s3_client is None:
+            import boto3
+
+            self._s3_client = boto3.client("s3", endpoint_url=self.endpoint_url)
+        return self._s3_client
 
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+    def _get(self, key):
+        s3 = self._get_s3_client()
 
         s3_object_key = self._build_s3_object_key(key)
 
@@ -501,6 +589,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
+        if self._key_index is not None:
+            self._key_index.add(
+                self._convert_filepath_to_key(self._convert_key_to_filepath(key))
+            )
         return s3_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
@@ -520,32 +612,51 @@ class TupleS3StoreBackend(TupleStoreBackend):
         )
 
         s3.Object(self.bucket, source_filepath).delete()
+        if self._key_index is not None:
+            self._key_index.clear()
+
+    def _list_s3_object_keys(self, prefix: str) -> List[str]:
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        return [
+            s3_object_info["Key"]
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for s3_object_info in page.get("Contents", [])
+        ]
+
+    def _list_s3_object_keys_and_prefixes(self, prefix: str) -> tuple:
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        s3_object_keys = []
+        sub_prefixes = []
+        for page in paginator.paginate(
+            Bucket=self.bucket, Prefix=prefix, Delimiter="/"
+        ):
+            s3_object_keys.extend(
+                s3_object_info["Key"] for s3_object_info in page.get("Contents", [])
+            )
+            sub_prefixes.extend(
+                common_prefix["Prefix"]
+                for common_prefix in page.get("CommonPrefixes", [])
+            )
+        return s3_object_keys, sub_prefixes
 
-    def list_keys(self):
-        key_list = []
-
-        import boto3
-
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
-
-        if self.prefix:
-            s3_objects = s3.list_objects_v2(Bucket=self.bucket, Prefix=self.prefix)
-        else:
-            s3_objects = s3.list_objects_v2(Bucket=self.bucket)
-
-        if "Contents" in s3_objects:
-            objects = s3_objects["Contents"]
-        elif "CommonPrefixes" in s3_objects:
-            logger.warning(
-                "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
+    def list_keys(self, prefix=()):
+        if self._key_index is not None:
+            key_list = self._key_index.get()
+            if key_list is not None:
+                return [key for key in key_list if key[: len(prefix)] == prefix]
+
+        if self.list_keys_max_workers is not None and self.list_keys_max_workers > 1:
+            s3_object_keys = list_object_names_by_prefix(
+                self._list_s3_object_keys,
+                self._list_s3_object_keys_and_prefixes,
+                f"{self.prefix}/" if self.prefix else "",
+                self.list_keys_max_workers,
             )
-            objects = []
         else:
-            # No objects found in store
-            objects = []
+            s3_object_keys = self._list_s3_object_keys(self.prefix)
 
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info["Key"]
+        key_list = []
+        for s3_object_key in s3_object_keys:
             if self.platform_specific_separator:
                 s3_object_key = os.path.relpath(s3_object_key, self.prefix)
             else:
@@ -567,23 +678,16 @@ class TupleS3StoreBackend(TupleStoreBackend):
             if key:
                 key_list.append(key)
 
-        return key_list
+        if self._key_index is not None:
+            self._key_index.set(key_list)
+        return [key for key in key_list if key[: len(prefix)] == prefix]
 
     def get_url_for_key(self, key, protocol=None):
-        import boto3
-
-        location = boto3.client(
-            "s3", endpoint_url=self.endpoint_url
-        ).get_bucket_location(Bucket=self.bucket)["LocationConstraint"]
-        if location is None:
-            location = "s3"
-        else:
-            location = "s3-" + location
         s3_key = self._convert_key_to_filepath(key)
 
-        location = boto3.client(
-            "s3", endpoint_url=self.endpoint_url
-        ).get_bucket_location(Bucket=self.bucket)["LocationConstraint"]
+        location = self._get_s3_client().get_bucket_location(Bucket=self.bucket)[
+            "LocationConstraint"
+        ]
         if location is None:
             location = "s3"
         else:
@@ -621,6 +725,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
         s3_object_key = self._build_s3_object_key(key)
         s3.Object(self.bucket, s3_object_key).delete()
+        if self._key_index is not None:
+            self._key_index.clear()
         if s3_object_key:
             try:
                 #
@@ -643,8 +749,20 @@ class TupleS3StoreBackend(TupleStoreBackend):
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        from botocore.exceptions import ClientError
+
+        if self._key_index is not None:
+            key_list = self._key_index.get()
+            if key_list is not None:
+                return key in key_list
+
+        try:
+            self._get_s3_client().head_object(
+                Bucket=self.bucket, Key=self._build_s3_object_key(key)
+            )
+        except ClientError:
+            return False
+        return True
 
 
 class TupleGCSStoreBackend(TupleStoreBackend):
@@ -655,6 +773,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
 
     The filepath_template is a string template used to convert the key to a filepath.
+
+    With list_keys_max_workers, the "directories" directly under the prefix are listed in parallel, on as many
+    threads. With list_keys_cache_ttl_seconds, listed keys are kept in a KeyIndexCache and reused for that long.
     """
 
     def __init__(
@@ -673,6 +794,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        list_keys_max_workers: Optional[int] = None,
+        list_keys_cache_ttl_seconds: Optional[float] = None,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -690,6 +813,12 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self.list_keys_max_workers = list_keys_max_workers
+        self._key_index = (
+            KeyIndexCache(list_keys_cache_ttl_seconds)
+            if list_keys_cache_ttl_seconds is not None
+            else None
+        )
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -747,6 +876,10 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             )
         else:
             blob.upload_from_string(value, content_type=content_type)
+        if self._key_index is not None:
+            self._key_index.add(
+                self._convert_filepath_to_key(self._convert_key_to_filepath(key))
+            )
         return gcs_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
@@ -764,16 +897,43 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
+        if self._key_index is not None:
+            self._key_index.clear()
 
-    def list_keys(self):
-        key_list = []
+    def _list_gcs_object_names(self, prefix: str) -> List[str]:
+        from google.cloud import storage
+
+        # Clients are not shared between the threads of a parallel listing
+        gcs = storage.Client(self.project)
+        return [blob.name for blob in gcs.list_blobs(self.bucket, prefix=prefix)]
 
+    def _list_gcs_object_names_and_prefixes(self, prefix: str) -> tuple:
         from google.cloud import storage
 
         gcs = storage.Client(self.project)
+        blobs = gcs.list_blobs(self.bucket, prefix=prefix, delimiter="/")
+        # The sub-prefixes are collected as the pages of blobs are read
+        gcs_object_names = [blob.name for blob in blobs]
+        return gcs_object_names, sorted(blobs.prefixes)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
-            gcs_object_name = blob.name
+    def list_keys(self, prefix=()):
+        if self._key_index is not None:
+            key_list = self._key_index.get()
+            if key_list is not None:
+                return [key for key in key_list if key[: len(prefix)] == prefix]
+
+        if self.list_keys_max_workers is not None and self.list_keys_max_workers > 1:
+            gcs_object_names = list_object_names_by_prefix(
+                self._list_gcs_object_names,
+                self._list_gcs_object_names_and_prefixes,
+                f"{self.prefix}/" if self.prefix else "",
+                self.list_keys_max_workers,
+            )
+        else:
+            gcs_object_names = self._list_gcs_object_names(self.prefix)
+
+        key_list = []
+        for gcs_object_name in gcs_object_names:
             gcs_object_key = os.path.relpath(gcs_object_name, self.prefix,)
             if self.filepath_prefix and not gcs_object_key.startswith(
                 self.filepath_prefix
@@ -786,7 +946,10 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             key = self._convert_filepath_to_key(gcs_object_key)
             if key:
                 key_list.append(key)
-        return key_list
+
+        if self._key_index is not None:
+            self._key_index.set(key_list)
+        return [key for key in key_list if key[: len(prefix)] == prefix]
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -831,6 +994,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
         gcs = storage.Client(project=self.project)
         bucket = gcs.get_bucket(self.bucket)
+        if self._key_index is not None:
+            self._key_index.clear()
         try:
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
         except NotFound:
@@ -0,0 +1,179 @@
+import bisect
+import json
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.types.resource_identifiers import (
+    ValidationResultIdentifier,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_validation_result_sort_key(key: ValidationResultIdentifier) -> Tuple:
+    """Orders the keys of validation results by run time, then run name and batch identifier."""
+    run_name, run_time = key.run_id.to_tuple()
+    # Run times are formatted in UTC as %Y%m%dT%H%M%S.%fZ, so they sort chronologically as strings
+    return run_time, run_name, key.batch_identifier or "__none__"
+
+
+class _SortedKeys:
+    """The keys of validation results, kept sorted by get_validation_result_sort_key."""
+
+    def __init__(self):
+        self.sort_keys: List[Tuple] = []
+        self.keys: List[ValidationResultIdentifier] = []
+
+    def add(self, key: ValidationResultIdentifier) -> None:
+        sort_key = get_validation_result_sort_key(key)
+        position = bisect.bisect_right(self.sort_keys, sort_key)
+        self.sort_keys.insert(position, sort_key)
+        self.keys.insert(position, key)
+
+    def get_run_range(self, run_name: str, run_time: str) -> Tuple[int, int]:
+        # (run_time, run_name) sorts before, and (run_time, run_name + "\0") after, every key of the run
+        return (
+            bisect.bisect_left(self.sort_keys, (run_time, run_name)),
+            bisect.bisect_left(self.sort_keys, (run_time, run_name + "\0")),
+        )
+
+
+class ValidationResultIndex:
+    """An index of the validation results in a ValidationsStore, by expectation suite and run time.
+
+    The index is kept in memory, and persisted as a JSON-lines manifest (one key tuple per line) under
+    MANIFEST_KEY, next to the validation results in the store backend. It is loaded from the manifest the first time
+    it is used, or built by listing the keys of the store backend once if there is no manifest yet, and updated as
+    validation results are added through the store.
+
+    Validation results written without going through this index (by another process, for instance) are not
+    indexed until the index is rebuilt.
+    """
+
+    MANIFEST_KEY = (".ge_validation_result_index",)
+
+    def __init__(
+        self,
+        store_backend: StoreBackend,
+        key_to_tuple: Callable[[ValidationResultIdentifier], tuple],
+        tuple_to_key: Callable[[tuple], ValidationResultIdentifier],
+    ):
+        self._store_backend = store_backend
+        self._key_to_tuple = key_to_tuple
+        self._tuple_to_key = tuple_to_key
+        self._lock = threading.RLock()
+        self._key_tuples = None
+        self._keys_by_suite: Dict[str, _SortedKeys] = {}
+        self._all_keys = _SortedKeys()
+
+    def _reset(self) -> None:
+        self._key_tuples = set()
+        self._keys_by_suite = {}
+        self._all_keys = _SortedKeys()
+
+    def _index_key(self, key_tuple: tuple) -> bool:
+        if key_tuple in self._key_tuples:
+            return False
+        key = self._tuple_to_key(key_tuple)
+        self._key_tuples.add(key_tuple)
+        self._keys_by_suite.setdefault(
+            key.expectation_suite_identifier.expectation_suite_name, _SortedKeys()
+        ).add(key)
+        self._all_keys.add(key)
+        return True
+
+    def _ensure_loaded(self) -> None:
+        if self._key_tuples is not None:
+            return
+        if self._store_backend.has_key(self.MANIFEST_KEY):
+            manifest = self._store_backend.get(self.MANIFEST_KEY)
+            if isinstance(manifest, bytes):
+                manifest = manifest.decode("utf-8")
+            self._reset()
+            for line in manifest.splitlines():
+                if line:
+                    self._index_key(tuple(json.loads(line)))
+        else:
+            self.rebuild()
+
+    def _write_manifest(self) -> None:
+        self._store_backend.set(
+            self.MANIFEST_KEY,
+            "".join(
+                json.dumps(list(self._key_to_tuple(key))) + "\n"
+                for key in self._all_keys.keys
+            ),
+        )
+
+    def rebuild(self) -> None:
+        """Indexes the validation results in the store backend by listing its keys, and rewrites the manifest."""
+        with self._lock:
+            self._reset()
+            for key_tuple in self._store_backend.list_keys():
+                if key_tuple in [StoreBackend.STORE_BACKEND_ID_KEY, self.MANIFEST_KEY]:
+                    continue
+                self._index_key(key_tuple)
+            self._write_manifest()
+
+    def add(self, key: ValidationResultIdentifier) -> None:
+        self.add_many([key])
+
+    def add_many(self, keys: List[ValidationResultIdentifier]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            added = [self._index_key(self._key_to_tuple(key)) for key in keys]
+            if any(added):
+                self._write_manifest()
+
+    def list_keys(self) -> List[ValidationResultIdentifier]:
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._all_keys.keys)
+
+    def get_latest_key(
+        self,
+        expectation_suite_name: str,
+        run_id=None,
+        batch_identifier: Optional[str] = None,
+    ) -> Optional[ValidationResultIdentifier]:
+        """Returns the key of the latest validation result of the expectation suite, of the given run and batch if
+        they are given.
+
+        Args:
+            expectation_suite_name: the name of the expectation suite
+            run_id: the RunIdentifier of the run, if given
+            batch_identifier: the identifier of the batch, if given
+
+        Returns:
+            The key of the validation result, or None if there is none
+        """
+        with self._lock:
+            self._ensure_loaded()
+            suite_keys = self._keys_by_suite.get(expectation_suite_name)
+            if suite_keys is None:
+                return None
+            start, end = 0, len(suite_keys.keys)
+            if run_id is not None:
+                start, end = suite_keys.get_run_range(*run_id.to_tuple())
+            for position in range(end - 1, start - 1, -1):
+                key = suite_keys.keys[position]
+                if batch_identifier is None or key.batch_identifier == batch_identifier:
+                    return key
+            return None
+
+    def get_latest_keys(
+        self, limit: int, expectation_suite_name: Optional[str] = None
+    ) -> List[ValidationResultIdentifier]:
+        """Returns the keys of the limit latest validation results, of the expectation suite if one is given, latest
+        first."""
+        with self._lock:
+            self._ensure_loaded()
+            if expectation_suite_name is None:
+                sorted_keys = self._all_keys
+            else:
+                sorted_keys = self._keys_by_suite.get(
+                    expectation_suite_name, _SortedKeys()
+                )
+            return sorted_keys.keys[: -limit - 1 : -1] if limit > 0 else []
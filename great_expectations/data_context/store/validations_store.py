@@ -1,4 +1,5 @@
 import random
+from typing import List, Optional
 
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
@@ -8,12 +9,21 @@ from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.store.store_backend import (
+    InMemoryStoreBackend,
+    StoreBackend,
+)
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.data_context.store.validation_result_index import (
+    ValidationResultIndex,
+    get_validation_result_sort_key,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import load_class
+from great_expectations.exceptions import DataContextError
 from great_expectations.util import verify_dynamic_loading_support
 
 
@@ -84,11 +94,22 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
         bug_risk: Moderate
 
 --ge-feature-maturity-info--
+
+With use_index, the store maintains a ValidationResultIndex of its validation results, by expectation suite and run
+time, in a manifest next to them in its store backend, so that the latest results are found without listing every key
+of the store backend. The index is available for filesystem, S3, GCS and in-memory store backends without a
+filepath_template.
     """
 
     _key_class = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None):
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        use_index: bool = False,
+    ):
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
@@ -131,6 +152,102 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
             store_name=store_name,
         )
 
+        self._index = None
+        if use_index:
+            if not isinstance(
+                self._store_backend, (TupleStoreBackend, InMemoryStoreBackend)
+            ) or getattr(self._store_backend, "filepath_template", None):
+                raise DataContextError(
+                    "ValidationsStore can only use an index with a TupleStoreBackend without a filepath_template or "
+                    "an InMemoryStoreBackend."
+                )
+            self._index = ValidationResultIndex(
+                store_backend=self._store_backend,
+                key_to_tuple=self.key_to_tuple,
+                tuple_to_key=self.tuple_to_key,
+            )
+
+    @property
+    def index(self) -> Optional[ValidationResultIndex]:
+        return self._index
+
+    def set(self, key, value):
+        result = super().set(key, value)
+        if self._index is not None and isinstance(key, ValidationResultIdentifier):
+            self._index.add(key)
+        return result
+
+    def set_many(self, values):
+        result = super().set_many(values)
+        if self._index is not None:
+            self._index.add_many(list(values))
+        return result
+
+    def list_keys(self):
+        if self._index is not None:
+            return self._index.list_keys()
+        return [
+            self.tuple_to_key(key)
+            for key in self._store_backend.list_keys()
+            if key
+            not in [
+                StoreBackend.STORE_BACKEND_ID_KEY,
+                ValidationResultIndex.MANIFEST_KEY,
+            ]
+        ]
+
+    def get_latest_key(
+        self, expectation_suite_name: str, run_id=None, batch_identifier=None,
+    ) -> Optional[ValidationResultIdentifier]:
+        """Returns the key of the latest validation result (by run time) of the expectation suite, of the given run
+        and batch if they are given, or None if there is none.
+
+        Without an index, this lists every key of the store backend.
+        """
+        if run_id is not None:
+            # ValidationResultIdentifier converts run_ids given as strings or dicts
+            run_id = ValidationResultIdentifier(
+                ExpectationSuiteIdentifier(expectation_suite_name), run_id, None
+            ).run_id
+        if self._index is not None:
+            return self._index.get_latest_key(
+                expectation_suite_name, run_id=run_id, batch_identifier=batch_identifier
+            )
+
+        keys = [
+            key
+            for key in self.list_keys()
+            if key.expectation_suite_identifier.expectation_suite_name
+            == expectation_suite_name
+            and (run_id is None or key.run_id == run_id)
+            and (batch_identifier is None or key.batch_identifier == batch_identifier)
+        ]
+        if len(keys) == 0:
+            return None
+        return max(keys, key=get_validation_result_sort_key)
+
+    def get_latest_keys(
+        self, limit: int, expectation_suite_name: Optional[str] = None
+    ) -> List[ValidationResultIdentifier]:
+        """Returns the keys of the limit latest validation results (by run time), of the expectation suite if one is
+        given, latest first.
+
+        Without an index, this lists every key of the store backend.
+        """
+        if self._index is not None:
+            return self._index.get_latest_keys(
+                limit, expectation_suite_name=expectation_suite_name
+            )
+
+        keys = [
+            key
+            for key in self.list_keys()
+            if expectation_suite_name is None
+            or key.expectation_suite_identifier.expectation_suite_name
+            == expectation_suite_name
+        ]
+        return sorted(keys, key=get_validation_result_sort_key, reverse=True)[:limit]
+
     def serialize(self, key, value):
         return self._expectationSuiteValidationResultSchema.dumps(value)
 
@@ -1,5 +1,6 @@
 import random
-from typing import Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
@@ -22,14 +23,39 @@ except ImportError:
 
 
 class ConfiguredAssetSqlDataConnector(DataConnector):
+    """A DataConnector that requires explicit listing of SQL tables it can access as data_assets
+
+    The partitions of each data_asset are listed (by running its splitter query) only when a batch is requested from it,
+    and are cached.
+
+    Args:
+        name (str): The name of this DataConnector
+        datasource_name (str): The name of the Datasource that contains it
+        execution_engine (ExecutionEngine): An ExecutionEngine
+        data_assets (Dict): The configurations of the data_assets (tables) of this DataConnector
+        partition_cache_ttl_seconds (float): If set, the partitions of a data_asset are listed again when they were
+            listed longer than this ago. If None, cached partitions are kept until the cache is refreshed.
+        incremental_partition_refresh (bool): If True, expired partition lists of data_assets split on a single column
+            are refreshed by listing only the partitions of rows whose value in that column is greater than its maximum
+            when the partitions were last listed (its watermark), and adding them to the cached ones. This assumes the
+            tables are only appended to, with increasing values in that column.
+    """
+
     def __init__(
         self,
         name: str,
         datasource_name: str,
         execution_engine: Optional[ExecutionEngine] = None,
         data_assets: Optional[Dict[str, Asset]] = None,
+        partition_cache_ttl_seconds: Optional[float] = None,
+        incremental_partition_refresh: bool = False,
     ):
         self._data_assets = data_assets
+        self._partition_cache_ttl_seconds = partition_cache_ttl_seconds
+        self._incremental_partition_refresh = incremental_partition_refresh
+        # The times at which the partitions of each data_asset were last listed, and the watermarks they were listed at
+        self._partition_cache_timestamps: Dict[str, float] = {}
+        self._partition_watermarks: Dict[str, Any] = {}
 
         super().__init__(
             name=name,
@@ -47,18 +73,24 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         self._data_assets[name] = config
 
     def _get_partition_definition_list_from_data_asset_config(
-        self, data_asset_name, data_asset_config,
+        self, data_asset_name, data_asset_config, watermark=None,
     ):
-        if "table_name" in data_asset_config:
-            table_name = data_asset_config["table_name"]
-        else:
-            table_name = data_asset_name
+        """List the partitions of a data_asset, or, given a watermark, only those of the rows whose value in its
+        watermark column is greater than it."""
+        table_name = self._get_table_name_from_data_asset_config(
+            data_asset_name, data_asset_config
+        )
 
         if "splitter_method" in data_asset_config:
             splitter_fn = getattr(self, data_asset_config["splitter_method"])
             split_query = splitter_fn(
                 table_name=table_name, **data_asset_config["splitter_kwargs"]
             )
+            if watermark is not None:
+                split_query = split_query.where(
+                    sa.column(self._get_watermark_column_name(data_asset_config))
+                    > watermark
+                )
 
             rows = self._execution_engine.engine.execute(split_query).fetchall()
 
@@ -73,18 +105,92 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
 
         return partition_definition_list
 
+    @staticmethod
+    def _get_table_name_from_data_asset_config(
+        data_asset_name, data_asset_config
+    ) -> str:
+        if "table_name" in data_asset_config:
+            return data_asset_config["table_name"]
+        return data_asset_name
+
+    @staticmethod
+    def _get_watermark_column_name(data_asset_config) -> Optional[str]:
+        """The column whose maximum is the watermark of a data_asset split on a single column"""
+        if "splitter_method" not in data_asset_config:
+            return None
+        return (data_asset_config.get("splitter_kwargs") or {}).get("column_name")
+
+    def _get_partition_watermark(self, data_asset_name, data_asset_config):
+        table_name = self._get_table_name_from_data_asset_config(
+            data_asset_name, data_asset_config
+        )
+        watermark_query = sa.select(
+            [sa.func.max(sa.column(self._get_watermark_column_name(data_asset_config)))]
+        ).select_from(sa.text(table_name))
+        return self._execution_engine.engine.execute(watermark_query).scalar()
+
     def _refresh_data_references_cache(self):
+        # Partitions are listed lazily, when a batch is requested from a data_asset
         self._data_references_cache = {}
+        self._partition_cache_timestamps = {}
+        self._partition_watermarks = {}
+
+    def _is_partition_cache_expired(self, data_asset_name: str) -> bool:
+        if data_asset_name not in self._data_references_cache:
+            return True
+        if self._partition_cache_ttl_seconds is None:
+            return False
+        return (
+            time.time() - self._partition_cache_timestamps[data_asset_name]
+            > self._partition_cache_ttl_seconds
+        )
 
-        for data_asset_name in self.data_assets:
-            data_asset = self.data_assets[data_asset_name]
+    def _refresh_data_asset_partition_cache(self, data_asset_name: str):
+        data_asset = self.data_assets[data_asset_name]
+        cached_partition_definition_list = self._data_references_cache.get(
+            data_asset_name
+        )
+        timestamp = time.time()
+
+        if (
+            not self._incremental_partition_refresh
+            or self._get_watermark_column_name(data_asset) is None
+        ):
             partition_definition_list = self._get_partition_definition_list_from_data_asset_config(
                 data_asset_name, data_asset,
             )
-
-            # TODO Abe 20201029 : Apply sorters to partition_definition_list here
-            # TODO Will 20201102 : add sorting code here
-            self._data_references_cache[data_asset_name] = partition_definition_list
+        else:
+            # The watermark is read before the partitions are listed, so that partitions of rows added in between are
+            # listed again at the next refresh rather than missed
+            watermark = self._get_partition_watermark(data_asset_name, data_asset)
+            previous_watermark = self._partition_watermarks.get(data_asset_name)
+            if cached_partition_definition_list is None or previous_watermark is None:
+                partition_definition_list = self._get_partition_definition_list_from_data_asset_config(
+                    data_asset_name, data_asset,
+                )
+            else:
+                partition_definition_list = list(cached_partition_definition_list)
+                cached_partitions = {
+                    tuple(sorted(partition_definition.items()))
+                    for partition_definition in partition_definition_list
+                }
+                for (
+                    partition_definition
+                ) in self._get_partition_definition_list_from_data_asset_config(
+                    data_asset_name, data_asset, watermark=previous_watermark,
+                ):
+                    if (
+                        tuple(sorted(partition_definition.items()))
+                        not in cached_partitions
+                    ):
+                        partition_definition_list.append(partition_definition)
+            if watermark is not None:
+                self._partition_watermarks[data_asset_name] = watermark
+
+        # TODO Abe 20201029 : Apply sorters to partition_definition_list here
+        # TODO Will 20201102 : add sorting code here
+        self._data_references_cache[data_asset_name] = partition_definition_list
+        self._partition_cache_timestamps[data_asset_name] = timestamp
 
     def _get_column_names_from_splitter_kwargs(self, splitter_kwargs) -> List[str]:
         column_names: List[str] = []
@@ -109,13 +215,12 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
     def get_batch_definition_list_from_batch_request(self, batch_request):
         self._validate_batch_request(batch_request=batch_request)
 
-        if self._data_references_cache is None:
-            self._refresh_data_references_cache()
-
         batch_definition_list = []
 
         try:
-            sub_cache = self._data_references_cache[batch_request.data_asset_name]
+            sub_cache = self._get_data_reference_list_from_cache_by_data_asset_name(
+                batch_request.data_asset_name
+            )
         except KeyError as e:
             raise KeyError(
                 f"data_asset_name {batch_request.data_asset_name} is not recognized."
@@ -136,6 +241,12 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
     def _get_data_reference_list_from_cache_by_data_asset_name(
         self, data_asset_name: str
     ) -> List[str]:
+        if self._data_references_cache is None:
+            self._refresh_data_references_cache()
+        if data_asset_name not in self.data_assets:
+            raise KeyError(data_asset_name)
+        if self._is_partition_cache_expired(data_asset_name):
+            self._refresh_data_asset_partition_cache(data_asset_name)
         return self._data_references_cache[data_asset_name]
 
     def _map_data_reference_to_batch_definition_list(
@@ -6,7 +6,7 @@ from great_expectations.execution_engine import ExecutionEngine
 
 try:
     import sqlalchemy as sa
-    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.exc import SQLAlchemyError
 except ImportError:
     sa = None
 
@@ -14,6 +14,9 @@ except ImportError:
 class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
     """A DataConnector that infers data_asset names by introspecting a SQL database
 
+    Introspection only reads the database's metadata: data_assets are listed from the reflected tables and views (and,
+    given a splitter_method, their columns), and their partitions are only listed when a batch is requested from them.
+
     Args:
         name (str): The name of this DataConnector
         datasource_name (str): The name of the Datasource that contains it
@@ -28,9 +31,13 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         excluded_tables (List): A list of tables to ignore when inferring data asset_names
         included_tables (List): If not None, only include tables in this list when inferring data asset_names
         skip_inapplicable_tables (bool):
-            If True, tables that can't be successfully queried using sampling and splitter methods are excluded from inferred data_asset_names.
+            If True, tables lacking the columns named in splitter_kwargs are excluded from inferred data_asset_names.
             If False, the class will throw an error during initialization if any such tables are encountered.
         introspection_directives (Dict): Arguments passed to the introspection method to guide introspection
+        partition_cache_ttl_seconds (float): If set, the partitions of a data_asset are listed again when they were
+            listed longer than this ago
+        incremental_partition_refresh (bool): If True, expired partition lists are refreshed from the watermark of the
+            column their data_asset is split on (see ConfiguredAssetSqlDataConnector)
     """
 
     def __init__(
@@ -49,6 +56,8 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         included_tables: List = None,
         skip_inapplicable_tables: bool = True,
         introspection_directives: Dict = None,
+        partition_cache_ttl_seconds: Optional[float] = None,
+        incremental_partition_refresh: bool = False,
     ):
         self._data_asset_name_prefix = data_asset_name_prefix
         self._data_asset_name_suffix = data_asset_name_suffix
@@ -68,6 +77,8 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             datasource_name=datasource_name,
             execution_engine=execution_engine,
             data_assets=None,
+            partition_cache_ttl_seconds=partition_cache_ttl_seconds,
+            incremental_partition_refresh=incremental_partition_refresh,
         )
 
         # This cache will contain a "config" for each data_asset discovered via introspection.
@@ -123,6 +134,11 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         introspected_table_metadata = self._introspect_db(
             **self._introspection_directives
         )
+        splitter_column_names = self._get_column_names_from_splitter_kwargs(
+            splitter_kwargs or {}
+        )
+        inspector = sa.inspect(self._execution_engine.engine)
+        introspected_data_assets = {}
         for metadata in introspected_table_metadata:
             if (excluded_tables is not None) and (
                 metadata["schema_name"] + "." + metadata["table_name"]
@@ -163,25 +179,37 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if not sampling_kwargs is None:
                 data_asset_config["sampling_kwargs"] = sampling_kwargs
 
-            # Attempt to fetch a list of partition_definitions from the table
-            try:
-                self._get_partition_definition_list_from_data_asset_config(
-                    data_asset_name, data_asset_config,
+            # Check that the table has the columns it would be split on, from its metadata rather than by listing
+            # its partitions, which would scan every table
+            if splitter_method is not None and splitter_column_names:
+                try:
+                    table_column_names = {
+                        column["name"]
+                        for column in inspector.get_columns(
+                            metadata["table_name"], schema=metadata["schema_name"]
+                        )
+                    }
+                except SQLAlchemyError:
+                    table_column_names = set()
+                missing_column_names = set(splitter_column_names).difference(
+                    table_column_names
                 )
-            except OperationalError as e:
-                # If it doesn't work, then...
-                if skip_inapplicable_tables:
-                    # No harm done. Just don't include this table in the list of data_assets.
-                    continue
+                if missing_column_names:
+                    # If it doesn't work, then...
+                    if skip_inapplicable_tables:
+                        # No harm done. Just don't include this table in the list of data_assets.
+                        continue
 
-                else:
-                    # We're being strict. Crash now.
-                    raise ValueError(
-                        f"Couldn't execute a query against table {metadata['table_name']} in schema {metadata['schema_name']}"
-                    ) from e
+                    else:
+                        # We're being strict. Crash now.
+                        raise ValueError(
+                            f"Couldn't split table {metadata['table_name']} in schema {metadata['schema_name']} using {splitter_method}: it has no column(s) {sorted(missing_column_names)}"
+                        )
 
             # Store an asset config for each introspected data asset.
-            self._introspected_data_assets_cache[data_asset_name] = data_asset_config
+            introspected_data_assets[data_asset_name] = data_asset_config
+
+        self._introspected_data_assets_cache = introspected_data_assets
 
     def _introspect_db(
         self,
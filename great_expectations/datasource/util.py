@@ -1,4 +1,5 @@
 import hashlib
+import io
 import logging
 import pickle
 from urllib.parse import urlparse
@@ -67,6 +68,70 @@ class S3Url(object):
         return self._parsed.geturl()
 
 
+class S3ObjectReader(io.RawIOBase):
+    """A read-only, seekable file object over an S3 object. Bytes are fetched on demand with ranged GET requests, so
+    that readers which seek (such as pyarrow reading a parquet footer and then only the column chunks it needs)
+    download only the parts of the object they read.
+
+    Wrap in an io.BufferedReader to avoid issuing a request for every small read.
+    """
+
+    def __init__(self, s3_client, bucket: str, key: str, size: int = None):
+        """
+        Args:
+            s3_client: a boto3 S3 client
+            bucket: the bucket of the object
+            key: the key of the object
+            size: the size of the object in bytes; looked up with a HEAD request if not given
+        """
+        super().__init__()
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        if size is None:
+            size = s3_client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self._size = size
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer):
+        if self._position >= self._size or len(buffer) == 0:
+            return 0
+        end = min(self._position + len(buffer), self._size) - 1
+        data = self._s3_client.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={self._position}-{end}"
+        )["Body"].read()
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
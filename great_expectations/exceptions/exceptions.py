@@ -314,6 +314,10 @@ class ExecutionEngineError(DataContextError):
         super().__init__(self.message)
 
 
+class QueryTimeoutError(ExecutionEngineError):
+    pass
+
+
 class PartitionQueryError(DataContextError):
     def __init__(self, message):
         self.message = message
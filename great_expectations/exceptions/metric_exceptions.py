@@ -8,3 +8,9 @@ class MetricError(GreatExpectationsError):
 
 class MetricProviderError(MetricError):
     pass
+
+
+class MetricResolutionError(MetricError):
+    def __init__(self, message, failed_metrics):
+        super().__init__(message)
+        self.failed_metrics = failed_metrics
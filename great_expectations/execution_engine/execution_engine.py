@@ -1,16 +1,25 @@
+import concurrent.futures
 import copy
 import logging
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ruamel.yaml import YAML
 
-from great_expectations.core.batch import Batch, BatchSpec
+from great_expectations.core.batch import Batch, BatchMarkers, BatchSpec
+from great_expectations.core.id_dict import IDDict
 from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.exceptions.metric_exceptions import MetricResolutionError
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    MetricCache,
+    MetricCacheKey,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
+    load_class,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -19,14 +28,6 @@ yaml = YAML()
 yaml.default_flow_style = False
 
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-
 class ExecutionEngine:
     recognized_batch_spec_defaults = set()
 
@@ -37,6 +38,7 @@ class ExecutionEngine:
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache=None,
     ):
         self.name = name
         self._validator = validator
@@ -44,11 +46,17 @@ class ExecutionEngine:
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache = {}
+        # Metric values are cached by batch fingerprint, so only batches loaded with a fingerprint (see
+        # load_batch_data) can benefit from the cache.
+        if not self._caching:
+            self._metric_cache = None
+        elif metric_cache is None:
+            self._metric_cache = InMemoryMetricCache()
+        elif isinstance(metric_cache, MetricCache):
+            self._metric_cache = metric_cache
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = self._build_metric_cache(metric_cache)
+        self._batch_fingerprints = {}
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -80,6 +88,20 @@ class ExecutionEngine:
             properties=self._config, inplace=True,
         )
 
+    @staticmethod
+    def _build_metric_cache(metric_cache_config: dict) -> MetricCache:
+        metric_cache_config = copy.deepcopy(metric_cache_config)
+        class_name = metric_cache_config.pop("class_name")
+        module_name = metric_cache_config.pop(
+            "module_name", "great_expectations.execution_engine.metric_cache"
+        )
+        metric_cache_class = load_class(class_name=class_name, module_name=module_name)
+        return metric_cache_class(**metric_cache_config)
+
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        return self._metric_cache
+
     def configure_validator(self, validator):
         """Optionally configure the validator as appropriate for the execution engine."""
         pass
@@ -99,6 +121,10 @@ class ExecutionEngine:
         else:
             return None
 
+    @active_batch_data_id.setter
+    def active_batch_data_id(self, batch_id):
+        self._active_batch_data_id = batch_id
+
     @property
     def active_batch_data(self):
         """The data from the currently-active batch.
@@ -130,12 +156,52 @@ class ExecutionEngine:
         batch_data, _ = self.get_batch_data_and_markers(batch_spec)
         return batch_data
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def load_batch_data(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> None:
         """
-        Loads the specified batch_data into the execution engine
+        Loads the specified batch_data into the execution engine. If batch_markers include a fingerprint of the data,
+        metrics computed on the batch are cached under that fingerprint.
         """
         self._batch_data_dict[batch_id] = self._get_typed_batch_data(batch_data)
         self._active_batch_data_id = batch_id
+        batch_fingerprint = None
+        if batch_markers is not None:
+            batch_fingerprint = self._get_batch_fingerprint_from_markers(batch_markers)
+        if batch_fingerprint is None:
+            self._batch_fingerprints.pop(batch_id, None)
+        else:
+            self._batch_fingerprints[batch_id] = batch_fingerprint
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        """Removes the specified batch_data from the execution engine."""
+        self._batch_data_dict.pop(batch_id, None)
+        self._batch_fingerprints.pop(batch_id, None)
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+    def get_sample_batch_data(
+        self,
+        batch_data: Any,
+        batch_spec: Optional[BatchSpec],
+        p: float,
+        seed: Optional[int] = None,
+    ) -> Any:
+        """Returns a random sample of about proportion p of the rows of batch_data (loaded from batch_spec, when it is
+        known), such as approximate validation validates (see Validator.validate).
+
+        Raises NotImplementedError if the engine cannot sample the batch.
+        """
+        raise NotImplementedError
+
+    def _get_batch_fingerprint_from_markers(
+        self, batch_markers: BatchMarkers
+    ) -> Optional[str]:
+        fingerprint = batch_markers.get("pandas_data_fingerprint")
+        if fingerprint is None:
+            return None
+        # The same data may yield different (e.g. differently typed) metric values on different engines
+        return f"{self.__class__.__name__}:{fingerprint}"
 
     def _load_batch_data_from_dict(self, batch_data_dict):
         """
@@ -154,6 +220,7 @@ class ExecutionEngine:
         metrics_to_resolve: Iterable[MetricConfiguration],
         metrics: Dict[Tuple, Any] = None,
         runtime_configuration: dict = None,
+        max_workers: Optional[int] = None,
     ) -> dict:
         """resolve_metrics is the main entrypoint for an execution engine. The execution engine will compute the value
         of the provided metrics.
@@ -162,16 +229,23 @@ class ExecutionEngine:
             metrics_to_resolve: the metrics to evaluate
             metrics: already-computed metrics currently available to the engine
             runtime_configuration: runtime configuration information
+            max_workers: if greater than 1, independent metric functions and per-domain metric bundles are dispatched
+                concurrently on a thread pool of this size. Results are identical to serial resolution; a failure is
+                raised as a MetricResolutionError naming the metric(s) that caused it.
 
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """
         if metrics is None:
             metrics = dict()
-        resolved_metrics = dict()
+        metrics_to_resolve = list(metrics_to_resolve)
+        resolved_metrics = self.get_cached_metrics(metrics_to_resolve)
 
+        metric_fn_calls = []
         metric_fn_bundle = []
         for metric_to_resolve in metrics_to_resolve:
+            if metric_to_resolve.id in resolved_metrics:
+                continue
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
             )
@@ -214,7 +288,7 @@ class ExecutionEngine:
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
             )
-            if metric_fn_type in [
+            if metric_fn_type not in [
                 MetricPartialFunctionTypes.MAP_SERIES,
                 MetricPartialFunctionTypes.MAP_FN,
                 MetricPartialFunctionTypes.MAP_CONDITION_FN,
@@ -222,28 +296,202 @@ class ExecutionEngine:
                 MetricPartialFunctionTypes.WINDOW_FN,
                 MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
                 MetricPartialFunctionTypes.AGGREGATE_FN,
+                MetricFunctionTypes.VALUE,
             ]:
-                # NOTE: 20201026 - JPC - we could use the fact that these metric functions return functions rather
-                # than data to optimize compute in the future
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            elif metric_fn_type == MetricFunctionTypes.VALUE:
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            else:
                 logger.warning(
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
                 )
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
+            # NOTE: 20201026 - JPC - we could use the fact that partial metric functions return functions rather
+            # than data to optimize compute in the future
+            metric_fn_calls.append(
+                (metric_to_resolve, metric_fn, metric_provider_kwargs)
+            )
+
+        if (
+            max_workers is not None
+            and max_workers > 1
+            and self.supports_concurrent_metric_resolution
+        ):
+            newly_resolved_metrics = self._resolve_metrics_concurrently(
+                metric_fn_calls=metric_fn_calls,
+                metric_fn_bundle=metric_fn_bundle,
+                max_workers=max_workers,
+            )
+        else:
+            newly_resolved_metrics = dict()
+            for (
+                metric_to_resolve,
+                metric_fn,
+                metric_provider_kwargs,
+            ) in metric_fn_calls:
+                newly_resolved_metrics[metric_to_resolve.id] = self.resolve_metric_fn(
+                    metric_to_resolve, metric_fn, metric_provider_kwargs
+                )
+            if len(metric_fn_bundle) > 0:
+                newly_resolved_metrics.update(
+                    self.resolve_metric_bundle(metric_fn_bundle)
                 )
-        if len(metric_fn_bundle) > 0:
-            resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
 
+        self._cache_metrics(metrics_to_resolve, newly_resolved_metrics)
+        resolved_metrics.update(newly_resolved_metrics)
         return resolved_metrics
 
+    def resolve_metric_fn(
+        self,
+        metric_to_resolve: MetricConfiguration,
+        metric_fn: Callable,
+        metric_provider_kwargs: dict,
+    ) -> Any:
+        """Computes a metric that is not bundled, by calling its metric function with the metric provider kwargs."""
+        return metric_fn(**metric_provider_kwargs)
+
+    def _get_metric_cache_key(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[MetricCacheKey]:
+        """The key under which the metric is cached, or None if the metric is not cacheable.
+
+        Only metrics that produce values (rather than partial functions, which reference engine-specific objects) and
+        that are computed on a fingerprinted batch are cacheable.
+        """
+        if self._metric_cache is None or len(self._batch_fingerprints) == 0:
+            return None
+        batch_id = metric_configuration.metric_domain_kwargs.get("batch_id")
+        if batch_id is None:
+            batch_id = self.active_batch_data_id
+        batch_fingerprint = self._batch_fingerprints.get(batch_id)
+        if batch_fingerprint is None:
+            return None
+        _, metric_fn = get_metric_provider(
+            metric_name=metric_configuration.metric_name, execution_engine=self
+        )
+        if metric_fn is not None and (
+            getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+            != MetricFunctionTypes.VALUE
+        ):
+            return None
+        return batch_fingerprint, metric_configuration.id
+
+    def get_cached_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple, Any]:
+        """Look up the given metrics in the metric cache.
+
+        Returns:
+            A dictionary of metric ids to values, for those metrics whose values are cached.
+        """
+        cache_keys = dict()
+        for metric_configuration in metric_configurations:
+            cache_key = self._get_metric_cache_key(metric_configuration)
+            if cache_key is not None:
+                cache_keys[cache_key] = metric_configuration.id
+        if len(cache_keys) == 0:
+            return dict()
+        cached_values = self._metric_cache.get_many(cache_keys.keys())
+        logger.debug(
+            f"Found {len(cached_values)} of {len(cache_keys)} cacheable metrics in the metric cache"
+        )
+        return {
+            cache_keys[cache_key]: value for cache_key, value in cached_values.items()
+        }
+
+    def _cache_metrics(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        resolved_metrics: Dict[Tuple, Any],
+    ) -> None:
+        values = dict()
+        for metric_configuration in metric_configurations:
+            if metric_configuration.id not in resolved_metrics:
+                continue
+            cache_key = self._get_metric_cache_key(metric_configuration)
+            if cache_key is not None:
+                values[cache_key] = resolved_metrics[metric_configuration.id]
+        if len(values) > 0:
+            self._metric_cache.set_many(values)
+
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Whether metric functions and metric bundles may be evaluated from multiple threads at once."""
+        return True
+
+    def _resolve_metrics_concurrently(
+        self,
+        metric_fn_calls: List[Tuple[MetricConfiguration, Callable, dict]],
+        metric_fn_bundle: List[Tuple],
+        max_workers: int,
+    ) -> dict:
+        """Dispatch each metric function, and the bundled metrics of each compute domain, as an independent task on a
+        thread pool.
+
+        All tasks are allowed to finish; results are then merged in submission order so that the outcome does not
+        depend on thread scheduling. If any task failed, the first failure (in submission order) is raised as a
+        MetricResolutionError carrying the ids of the metrics computed by that task.
+        """
+        tasks = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for metric_to_resolve, metric_fn, metric_provider_kwargs in metric_fn_calls:
+                tasks.append(
+                    (
+                        [metric_to_resolve.id],
+                        False,
+                        executor.submit(
+                            self.resolve_metric_fn,
+                            metric_to_resolve,
+                            metric_fn,
+                            metric_provider_kwargs,
+                        ),
+                    )
+                )
+            for domain_bundle in self._partition_metric_fn_bundle(metric_fn_bundle):
+                tasks.append(
+                    (
+                        [bundled_metric[0].id for bundled_metric in domain_bundle],
+                        True,
+                        executor.submit(self.resolve_metric_bundle, domain_bundle),
+                    )
+                )
+
+        resolved_metrics = dict()
+        for metric_ids, is_bundle, future in tasks:
+            exception = future.exception()
+            if exception is not None:
+                raise MetricResolutionError(
+                    message=f"Unable to resolve metric(s) {str(metric_ids)}: {str(exception)}",
+                    failed_metrics=metric_ids,
+                ) from exception
+            if is_bundle:
+                resolved_metrics.update(future.result())
+            else:
+                resolved_metrics[metric_ids[0]] = future.result()
+        return resolved_metrics
+
+    def retain_metric_domains(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Called before the given metrics are resolved, so that the execution engine may keep data shared by several
+        of them (for example, a filtered compute domain) available until they have all been resolved. Every call must be
+        balanced by a call to release_metric_domains for the same metrics."""
+        pass
+
+    def release_metric_domains(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Called once the given (previously retained) metrics have been resolved, or will no longer be resolved."""
+        pass
+
+    def _partition_metric_fn_bundle(self, metric_fn_bundle: list) -> List[list]:
+        """Split a metric bundle into parts that can each be resolved independently by resolve_metric_bundle. By
+        default, metrics are partitioned by compute domain."""
+        bundles_by_domain: Dict[Tuple, list] = dict()
+        for bundled_metric in metric_fn_bundle:
+            compute_domain_kwargs = bundled_metric[2]
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            bundles_by_domain.setdefault(compute_domain_kwargs.to_id(), []).append(
+                bundled_metric
+            )
+        return list(bundles_by_domain.values())
+
     def resolve_metric_bundle(self, metric_fn_bundle):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
@@ -0,0 +1,242 @@
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A metric cache key is the fingerprint of the batch a metric was computed on, and the MetricConfiguration.id
+MetricCacheKey = Tuple[str, Tuple[str, str, str]]
+
+
+class MetricCache(metaclass=ABCMeta):
+    """A MetricCache holds resolved metric values keyed by the fingerprint of the batch they were computed on and the
+    id of the MetricConfiguration, so that metrics need not be recomputed for data that has not changed.
+
+    Entries are evicted least-recently-used first once max_entries is exceeded, and are ignored (and dropped) once
+    they are older than ttl_seconds.
+
+    In general a MetricCache implementation must provide implementations of:
+      - get_many
+      - set_many
+      - clear
+      - __len__
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None
+    ):
+        """
+        Args:
+            max_entries: the maximum number of metric values to keep; None for no limit
+            ttl_seconds: the number of seconds after which a cached metric value expires; None for no expiry
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self._ttl_seconds is not None and now - stored_at > self._ttl_seconds
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[MetricCacheKey]) -> Dict[MetricCacheKey, Any]:
+        """Return the cached values for whichever of the given keys are present and have not expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_many(self, values: Dict[MetricCacheKey, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self):
+        raise NotImplementedError
+
+
+class InMemoryMetricCache(MetricCache):
+    """A MetricCache that lives as long as the execution engine that owns it."""
+
+    def __init__(
+        self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._entries: "OrderedDict[MetricCacheKey, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[MetricCacheKey]) -> Dict[MetricCacheKey, Any]:
+        now = time.time()
+        hits = dict()
+        with self._lock:
+            for key in keys:
+                if key not in self._entries:
+                    continue
+                value, stored_at = self._entries[key]
+                if self._is_expired(stored_at, now):
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                hits[key] = value
+        return hits
+
+    def set_many(self, values: Dict[MetricCacheKey, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (value, now)
+                self._entries.move_to_end(key)
+            if self._max_entries is not None:
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SqliteMetricCache(MetricCache):
+    """A MetricCache persisted to a SQLite database on local disk, so that metric values can be shared across
+    validation runs and processes (for example, when a checkpoint is re-run on unchanged data).
+
+    Metric values are stored pickled; only point this cache at a file that is not writable by untrusted parties.
+    Values that cannot be pickled are not cached.
+    """
+
+    TABLE_NAME = "ge_metric_cache"
+    # Maximum number of keys in a single "IN" clause (SQLite limits the number of bound parameters per statement)
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            path: the path of the SQLite database file; it is created if it does not exist
+            max_entries: the maximum number of metric values to keep; None for no limit
+            ttl_seconds: the number of seconds after which a cached metric value expires; None for no expiry
+        """
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE_NAME}_accessed_at ON {self.TABLE_NAME} (accessed_at)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection for a single transaction, which is committed on success and rolled back on error."""
+        connection = sqlite3.connect(self._path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _serialize_key(key: MetricCacheKey) -> str:
+        batch_fingerprint, metric_id = key
+        return json.dumps([batch_fingerprint, list(metric_id)])
+
+    def get_many(self, keys: Iterable[MetricCacheKey]) -> Dict[MetricCacheKey, Any]:
+        keys_by_serialized_key = {self._serialize_key(key): key for key in keys}
+        serialized_keys = list(keys_by_serialized_key.keys())
+        now = time.time()
+        hits = dict()
+        expired = []
+        with self._lock, self._connect() as connection:
+            for start in range(0, len(serialized_keys), self.QUERY_CHUNK_SIZE):
+                chunk = serialized_keys[start : start + self.QUERY_CHUNK_SIZE]
+                rows = connection.execute(
+                    f"SELECT key, value, stored_at FROM {self.TABLE_NAME} "
+                    f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for serialized_key, value, stored_at in rows:
+                    if self._is_expired(stored_at, now):
+                        expired.append((serialized_key,))
+                        continue
+                    try:
+                        hits[keys_by_serialized_key[serialized_key]] = pickle.loads(
+                            value
+                        )
+                    except Exception as e:
+                        logger.debug(
+                            f"Unable to load cached metric {serialized_key}: {str(e)}"
+                        )
+                        expired.append((serialized_key,))
+            if len(expired) > 0:
+                connection.executemany(
+                    f"DELETE FROM {self.TABLE_NAME} WHERE key = ?", expired
+                )
+            if len(hits) > 0:
+                connection.executemany(
+                    f"UPDATE {self.TABLE_NAME} SET accessed_at = ? WHERE key = ?",
+                    [(now, self._serialize_key(key)) for key in hits.keys()],
+                )
+        return hits
+
+    def set_many(self, values: Dict[MetricCacheKey, Any]) -> None:
+        now = time.time()
+        rows = []
+        for key, value in values.items():
+            try:
+                rows.append((self._serialize_key(key), pickle.dumps(value), now, now))
+            except Exception as e:
+                logger.debug(f"Unable to cache metric {str(key)}: {str(e)}")
+        if len(rows) == 0:
+            return
+        with self._lock, self._connect() as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self.TABLE_NAME} (key, value, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            if self._max_entries is not None:
+                connection.execute(
+                    f"DELETE FROM {self.TABLE_NAME} WHERE key IN ("
+                    f"SELECT key FROM {self.TABLE_NAME} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self._max_entries,),
+                )
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as connection:
+            connection.execute(f"DELETE FROM {self.TABLE_NAME}")
+
+    def __len__(self):
+        with self._lock, self._connect() as connection:
+            return connection.execute(
+                f"SELECT COUNT(*) FROM {self.TABLE_NAME}"
+            ).fetchone()[0]
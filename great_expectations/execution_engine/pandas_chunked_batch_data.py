@@ -0,0 +1,463 @@
+import logging
+import math
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.hyperloglog import HyperLogLog
+from great_expectations.core.quantile_sketch import (
+    QuantileSketch,
+    get_quantile_sketch_relative_error,
+)
+from great_expectations.core.space_saving import (
+    SPACE_SAVING_CAPACITY_FACTOR,
+    SpaceSavingSketch,
+)
+from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+
+class PandasChunkedBatchData:
+    """Batch data that is read from its source one chunk (a pandas DataFrame) at a time, so that batches larger than
+    memory can be validated. Every pass over the batch reads it again from the source.
+
+    Metrics are computed on a PandasChunkedBatchData by merging partial states computed on each chunk (see
+    MetricPartialState), so only metrics with a partial state, and metrics derived from them, are supported.
+    """
+
+    def __init__(
+        self,
+        chunk_reader: Callable[[], Iterator[pd.DataFrame]],
+        chunk_transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ):
+        """
+        Args:
+            chunk_reader: a callable returning a new iterator over the chunks of the batch each time it is called
+            chunk_transform: an optional callable applied to each chunk (for example, a row-wise splitter or sampler)
+        """
+        self._chunk_reader = chunk_reader
+        self._chunk_transform = chunk_transform
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        for chunk in self._chunk_reader():
+            if self._chunk_transform is not None:
+                chunk = self._chunk_transform(chunk)
+            yield chunk
+
+
+class DeferredChunkedMetric:
+    """Stands in for the value of a partial metric (such as a map condition) on chunked batch data. Partial metrics are
+    evaluated on each chunk by the metrics that depend on them."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        self._metric_configuration = metric_configuration
+
+    @property
+    def metric_configuration(self) -> MetricConfiguration:
+        return self._metric_configuration
+
+
+class PandasChunkMetricEvaluator:
+    """Evaluates metrics on the chunk currently being processed, on behalf of MetricPartialState objects."""
+
+    def __init__(
+        self,
+        evaluate_metric: Callable[[MetricConfiguration], Any],
+        get_column_values: Callable[[dict], pd.Series],
+    ):
+        """
+        Args:
+            evaluate_metric: a callable computing the value of a metric on the chunk
+            get_column_values: a callable returning the non-null values of the column domain described by the given
+                metric_domain_kwargs within the chunk
+        """
+        self._evaluate_metric = evaluate_metric
+        self._get_column_values = get_column_values
+
+    def evaluate_metric(self, metric_configuration: MetricConfiguration) -> Any:
+        return self._evaluate_metric(metric_configuration)
+
+    def get_column_values(self, metric_domain_kwargs: dict) -> pd.Series:
+        return self._get_column_values(metric_domain_kwargs)
+
+
+class MetricPartialState(metaclass=ABCMeta):
+    """The mergeable state of a metric computed over some of the chunks of a batch.
+
+    In general a MetricPartialState implementation must provide implementations of:
+      - compute_chunk_state, which computes the state of the metric on a single chunk
+      - merge, which folds the state of a chunk into this state
+      - get_value, which returns the value of the metric over all merged chunks
+    """
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        self._metric_configuration = metric_configuration
+
+    @property
+    def metric_configuration(self) -> MetricConfiguration:
+        return self._metric_configuration
+
+    def update(self, evaluator: PandasChunkMetricEvaluator) -> None:
+        self.merge(self.compute_chunk_state(evaluator))
+
+    @abstractmethod
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def merge(self, chunk_state: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_value(self) -> Any:
+        raise NotImplementedError
+
+
+class SumPartialState(MetricPartialState):
+    """For metrics that are sums over rows, such as row counts and unexpected counts."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._sum = 0
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        return evaluator.evaluate_metric(self.metric_configuration)
+
+    def merge(self, chunk_state: Any) -> None:
+        self._sum += chunk_state
+
+    def get_value(self) -> Any:
+        return self._sum
+
+
+class ExtremumPartialState(MetricPartialState):
+    def __init__(
+        self,
+        metric_configuration: MetricConfiguration,
+        reducer: Callable[[Any, Any], Any],
+    ):
+        super().__init__(metric_configuration)
+        self._reducer = reducer
+        self._value = None
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        return evaluator.evaluate_metric(self.metric_configuration)
+
+    def merge(self, chunk_state: Any) -> None:
+        # Chunks without non-null values in the column have no extremum
+        if chunk_state is None or pd.isnull(chunk_state):
+            return
+        if self._value is None:
+            self._value = chunk_state
+        else:
+            self._value = self._reducer(self._value, chunk_state)
+
+    def get_value(self) -> Any:
+        if self._value is None:
+            return np.nan
+        return self._value
+
+
+class MomentsPartialState(MetricPartialState):
+    """Tracks the count, mean and sum of squared deviations of the non-null values of a column, merged across chunks
+    with the parallel form of Welford's algorithm, to compute a mean or (sample) standard deviation."""
+
+    def __init__(self, metric_configuration: MetricConfiguration, statistic: str):
+        super().__init__(metric_configuration)
+        if statistic not in ["mean", "standard_deviation"]:
+            raise ValueError("statistic must be either 'mean' or 'standard_deviation'")
+        self._statistic = statistic
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        values = evaluator.get_column_values(
+            self.metric_configuration.metric_domain_kwargs
+        )
+        count = len(values)
+        if count == 0:
+            return 0, 0.0, 0.0
+        mean = values.mean()
+        return count, mean, float(((values - mean) ** 2).sum())
+
+    def merge(self, chunk_state: Any) -> None:
+        count, mean, m2 = chunk_state
+        if count == 0:
+            return
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta ** 2 * self._count * count / total
+        self._count = total
+
+    def get_value(self) -> Any:
+        if self._statistic == "mean":
+            return self._mean if self._count > 0 else np.nan
+        if self._count < 2:
+            return np.nan
+        return math.sqrt(self._m2 / (self._count - 1))
+
+
+class ValueCountsPartialState(MetricPartialState):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._counts = pd.Series([], dtype="int64")
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        # Chunks are counted unsorted, so that the values keep their types until they are sorted once, in get_value
+        return evaluator.get_column_values(
+            self.metric_configuration.metric_domain_kwargs
+        ).value_counts(sort=False)
+
+    def merge(self, chunk_state: Any) -> None:
+        # Grouping by value does not compare values of different types, unlike aligning the indexes of the counts
+        self._counts = (
+            pd.concat([self._counts, chunk_state]).groupby(level=0, sort=False).sum()
+        )
+
+    def get_value(self) -> Any:
+        counts = self._counts.astype("int64")
+        sort = self.metric_configuration.metric_value_kwargs.get("sort", "value")
+        if sort == "value":
+            try:
+                counts = counts.sort_index()
+            except TypeError:
+                # Values of multiple types in an object column cannot be compared, so they are ordered by their
+                # string representations, keeping the values themselves
+                counts = counts.iloc[
+                    np.argsort(counts.index.astype(str), kind="mergesort")
+                ]
+        elif sort == "counts":
+            counts = counts.sort_values()
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+
+class HistogramPartialState(MetricPartialState):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        bins = metric_configuration.metric_value_kwargs.get("bins")
+        if not isinstance(bins, (list, tuple, np.ndarray)):
+            raise GreatExpectationsError(
+                "column.histogram can only be computed on chunked batch data with explicit bin edges"
+            )
+        self._hist = None
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        return evaluator.evaluate_metric(self.metric_configuration)
+
+    def merge(self, chunk_state: Any) -> None:
+        if self._hist is None:
+            self._hist = np.array(chunk_state)
+        else:
+            self._hist = self._hist + np.array(chunk_state)
+
+    def get_value(self) -> Any:
+        return list(self._hist)
+
+
+class DistinctValuesPartialState(MetricPartialState):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._values = set()
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        return evaluator.evaluate_metric(self.metric_configuration)
+
+    def merge(self, chunk_state: Any) -> None:
+        self._values |= set(chunk_state)
+
+    def get_value(self) -> Any:
+        return self._values
+
+
+class FirstChunkPartialState(MetricPartialState):
+    """For metrics describing the structure of the batch (such as its columns), which every chunk shares."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._has_value = False
+        self._value = None
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        if self._has_value:
+            return None
+        return evaluator.evaluate_metric(self.metric_configuration)
+
+    def merge(self, chunk_state: Any) -> None:
+        if not self._has_value:
+            self._value = chunk_state
+            self._has_value = True
+
+    def get_value(self) -> Any:
+        return self._value
+
+
+class UnexpectedListPartialState(MetricPartialState):
+    """Concatenates the unexpected values (or indices) found in each chunk, up to the partial_unexpected_count of
+    the result_format unless every unexpected value was requested."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        result_format = metric_configuration.metric_value_kwargs["result_format"]
+        if result_format["result_format"] == "COMPLETE":
+            self._limit = None
+        else:
+            self._limit = result_format["partial_unexpected_count"]
+        self._values = []
+
+    @property
+    def _is_full(self) -> bool:
+        return self._limit is not None and len(self._values) >= self._limit
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        if self._is_full:
+            return []
+        return evaluator.evaluate_metric(self.metric_configuration)
+
+    def merge(self, chunk_state: Any) -> None:
+        self._values.extend(chunk_state)
+        if self._limit is not None:
+            self._values = self._values[: self._limit]
+
+    def get_value(self) -> Any:
+        return self._values
+
+
+class QuantileSketchPartialState(MetricPartialState):
+    """For quantile metrics (column.quantile_values and column.median) computed with allow_relative_error, merging
+    the QuantileSketch of each chunk."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        metric_value_kwargs = metric_configuration.metric_value_kwargs
+        self._relative_error = get_quantile_sketch_relative_error(
+            metric_value_kwargs.get("allow_relative_error", False)
+        )
+        self._is_median = metric_configuration.metric_name == "column.median"
+        self._quantiles = [0.5] if self._is_median else metric_value_kwargs["quantiles"]
+        self._sketch = QuantileSketch(relative_error=self._relative_error)
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        sketch = QuantileSketch(relative_error=self._relative_error)
+        sketch.update(
+            evaluator.get_column_values(
+                self.metric_configuration.metric_domain_kwargs
+            ).values
+        )
+        return sketch
+
+    def merge(self, chunk_state: Any) -> None:
+        self._sketch.merge(chunk_state)
+
+    def get_value(self) -> Any:
+        values = self._sketch.get_quantiles(self._quantiles)
+        return values[0] if self._is_median else values
+
+
+class HyperLogLogPartialState(MetricPartialState):
+    """For column.distinct_values.count.approx, merging the HyperLogLog sketch of each chunk."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._sketch = HyperLogLog()
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        sketch = HyperLogLog()
+        sketch.update(
+            evaluator.get_column_values(self.metric_configuration.metric_domain_kwargs)
+        )
+        return sketch
+
+    def merge(self, chunk_state: Any) -> None:
+        self._sketch.merge(chunk_state)
+
+    def get_value(self) -> Any:
+        return self._sketch.count()
+
+
+class SpaceSavingPartialState(MetricPartialState):
+    """For column.value_counts.top_k, merging the SpaceSavingSketch of each chunk, so that memory stays bounded however
+    many distinct values the column has."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._k = metric_configuration.metric_value_kwargs.get("k", 10)
+        self._sketch = SpaceSavingSketch(
+            capacity=self._k * SPACE_SAVING_CAPACITY_FACTOR
+        )
+
+    def compute_chunk_state(self, evaluator: PandasChunkMetricEvaluator) -> Any:
+        sketch = SpaceSavingSketch(capacity=self._sketch.capacity)
+        sketch.update(
+            evaluator.get_column_values(self.metric_configuration.metric_domain_kwargs)
+        )
+        return sketch
+
+    def merge(self, chunk_state: Any) -> None:
+        self._sketch.merge(chunk_state)
+
+    def get_value(self) -> Any:
+        return self._sketch.get_top_k(self._k)
+
+
+def _get_quantile_sketch_partial_state(
+    metric_configuration: MetricConfiguration,
+) -> Optional[QuantileSketchPartialState]:
+    # Exact quantiles need every value of the column at once
+    if (
+        get_quantile_sketch_relative_error(
+            metric_configuration.metric_value_kwargs.get("allow_relative_error", False)
+        )
+        is None
+    ):
+        return None
+    return QuantileSketchPartialState(metric_configuration)
+
+
+_PARTIAL_STATES_BY_METRIC_NAME = {
+    "table.row_count": SumPartialState,
+    "table.columns": FirstChunkPartialState,
+    "table.column_types": FirstChunkPartialState,
+    "table.column_count": FirstChunkPartialState,
+    "column.sum": SumPartialState,
+    "column.min": lambda metric: ExtremumPartialState(metric, min),
+    "column.max": lambda metric: ExtremumPartialState(metric, max),
+    "column.mean": lambda metric: MomentsPartialState(metric, "mean"),
+    "column.standard_deviation": lambda metric: MomentsPartialState(
+        metric, "standard_deviation"
+    ),
+    "column.value_counts": ValueCountsPartialState,
+    "column.histogram": HistogramPartialState,
+    "column.distinct_values": DistinctValuesPartialState,
+    "column.distinct_values.count.approx": HyperLogLogPartialState,
+    "column.value_counts.top_k": SpaceSavingPartialState,
+    "column.quantile_values": _get_quantile_sketch_partial_state,
+    "column.median": _get_quantile_sketch_partial_state,
+}
+
+_PARTIAL_STATES_BY_MAP_METRIC_SUFFIX = {
+    ".unexpected_count": SumPartialState,
+    ".unexpected_values": UnexpectedListPartialState,
+    ".unexpected_index_list": UnexpectedListPartialState,
+}
+
+
+def get_metric_partial_state(
+    metric_configuration: MetricConfiguration,
+) -> Optional[MetricPartialState]:
+    """Returns a new, empty partial state for the metric, or None if the metric cannot be computed chunk by chunk."""
+    metric_name = metric_configuration.metric_name
+    if metric_name in _PARTIAL_STATES_BY_METRIC_NAME:
+        return _PARTIAL_STATES_BY_METRIC_NAME[metric_name](metric_configuration)
+    if "unexpected_condition" in metric_configuration.metric_dependencies:
+        for suffix, partial_state_class in _PARTIAL_STATES_BY_MAP_METRIC_SUFFIX.items():
+            if metric_name.endswith(suffix):
+                return partial_state_class(metric_configuration)
+    return None
@@ -1,13 +1,15 @@
 import copy
 import datetime
 import hashlib
+import io
 import logging
 import random
+import threading
+from collections import OrderedDict
 from functools import partial
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
-from ruamel.yaml.compat import StringIO
 
 import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.datasource.types import (
@@ -15,7 +17,7 @@ from great_expectations.datasource.types import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
-from great_expectations.datasource.util import S3Url
+from great_expectations.datasource.util import S3ObjectReader, S3Url
 
 try:
     import boto3
@@ -26,12 +28,24 @@ from ..core.batch import BatchMarkers
 from ..core.id_dict import BatchSpec
 from ..datasource.util import hash_pandas_dataframe
 from ..exceptions import BatchSpecError, GreatExpectationsError, ValidationError
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from ..expectations.registry import get_metric_provider
+from ..validator.validation_graph import MetricConfiguration
+from .execution_engine import ExecutionEngine, MetricDomainTypes, MetricFunctionTypes
+from .pandas_chunked_batch_data import (
+    DeferredChunkedMetric,
+    MetricPartialState,
+    PandasChunkedBatchData,
+    PandasChunkMetricEvaluator,
+    get_metric_partial_state,
+)
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
 
+# Default upper bound on the memory held by DataFrames filtered by a row_condition and kept for reuse
+DEFAULT_ROW_CONDITION_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
 
 class PandasBatchData(pd.DataFrame):
     # @property
@@ -76,8 +90,17 @@ Notes:
     recognized_batch_spec_defaults = {
         "reader_method",
         "reader_options",
+        "chunk_size",
     }
 
+    # Reader methods that parse text: they accept an encoding, and can read a file in chunks of rows (using their
+    # chunksize option)
+    text_reader_methods = {"read_csv", "read_table", "read_json"}
+    # Reader methods that seek within the file they read; objects read from S3 with these are fetched by byte range
+    random_access_reader_methods = {"read_parquet", "read_feather", "read_excel"}
+    # The size of the byte ranges fetched from S3 when a reader does not ask for more at once
+    s3_read_buffer_size = 8 * 1024 * 1024
+
     def __init__(self, *args, **kwargs):
         self.discard_subset_failing_expectations = kwargs.get(
             "discard_subset_failing_expectations", False
@@ -90,6 +113,20 @@ Notes:
         except (TypeError, AttributeError):
             self._s3 = None
 
+        # DataFrames filtered by a row_condition are kept, keyed by (batch_id, row_condition, condition_parser), so
+        # that metrics sharing a row_condition do not each filter the batch; least recently used frames are dropped
+        # once the memory they hold exceeds row_condition_cache_max_bytes.
+        self._row_condition_cache_max_bytes = kwargs.pop(
+            "row_condition_cache_max_bytes", DEFAULT_ROW_CONDITION_CACHE_MAX_BYTES
+        )
+        self._row_condition_cache: "OrderedDict[Tuple[str, str, str], Tuple[pd.DataFrame, int]]" = (
+            OrderedDict()
+        )
+        self._row_condition_cache_bytes = 0
+        self._row_condition_cache_lock = threading.Lock()
+        # The chunk of each chunked batch currently being processed (see _resolve_chunked_metrics)
+        self._active_chunks: Dict[str, pd.DataFrame] = dict()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -98,11 +135,62 @@ Notes:
                 "boto3_options": boto3_options,
             }
         )
+        if self._row_condition_cache_max_bytes != DEFAULT_ROW_CONDITION_CACHE_MAX_BYTES:
+            self._config[
+                "row_condition_cache_max_bytes"
+            ] = self._row_condition_cache_max_bytes
 
     def configure_validator(self, validator):
         super().configure_validator(validator)
         validator.expose_dataframe_methods = True
 
+    def load_batch_data(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> None:
+        # Data filtered from a batch that is being replaced must not be reused
+        self._clear_row_condition_cache(batch_id=batch_id)
+        super().load_batch_data(batch_id, batch_data, batch_markers=batch_markers)
+
+    def _clear_row_condition_cache(self, batch_id: Optional[str] = None) -> None:
+        with self._row_condition_cache_lock:
+            for key in list(self._row_condition_cache.keys()):
+                if batch_id is None or key[0] == batch_id:
+                    _, nbytes = self._row_condition_cache.pop(key)
+                    self._row_condition_cache_bytes -= nbytes
+
+    def _get_row_condition_filtered_data(
+        self,
+        data: pd.DataFrame,
+        batch_id: str,
+        row_condition: str,
+        condition_parser: str,
+    ) -> pd.DataFrame:
+        """Returns data filtered by the row_condition, evaluating each row_condition at most once per batch for as long
+        as the filtered DataFrame fits in the row condition cache."""
+        key = (batch_id, row_condition, condition_parser)
+        with self._row_condition_cache_lock:
+            if key in self._row_condition_cache:
+                self._row_condition_cache.move_to_end(key)
+                return self._row_condition_cache[key][0]
+
+        filtered_data = data.query(row_condition, parser=condition_parser).reset_index(
+            drop=True
+        )
+        if not self._caching or not self._row_condition_cache_max_bytes:
+            return filtered_data
+
+        nbytes = int(filtered_data.memory_usage(index=True, deep=False).sum())
+        if nbytes > self._row_condition_cache_max_bytes:
+            return filtered_data
+        with self._row_condition_cache_lock:
+            if key not in self._row_condition_cache:
+                self._row_condition_cache[key] = (filtered_data, nbytes)
+                self._row_condition_cache_bytes += nbytes
+            while self._row_condition_cache_bytes > self._row_condition_cache_max_bytes:
+                _, (_, evicted_nbytes) = self._row_condition_cache.popitem(last=False)
+                self._row_condition_cache_bytes -= evicted_nbytes
+        return filtered_data
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -115,6 +203,12 @@ Notes:
             }
         )
 
+        chunk_size: Optional[int] = batch_spec.get("chunk_size")
+        if chunk_size is not None and not isinstance(batch_spec, PathBatchSpec):
+            raise BatchSpecError(
+                f"chunk_size is only supported for a PathBatchSpec, not {batch_spec.__class__.__name__}"
+            )
+
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
             batch_data = batch_spec.batch_data
@@ -124,6 +218,14 @@ Notes:
             reader_options: dict = batch_spec.get("reader_options") or {}
 
             path: str = batch_spec["path"]
+            if chunk_size is not None:
+                # The batch is read one chunk at a time whenever metrics are computed; it is never loaded whole
+                return (
+                    self._get_chunked_batch_data(
+                        batch_spec, path, reader_method, reader_options, chunk_size
+                    ),
+                    batch_markers,
+                )
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
 
             batch_data = reader_fn(path, **reader_options)
@@ -134,27 +236,11 @@ Notes:
                     f"""PandasExecutionEngine has been passed a S3BatchSpec,
                         but the ExecutionEngine does not have a boto3 client configured. Please check your config."""
                 )
-            s3_engine = self._s3
             s3_url = S3Url(batch_spec.get("s3"))
             reader_method: str = batch_spec.get("reader_method")
             reader_options: dict = batch_spec.get("reader_options") or {}
 
-            s3_object = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
-
-            logger.debug(
-                "Fetching s3 object. Bucket: {} Key: {}".format(
-                    s3_url.bucket, s3_url.key
-                )
-            )
-            reader_fn = self._get_reader_fn(reader_method, s3_url.key)
-            batch_data = reader_fn(
-                StringIO(
-                    s3_object["Body"]
-                    .read()
-                    .decode(s3_object.get("ContentEncoding", "utf-8"))
-                ),
-                **reader_options,
-            )
+            batch_data = self._read_s3_object(s3_url, reader_method, reader_options)
         else:
             raise BatchSpecError(
                 f"batch_spec must be of type RuntimeDataBatchSpec, PathBatchSpec, or S3BatchSpec, not {batch_spec.__class__.__name__}"
@@ -180,10 +266,430 @@ Notes:
             batch_data = sampling_fn(batch_data, **sampling_kwargs)
         return batch_data
 
+    def _read_s3_object(
+        self, s3_url: S3Url, reader_method: Optional[str], reader_options: dict
+    ) -> pd.DataFrame:
+        """Hands the reader a file object streaming the S3 object, rather than a decoded copy of its contents.
+
+        Readers that seek (see random_access_reader_methods) are given a file object fetching byte ranges on demand,
+        and parquet files are read with column projection and row group pruning (see _read_parquet), so that only
+        the parts of the object that are needed are downloaded.
+        """
+        if reader_method is None:
+            path_guess = self.guess_reader_method_from_path(s3_url.key)
+            reader_method = path_guess["reader_method"]
+            reader_options = {
+                **(path_guess.get("reader_options") or {}),
+                **reader_options,
+            }
+        logger.debug(
+            "Fetching s3 object. Bucket: {} Key: {}".format(s3_url.bucket, s3_url.key)
+        )
+
+        if reader_method in self.random_access_reader_methods:
+            s3_object_file = io.BufferedReader(
+                S3ObjectReader(self._s3, s3_url.bucket, s3_url.key),
+                buffer_size=self.s3_read_buffer_size,
+            )
+            if reader_method == "read_parquet":
+                return self._read_parquet(s3_object_file, reader_options)
+            reader_fn = self._get_reader_fn(reader_method)
+            return reader_fn(s3_object_file, **reader_options)
+
+        s3_object = self._s3.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
+        # ContentEncoding lists the HTTP content codings of the object (e.g. "gzip,aws-chunked"), not a text
+        # encoding: only gzip tells the reader anything, and the text encoding comes from reader_options alone
+        content_codings = [
+            coding.strip().lower()
+            for coding in (s3_object.get("ContentEncoding") or "").split(",")
+        ]
+        if reader_method in self.text_reader_methods and "gzip" in content_codings:
+            reader_options = dict(reader_options)
+            reader_options.setdefault("compression", "gzip")
+        reader_fn = self._get_reader_fn(reader_method)
+        return reader_fn(s3_object["Body"], **reader_options)
+
+    def _read_parquet(self, source, reader_options: dict) -> pd.DataFrame:
+        """Reads a parquet file from a seekable file object, downloading only the requested columns of the row groups
+        whose statistics do not rule out the filters.
+
+        Supported reader_options are "columns", "filters" (a list of (column, op, value) tuples that must all hold,
+        with op one of =, ==, !=, <, <=, >, >=, in and not in) and "use_threads".
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise BatchSpecError(
+                "pyarrow is required to read parquet files from S3; install it to read them"
+            )
+        reader_options = dict(reader_options)
+        reader_options.pop("engine", None)
+        columns: Optional[List[str]] = reader_options.pop("columns", None)
+        filters: List[tuple] = reader_options.pop("filters", None) or []
+        use_threads: bool = reader_options.pop("use_threads", True)
+        if len(reader_options) > 0:
+            logger.warning(
+                f"Ignoring reader_options {sorted(reader_options.keys())} when reading parquet from S3"
+            )
+        for parquet_filter in filters:
+            if not isinstance(parquet_filter, tuple) or len(parquet_filter) != 3:
+                raise BatchSpecError(
+                    "parquet filters must be a list of (column, op, value) tuples that must all hold"
+                )
+
+        read_columns = columns
+        if columns is not None:
+            read_columns = list(columns) + [
+                parquet_filter[0]
+                for parquet_filter in filters
+                if parquet_filter[0] not in columns
+            ]
+        parquet_file = pq.ParquetFile(source)
+        column_indexes = {
+            parquet_file.metadata.schema.column(i).path: i
+            for i in range(parquet_file.metadata.num_columns)
+        }
+        row_groups = [
+            i
+            for i in range(parquet_file.metadata.num_row_groups)
+            if self._parquet_row_group_may_match(
+                parquet_file.metadata.row_group(i), column_indexes, filters
+            )
+        ]
+        logger.debug(
+            f"Reading {len(row_groups)} of {parquet_file.metadata.num_row_groups} parquet row groups"
+        )
+        if len(row_groups) > 0:
+            table = parquet_file.read_row_groups(
+                row_groups,
+                columns=read_columns,
+                use_threads=use_threads,
+                use_pandas_metadata=True,
+            )
+        else:
+            table = parquet_file.schema_arrow.empty_table()
+            if read_columns is not None:
+                table = table.select(read_columns)
+        df = table.to_pandas()
+
+        if len(filters) > 0:
+            mask = pd.Series(True, index=df.index)
+            for column, op, value in filters:
+                mask &= self._get_parquet_filter_mask(df[column], op, value)
+            df = df[mask].reset_index(drop=True)
+        if columns is not None:
+            df = df[list(columns)]
+        return df
+
+    @staticmethod
+    def _get_parquet_filter_mask(series: pd.Series, op: str, value) -> pd.Series:
+        if op in ["=", "=="]:
+            return series == value
+        elif op == "!=":
+            return series != value
+        elif op == "<":
+            return series < value
+        elif op == "<=":
+            return series <= value
+        elif op == ">":
+            return series > value
+        elif op == ">=":
+            return series >= value
+        elif op == "in":
+            return series.isin(value)
+        elif op == "not in":
+            return ~series.isin(value)
+        raise BatchSpecError(f'Unsupported parquet filter operator "{op}"')
+
+    @staticmethod
+    def _parquet_row_group_may_match(
+        row_group_metadata, column_indexes: Dict[str, int], filters: List[tuple]
+    ) -> bool:
+        """Returns False if the min/max statistics of the row group show that no row in it satisfies the filters."""
+        for column, op, value in filters:
+            if column not in column_indexes:
+                continue
+            statistics = row_group_metadata.column(column_indexes[column]).statistics
+            if statistics is None or not statistics.has_min_max:
+                continue
+            minimum, maximum = statistics.min, statistics.max
+            try:
+                if op in ["=", "=="]:
+                    may_match = minimum <= value <= maximum
+                elif op == "<":
+                    may_match = minimum < value
+                elif op == "<=":
+                    may_match = minimum <= value
+                elif op == ">":
+                    may_match = maximum > value
+                elif op == ">=":
+                    may_match = maximum >= value
+                elif op == "in":
+                    may_match = any(minimum <= item <= maximum for item in value)
+                else:
+                    may_match = True
+            except TypeError:
+                # Statistics that cannot be compared with the filter value do not rule out any rows
+                may_match = True
+            if not may_match:
+                return False
+        return True
+
+    def _get_chunked_batch_data(
+        self,
+        batch_spec: BatchSpec,
+        path: str,
+        reader_method: Optional[str],
+        reader_options: dict,
+        chunk_size: int,
+    ) -> PandasChunkedBatchData:
+        if reader_method is None:
+            reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+
+        if reader_method in self.text_reader_methods:
+            reader_fn: Callable = self._get_reader_fn(reader_method, path)
+
+            def chunk_reader():
+                reader = reader_fn(path, chunksize=chunk_size, **reader_options)
+                try:
+                    for chunk in reader:
+                        yield chunk
+                finally:
+                    reader.close()
+
+        elif reader_method == "read_parquet":
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise BatchSpecError(
+                    "pyarrow is required to read parquet files in chunks; install it to use chunk_size"
+                )
+            columns = reader_options.get("columns")
+
+            def chunk_reader():
+                parquet_file = pq.ParquetFile(path)
+                if hasattr(parquet_file, "iter_batches"):
+                    record_batches = parquet_file.iter_batches(
+                        batch_size=chunk_size, columns=columns
+                    )
+                else:
+                    # Older versions of pyarrow can only read whole row groups
+                    record_batches = (
+                        parquet_file.read_row_group(i, columns=columns)
+                        for i in range(parquet_file.num_row_groups)
+                    )
+                # Chunks are indexed by row number within the file, as read_csv chunks are
+                offset = 0
+                for record_batch in record_batches:
+                    chunk = record_batch.to_pandas()
+                    chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                    offset += len(chunk)
+                    yield chunk
+
+        else:
+            raise BatchSpecError(
+                f'chunk_size is not supported for reader_method "{reader_method}"'
+            )
+
+        # Splitters and samplers select rows, so they can be applied to each chunk independently
+        chunk_transform = None
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            chunk_transform = partial(
+                self._apply_splitting_and_sampling_methods, batch_spec
+            )
+        return PandasChunkedBatchData(
+            chunk_reader=chunk_reader, chunk_transform=chunk_transform
+        )
+
     def _get_typed_batch_data(self, batch_data):
+        if isinstance(batch_data, PandasChunkedBatchData):
+            return batch_data
         typed_batch_data = PandasBatchData(batch_data)
         return typed_batch_data
 
+    def get_sample_batch_data(
+        self,
+        batch_data: Any,
+        batch_spec: Optional[BatchSpec],
+        p: float,
+        seed: Optional[int] = None,
+    ) -> pd.DataFrame:
+        if isinstance(batch_data, PandasChunkedBatchData):
+            # Only the sampled rows of each chunk are kept in memory
+            chunk_samples = [
+                chunk.sample(frac=p, random_state=seed)
+                for chunk in batch_data.iter_chunks()
+            ]
+            if not chunk_samples:
+                return pd.DataFrame()
+            return pd.concat(chunk_samples)
+        return batch_data.sample(frac=p, random_state=seed)
+
+    def _get_batch_id_and_data(self, domain_kwargs: dict) -> Tuple[str, Any]:
+        batch_id = domain_kwargs.get("batch_id") or self.active_batch_data_id
+        return batch_id, self.loaded_batch_data_dict.get(batch_id)
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+        max_workers: Optional[int] = None,
+    ) -> dict:
+        """Metrics on chunked batches that have a partial state are computed in a single pass over the chunks of each
+        batch; all other metrics are resolved as usual (see ExecutionEngine.resolve_metrics)."""
+        if metrics is None:
+            metrics = dict()
+        metrics_to_resolve = list(metrics_to_resolve)
+        deferred_metrics = dict()
+        partial_states = dict()
+        for metric_to_resolve in metrics_to_resolve:
+            _, batch_data = self._get_batch_id_and_data(
+                metric_to_resolve.metric_domain_kwargs
+            )
+            if not isinstance(batch_data, PandasChunkedBatchData):
+                continue
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            if metric_fn is not None and (
+                getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+                != MetricFunctionTypes.VALUE
+            ):
+                # Partial functions (such as map conditions) are evaluated on each chunk by the metrics that use them
+                deferred_metrics[metric_to_resolve.id] = DeferredChunkedMetric(
+                    metric_to_resolve
+                )
+                continue
+            partial_state = get_metric_partial_state(metric_to_resolve)
+            if partial_state is not None:
+                partial_states[metric_to_resolve.id] = partial_state
+            elif any(
+                isinstance(metrics.get(dependency.id), DeferredChunkedMetric)
+                for dependency in metric_to_resolve.metric_dependencies.values()
+            ):
+                raise GreatExpectationsError(
+                    f"Metric {metric_to_resolve.metric_name} cannot be computed on chunked batch data"
+                )
+
+        if len(deferred_metrics) == 0 and len(partial_states) == 0:
+            return super().resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                max_workers=max_workers,
+            )
+
+        resolved_metrics = super().resolve_metrics(
+            metrics_to_resolve=[
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if metric_to_resolve.id not in deferred_metrics
+                and metric_to_resolve.id not in partial_states
+            ],
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+            max_workers=max_workers,
+        )
+        resolved_metrics.update(deferred_metrics)
+        resolved_metrics.update(
+            self._resolve_chunked_metrics(
+                partial_states=list(partial_states.values()),
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+        return resolved_metrics
+
+    def _resolve_chunked_metrics(
+        self,
+        partial_states: List[MetricPartialState],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: dict = None,
+    ) -> Dict[Tuple, Any]:
+        """Reads each chunked batch once, merging the partial state of every metric on it chunk by chunk."""
+        partial_states_by_batch_id: Dict[str, List[MetricPartialState]] = dict()
+        for partial_state in partial_states:
+            batch_id, _ = self._get_batch_id_and_data(
+                partial_state.metric_configuration.metric_domain_kwargs
+            )
+            partial_states_by_batch_id.setdefault(batch_id, []).append(partial_state)
+
+        for batch_id, batch_partial_states in partial_states_by_batch_id.items():
+            chunk_count = 0
+            for chunk in self.loaded_batch_data_dict[batch_id].iter_chunks():
+                chunk_metrics = dict()
+                evaluator = PandasChunkMetricEvaluator(
+                    evaluate_metric=partial(
+                        self._evaluate_metric_on_chunk,
+                        metrics=metrics,
+                        chunk_metrics=chunk_metrics,
+                        runtime_configuration=runtime_configuration,
+                    ),
+                    get_column_values=self._get_chunk_column_values,
+                )
+                self._active_chunks[batch_id] = chunk
+                try:
+                    for partial_state in batch_partial_states:
+                        partial_state.update(evaluator)
+                finally:
+                    del self._active_chunks[batch_id]
+                chunk_count += 1
+            logger.debug(
+                f"PandasExecutionEngine computed {len(batch_partial_states)} metrics over {chunk_count} chunks of batch {batch_id}"
+            )
+
+        return {
+            partial_state.metric_configuration.id: partial_state.get_value()
+            for partial_state in partial_states
+        }
+
+    def _evaluate_metric_on_chunk(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[Tuple, Any],
+        chunk_metrics: Dict[Tuple, Any],
+        runtime_configuration: dict = None,
+    ) -> Any:
+        """Computes the metric on the active chunk, first evaluating any deferred partial metrics it depends on."""
+        if metric_configuration.id in chunk_metrics:
+            return chunk_metrics[metric_configuration.id]
+        metric_dependencies = dict()
+        for key, dependency in metric_configuration.metric_dependencies.items():
+            if dependency.id not in metrics:
+                raise GreatExpectationsError(
+                    f"Missing metric dependency: {str(dependency.id)}"
+                )
+            value = metrics[dependency.id]
+            if isinstance(value, DeferredChunkedMetric):
+                value = self._evaluate_metric_on_chunk(
+                    value.metric_configuration,
+                    metrics=metrics,
+                    chunk_metrics=chunk_metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            metric_dependencies[key] = value
+        metric_class, metric_fn = get_metric_provider(
+            metric_name=metric_configuration.metric_name, execution_engine=self
+        )
+        value = metric_fn(
+            cls=metric_class,
+            execution_engine=self,
+            metric_domain_kwargs=metric_configuration.metric_domain_kwargs,
+            metric_value_kwargs=metric_configuration.metric_value_kwargs,
+            metrics=metric_dependencies,
+            runtime_configuration=runtime_configuration,
+        )
+        chunk_metrics[metric_configuration.id] = value
+        return value
+
+    def _get_chunk_column_values(self, metric_domain_kwargs: dict) -> pd.Series:
+        df, _, accessor_domain_kwargs = self.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = accessor_domain_kwargs["column"]
+        return df[column][df[column].notnull()]
+
     @property
     def dataframe(self):
         """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
@@ -297,6 +803,7 @@ Notes:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data
             else:
                 raise ValidationError(
@@ -308,7 +815,17 @@ Notes:
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
-        compute_domain_kwargs = copy.deepcopy(domain_kwargs)
+        is_chunk = isinstance(data, PandasChunkedBatchData)
+        if is_chunk:
+            if batch_id not in self._active_chunks:
+                raise GreatExpectationsError(
+                    f"Batch {batch_id} is read in chunks, so only metrics that can be merged across chunks can be "
+                    f"computed on it"
+                )
+            data = self._active_chunks[batch_id]
+
+        # Only top-level keys are moved between compute and accessor domain kwargs, so a shallow copy suffices
+        compute_domain_kwargs = copy.copy(domain_kwargs)
         accessor_domain_kwargs = dict()
         table = domain_kwargs.get("table", None)
         if table:
@@ -329,9 +846,13 @@ Notes:
                 )
             else:
                 # Querying row condition
-                data = data.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
-                )
+                if is_chunk:
+                    # Rows of a chunk keep their position in the batch as their index
+                    data = data.query(row_condition, parser=condition_parser)
+                else:
+                    data = self._get_row_condition_filtered_data(
+                        data, batch_id, row_condition, condition_parser
+                    )
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -2,8 +2,9 @@ import copy
 import datetime
 import hashlib
 import logging
+import threading
 import uuid
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.id_dict import IDDict
@@ -152,7 +153,15 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
     def __init__(self, *args, **kwargs):
         # Creation of the Spark DataFrame is done outside this class
         self._persist = kwargs.pop("persist", True)
+        # The name of a pyspark.StorageLevel (e.g. "MEMORY_AND_DISK") at which to persist domains; None uses Spark's
+        # default for DataFrame.persist()
+        self._persist_storage_level = kwargs.pop("persist_storage_level", None)
         self._spark_config = kwargs.pop("spark_config", {})
+        # Batches and row_condition-filtered domains shared by several pending metrics are persisted when first used,
+        # and unpersisted once the last metric that needs them has been resolved (see retain_metric_domains).
+        self._domain_reference_counts: Dict[Tuple, int] = dict()
+        self._persisted_domains: Dict[Tuple, DataFrame] = dict()
+        self._domain_lock = threading.RLock()
         try:
             builder = SparkSession.builder
             app_name: Optional[str] = self._spark_config.pop("spark.app.name", None)
@@ -172,6 +181,104 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         self._config.update(
             {"persist": self._persist, "spark_config": self._spark_config,}
         )
+        if self._persist_storage_level is not None:
+            self._config["persist_storage_level"] = self._persist_storage_level
+            self._get_storage_level()
+
+    def _get_storage_level(self) -> Optional["pyspark.StorageLevel"]:
+        if self._persist_storage_level is None or pyspark is None:
+            return None
+        storage_level = getattr(pyspark.StorageLevel, self._persist_storage_level, None)
+        if not isinstance(storage_level, pyspark.StorageLevel):
+            raise GreatExpectationsError(
+                f"Unrecognized persist_storage_level {self._persist_storage_level}; it must name a pyspark.StorageLevel"
+            )
+        return storage_level
+
+    def load_batch_data(
+        self, batch_id: str, batch_data: Any, batch_markers: BatchMarkers = None
+    ) -> None:
+        # Domains persisted from a batch that is being replaced must not be reused
+        self._unpersist_domains(
+            [key for key in self._persisted_domains.keys() if key[0] == batch_id]
+        )
+        super().load_batch_data(batch_id, batch_data, batch_markers=batch_markers)
+
+    def _get_domain_persistence_keys(self, domain_kwargs: dict) -> List[Tuple]:
+        """The keys of the persistable domains that computing a metric on domain_kwargs reads: the batch itself and,
+        if there is a row_condition, the batch filtered by it."""
+        batch_id = domain_kwargs.get("batch_id") or self.active_batch_data_id
+        keys = [(batch_id, None, None)]
+        row_condition = domain_kwargs.get("row_condition")
+        if row_condition:
+            keys.append(
+                (batch_id, row_condition, domain_kwargs.get("condition_parser"))
+            )
+        return keys
+
+    def retain_metric_domains(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        if not self._persist:
+            return
+        with self._domain_lock:
+            for metric_configuration in metric_configurations:
+                for key in self._get_domain_persistence_keys(
+                    metric_configuration.metric_domain_kwargs
+                ):
+                    self._domain_reference_counts[key] = (
+                        self._domain_reference_counts.get(key, 0) + 1
+                    )
+
+    def release_metric_domains(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        if not self._persist:
+            return
+        released_keys = []
+        with self._domain_lock:
+            for metric_configuration in metric_configurations:
+                for key in self._get_domain_persistence_keys(
+                    metric_configuration.metric_domain_kwargs
+                ):
+                    if key not in self._domain_reference_counts:
+                        continue
+                    self._domain_reference_counts[key] -= 1
+                    if self._domain_reference_counts[key] <= 0:
+                        del self._domain_reference_counts[key]
+                        released_keys.append(key)
+            self._unpersist_domains(released_keys)
+
+    def _unpersist_domains(self, keys: Iterable[Tuple]) -> None:
+        with self._domain_lock:
+            for key in keys:
+                data = self._persisted_domains.pop(key, None)
+                if data is not None:
+                    logger.debug(f"Unpersisting domain {str(key)}")
+                    data.unpersist()
+
+    def _get_persisted_domain(self, key: Tuple) -> Optional[DataFrame]:
+        with self._domain_lock:
+            return self._persisted_domains.get(key)
+
+    def _persist_domain(self, key: Tuple, data: DataFrame) -> DataFrame:
+        """Persists data if more than one pending metric needs the domain it holds, and returns it."""
+        with self._domain_lock:
+            if key in self._persisted_domains:
+                return self._persisted_domains[key]
+            if self._domain_reference_counts.get(key, 0) < 2:
+                return data
+            if data.is_cached:
+                # The DataFrame was persisted outside of the execution engine, which must not unpersist it
+                return data
+            storage_level = self._get_storage_level()
+            logger.debug(f"Persisting domain {str(key)}")
+            if storage_level is None:
+                data = data.persist()
+            else:
+                data = data.persist(storage_level)
+            self._persisted_domains[key] = data
+            return data
 
     @property
     def dataframe(self):
@@ -183,6 +290,15 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
         return self.active_batch_data
 
+    def get_sample_batch_data(
+        self,
+        batch_data: Any,
+        batch_spec: Optional[BatchSpec],
+        p: float,
+        seed: Optional[int] = None,
+    ) -> "DataFrame":
+        return batch_data.sample(withReplacement=False, fraction=p, seed=seed)
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -325,6 +441,7 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data
             else:
                 raise ValidationError(
@@ -347,15 +464,23 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
-                )
+            domain_key = (batch_id, row_condition, condition_parser)
+            filtered_data = self._get_persisted_domain(domain_key)
+            if filtered_data is None:
+                data = self._persist_domain((batch_id, None, None), data)
+                if condition_parser == "spark":
+                    filtered_data = data.filter(row_condition)
+                elif condition_parser == "great_expectations__experimental__":
+                    parsed_condition = parse_condition_to_spark(row_condition)
+                    filtered_data = data.filter(parsed_condition)
+                else:
+                    raise GreatExpectationsError(
+                        f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
+                    )
+                filtered_data = self._persist_domain(domain_key, filtered_data)
+            data = filtered_data
+        else:
+            data = self._persist_domain((batch_id, None, None), data)
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -0,0 +1,436 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+from great_expectations.exceptions import QueryTimeoutError
+from great_expectations.execution_engine.sqlalchemy_query_observer import (
+    QueryObserver,
+    QueryRecord,
+    get_attributed_metric_ids,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.pool import SingletonThreadPool, StaticPool
+except ImportError:
+    sa = None
+    SingletonThreadPool = None
+    StaticPool = None
+
+
+class SqlAlchemySession:
+    """A connection held open for the batches pinned to it, so that the temporary tables created for them stay visible
+    (temporary tables only exist within the session that created them). Queries on a session are serialized."""
+
+    def __init__(self, connection, owns_connection: bool = True):
+        """
+        Args:
+            connection: the SqlAlchemy Connection of the session
+            owns_connection: whether closing the session closes the connection
+        """
+        self._connection = connection
+        self._owns_connection = owns_connection
+        self._lock = threading.RLock()
+        self._batch_count = 0
+
+    @property
+    def connection(self):
+        return self._connection
+
+    @property
+    def lock(self):
+        return self._lock
+
+    @property
+    def batch_count(self) -> int:
+        return self._batch_count
+
+    def pin_batch(self) -> None:
+        self._batch_count += 1
+
+    def close(self) -> None:
+        if self._owns_connection:
+            with self._lock:
+                self._connection.close()
+
+
+class SqlAlchemyConnectionManager:
+    """Manages the connections through which a SqlAlchemyExecutionEngine queries its database:
+
+      - batch sessions: a batch backed by a temporary table is pinned to one of at most max_batch_sessions dedicated
+        connections, on which its temporary table is created and all of its queries are run
+      - read connections: queries on batches that need no session (tables, or subqueries rather than temporary
+        tables) check out a connection from the engine's own connection pool, so they may run concurrently
+
+    At most max_concurrent_queries queries are in flight at once, and queries running for longer than query_timeout
+    seconds are cancelled (where the DBAPI driver supports it) and raise a QueryTimeoutError. Each query is reported
+    to the query observers added with add_query_observer.
+    """
+
+    def __init__(
+        self,
+        engine,
+        max_batch_sessions: Optional[int] = None,
+        max_concurrent_queries: Optional[int] = None,
+        query_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            engine: the SqlAlchemy Engine (or a single Connection, through which every query is then run)
+            max_batch_sessions: the number of dedicated connections batches with temporary tables are spread over
+                (default 1)
+            max_concurrent_queries: the maximum number of queries in flight at once; None for no limit
+            query_timeout: the number of seconds after which a query is cancelled; None for no timeout
+        """
+        if max_batch_sessions is not None and max_batch_sessions < 1:
+            raise ValueError("max_batch_sessions must be a positive integer")
+        if max_concurrent_queries is not None and max_concurrent_queries < 1:
+            raise ValueError("max_concurrent_queries must be a positive integer")
+        self._engine = engine
+        self._max_batch_sessions = max_batch_sessions or 1
+        self._max_concurrent_queries = max_concurrent_queries
+        self._query_timeout = query_timeout
+        self._query_slots = (
+            threading.BoundedSemaphore(max_concurrent_queries)
+            if max_concurrent_queries is not None
+            else None
+        )
+        # The number of query slots each thread holds, so that nested connections do not take a second slot
+        self._held_query_slots = threading.local()
+        self._sessions: List[SqlAlchemySession] = []
+        self._sessions_lock = threading.Lock()
+        self._query_observers: List[QueryObserver] = []
+        if isinstance(engine, sa.engine.Connection):
+            # Every query shares the one connection we were given
+            self._shared_session = SqlAlchemySession(engine, owns_connection=False)
+        else:
+            self._shared_session = None
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def max_concurrent_queries(self) -> Optional[int]:
+        return self._max_concurrent_queries
+
+    @property
+    def query_timeout(self) -> Optional[float]:
+        return self._query_timeout
+
+    @property
+    def query_observers(self) -> List[QueryObserver]:
+        return list(self._query_observers)
+
+    def add_query_observer(self, query_observer: QueryObserver) -> None:
+        self._query_observers = self._query_observers + [query_observer]
+
+    def remove_query_observer(self, query_observer: QueryObserver) -> None:
+        self._query_observers = [
+            observer
+            for observer in self._query_observers
+            if observer is not query_observer
+        ]
+
+    @property
+    def supports_concurrent_queries(self) -> bool:
+        """Queries may run on several threads at once only if each thread can check out a connection to the same
+        database: not when every query shares a single connection, nor with pools handing each thread its own
+        connection (as for in-memory sqlite databases, which would then each be a different, empty database).
+        sqlite connections are moreover bound to the thread that opened them, so batch sessions cannot be shared."""
+        if self._shared_session is not None:
+            return False
+        if self._engine.dialect.name.lower() == "sqlite":
+            return False
+        return not isinstance(self._engine.pool, (SingletonThreadPool, StaticPool))
+
+    def open_batch_session(self) -> SqlAlchemySession:
+        """Returns the session a new batch is pinned to: a new session while fewer than max_batch_sessions are open,
+        and otherwise the one with the fewest batches."""
+        if self._shared_session is not None:
+            return self._shared_session
+        with self._sessions_lock:
+            if len(self._sessions) < self._max_batch_sessions:
+                session = SqlAlchemySession(self._engine.connect())
+                self._sessions.append(session)
+            else:
+                session = min(self._sessions, key=lambda s: s.batch_count)
+            session.pin_batch()
+            return session
+
+    @contextmanager
+    def connect(self, session: Optional[SqlAlchemySession] = None):
+        """Yields the connection on which to run queries: that of the given session (held exclusively), or a read
+        connection from the pool. The connection counts against max_concurrent_queries, and is subject to the query
+        timeout, until the context exits."""
+        with self._connect(session=session) as connection:
+            with self._observe_cursor_executions(connection):
+                yield connection
+
+    @contextmanager
+    def _connect(self, session: Optional[SqlAlchemySession] = None):
+        session = session or self._shared_session
+        with self._query_slot():
+            if session is not None:
+                with session.lock:
+                    with self._timeout(session.connection):
+                        yield session.connection
+            else:
+                with self._engine.connect() as connection:
+                    with self._timeout(connection):
+                        yield connection
+
+    @contextmanager
+    def _query_slot(self):
+        if self._query_slots is None:
+            yield
+            return
+        held_query_slots = getattr(self._held_query_slots, "count", 0)
+        if held_query_slots == 0:
+            self._query_slots.acquire()
+        self._held_query_slots.count = held_query_slots + 1
+        try:
+            yield
+        finally:
+            self._held_query_slots.count -= 1
+            if self._held_query_slots.count == 0:
+                self._query_slots.release()
+
+    @contextmanager
+    def _timeout(self, connection):
+        if self._query_timeout is None:
+            yield
+            return
+        timed_out = threading.Event()
+        timer = threading.Timer(
+            self._query_timeout, self._cancel, args=(connection, timed_out)
+        )
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        except Exception as e:
+            if timed_out.is_set():
+                raise QueryTimeoutError(
+                    f"Query exceeded the timeout of {self._query_timeout} seconds"
+                ) from e
+            raise
+        finally:
+            timer.cancel()
+        if timed_out.is_set():
+            # The driver could not cancel the query, which ran to completion anyway
+            raise QueryTimeoutError(
+                f"Query exceeded the timeout of {self._query_timeout} seconds"
+            )
+
+    @staticmethod
+    def _cancel(connection, timed_out: threading.Event) -> None:
+        timed_out.set()
+        dbapi_connection = connection.connection
+        # psycopg2 (and drivers like it) cancel the running statement with cancel(), sqlite3 with interrupt()
+        for cancel_method_name in ["cancel", "interrupt"]:
+            cancel_method = getattr(dbapi_connection, cancel_method_name, None)
+            if callable(cancel_method):
+                try:
+                    cancel_method()
+                except Exception as e:
+                    logger.warning(f"Unable to cancel query: {str(e)}")
+                return
+        logger.warning(
+            "The database driver does not support cancelling queries; the query will run to completion."
+        )
+
+    def execute(self, *args, session: Optional[SqlAlchemySession] = None, **kwargs):
+        """Runs a statement and returns its result, fully fetched so that the connection is released at once."""
+        with self._connect(session=session) as connection:
+            query_observers = self._query_observers
+            start_time = time.time()
+            start = time.perf_counter()
+            result = connection.execute(*args, **kwargs)
+            buffered_result = BufferedResult(result)
+            if len(query_observers) > 0:
+                context = result.context
+                record = QueryRecord(
+                    sql=context.statement,
+                    parameters=context.parameters[0]
+                    if len(context.parameters) == 1
+                    else context.parameters,
+                    metric_ids=get_attributed_metric_ids(),
+                    rows=len(buffered_result.fetchall())
+                    if result.returns_rows
+                    else None,
+                    start_time=start_time,
+                    seconds=time.perf_counter() - start,
+                    dialect=self._engine.dialect.name,
+                )
+                buffered_result.rewind()
+                if any(observer.capture_explain for observer in query_observers):
+                    record.explain = self._explain(connection, record)
+                self._notify(query_observers, record)
+            return buffered_result
+
+    @contextmanager
+    def _observe_cursor_executions(self, connection):
+        """Reports the statements run on a connection handed out by connect; since their rows are fetched by the
+        caller, their records hold the number of rows reported by the cursor, if any, and no query plan."""
+        query_observers = self._query_observers
+        if len(query_observers) == 0:
+            yield
+            return
+
+        starts = []
+
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            starts.append((time.time(), time.perf_counter()))
+
+        def after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            start_time, start = starts.pop()
+            self._notify(
+                query_observers,
+                QueryRecord(
+                    sql=statement,
+                    parameters=parameters,
+                    metric_ids=get_attributed_metric_ids(),
+                    rows=cursor.rowcount if cursor.rowcount >= 0 else None,
+                    start_time=start_time,
+                    seconds=time.perf_counter() - start,
+                    dialect=self._engine.dialect.name,
+                ),
+            )
+
+        sa.event.listen(connection, "before_cursor_execute", before_cursor_execute)
+        sa.event.listen(connection, "after_cursor_execute", after_cursor_execute)
+        try:
+            yield
+        finally:
+            sa.event.remove(connection, "before_cursor_execute", before_cursor_execute)
+            sa.event.remove(connection, "after_cursor_execute", after_cursor_execute)
+
+    @staticmethod
+    def _notify(query_observers: List[QueryObserver], record: QueryRecord) -> None:
+        for observer in query_observers:
+            try:
+                observer.on_query(record)
+            except Exception as e:
+                logger.warning(f"Query observer {observer} failed: {str(e)}")
+
+    def _explain(self, connection, record: QueryRecord) -> Optional[str]:
+        """Returns the query plan of a SELECT statement, as rows of text, if the dialect has an EXPLAIN statement."""
+        dialect_name = self._engine.dialect.name.lower()
+        if not record.sql.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        if dialect_name == "sqlite":
+            explain_prefix = "EXPLAIN QUERY PLAN "
+        elif dialect_name in ["mssql", "bigquery", "oracle"]:
+            # These dialects expose query plans through other means than an EXPLAIN statement
+            return None
+        else:
+            explain_prefix = "EXPLAIN "
+        try:
+            if record.parameters:
+                plan_rows = connection.execute(
+                    explain_prefix + record.sql, record.parameters
+                ).fetchall()
+            else:
+                plan_rows = connection.execute(explain_prefix + record.sql).fetchall()
+        except Exception as e:
+            logger.debug(f"Unable to capture the query plan of a query: {str(e)}")
+            return None
+        return "\n".join(
+            " | ".join(str(value) for value in plan_row) for plan_row in plan_rows
+        )
+
+    def close(self) -> None:
+        """Closes every batch session, dropping the temporary tables created in them."""
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+
+
+class ManagedConnectable:
+    """Stands in for a SqlAlchemy Engine for the queries of one batch: execute runs statements through the
+    SqlAlchemyConnectionManager, on the batch's session if it has one, and returns fully fetched results; connect yields
+    a connection to hold while streaming a result."""
+
+    def __init__(
+        self,
+        connection_manager: SqlAlchemyConnectionManager,
+        session: Optional[SqlAlchemySession] = None,
+    ):
+        self._connection_manager = connection_manager
+        self._session = session
+
+    @property
+    def dialect(self):
+        return self._connection_manager.engine.dialect
+
+    @property
+    def name(self):
+        return self._connection_manager.engine.name
+
+    def execute(self, *args, **kwargs):
+        return self._connection_manager.execute(*args, session=self._session, **kwargs)
+
+    def connect(self):
+        return self._connection_manager.connect(session=self._session)
+
+
+class BufferedResult:
+    """The fully fetched rows of a result, supporting the fetch methods of a SqlAlchemy ResultProxy."""
+
+    def __init__(self, result):
+        if result.returns_rows:
+            self._keys = list(result.keys())
+            self._rows = result.fetchall()
+        else:
+            self._keys = []
+            self._rows = []
+        self.rowcount = result.rowcount
+        result.close()
+        self._position = 0
+
+    def keys(self) -> list:
+        return self._keys
+
+    def rewind(self) -> None:
+        self._position = 0
+
+    def fetchall(self) -> list:
+        rows = self._rows[self._position :]
+        self._position = len(self._rows)
+        return rows
+
+    def fetchmany(self, size: int) -> list:
+        rows = self._rows[self._position : self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        return rows[0] if len(rows) > 0 else None
+
+    def first(self):
+        return self.fetchone()
+
+    def scalar(self):
+        row = self.fetchone()
+        return row[0] if row is not None else None
+
+    def close(self) -> None:
+        pass
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
@@ -1,9 +1,9 @@
+import contextlib
 import copy
 import datetime
 import logging
-import uuid
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -18,6 +18,23 @@ from great_expectations.exceptions import (
 )
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.sqlalchemy_connection_manager import (
+    ManagedConnectable,
+    SqlAlchemyConnectionManager,
+    SqlAlchemySession,
+)
+from great_expectations.execution_engine.sqlalchemy_materialization_manager import (
+    MaterializationStrategy,
+    SqlAlchemyMaterialization,
+    SqlAlchemyMaterializationManager,
+    generate_temporary_table_name,
+    get_create_temporary_table_statement,
+)
+from great_expectations.execution_engine.sqlalchemy_query_observer import (
+    QueryObserver,
+    QueryReportObserver,
+    attribute_queries_to_metrics,
+)
 from great_expectations.expectations.row_conditions import parse_condition_to_sqlalchemy
 from great_expectations.util import (
     filter_properties_dict,
@@ -38,13 +55,18 @@ try:
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.engine.url import URL
     from sqlalchemy.sql import Select
-    from sqlalchemy.sql.elements import TextClause, quoted_name
+    from sqlalchemy.sql.elements import ColumnClause, Over, TextClause, quoted_name
+    from sqlalchemy.sql.visitors import iterate, replacement_traverse
 except ImportError:
     reflection = None
     DefaultDialect = None
     Select = None
+    ColumnClause = None
+    Over = None
     TextClause = None
     quoted_name = None
+    iterate = None
+    replacement_traverse = None
 
 
 try:
@@ -122,6 +144,183 @@ def _get_dialect_type_module(dialect):
     return dialect
 
 
+def _get_tablesample_clause(
+    dialect_name: str, p: float, method: str = "system", seed: Optional[int] = None
+) -> Optional[str]:
+    """Returns the clause sampling proportion p of the rows of the table it follows in the dialect, by reading a sample
+    of its blocks (method "system") or of its rows (method "bernoulli"), or None if the dialect has no such clause for
+    the method.
+
+    The sample is repeatable given a seed, on dialects supporting one.
+    """
+    if not 0 < p <= 1:
+        raise ValueError("p must be a proportion greater than 0 and at most 1")
+    method = method.lower()
+    if method not in ("system", "bernoulli"):
+        raise ValueError('method must be "system" or "bernoulli"')
+    percent = 100 * p
+    dialect_name = dialect_name.lower()
+    if dialect_name in ("postgresql", "presto", "trino"):
+        clause = f"TABLESAMPLE {method.upper()} ({percent})"
+        if seed is not None and dialect_name == "postgresql":
+            clause += f" REPEATABLE ({int(seed)})"
+    elif dialect_name == "mssql":
+        if method != "system":
+            return None
+        clause = f"TABLESAMPLE SYSTEM ({percent} PERCENT)"
+        if seed is not None:
+            clause += f" REPEATABLE ({int(seed)})"
+    elif dialect_name == "bigquery":
+        if method != "system":
+            return None
+        clause = f"TABLESAMPLE SYSTEM ({percent} PERCENT)"
+    elif dialect_name == "snowflake":
+        clause = f"SAMPLE {method.upper()} ({percent})"
+        if seed is not None:
+            clause += f" SEED ({int(seed)})"
+    elif dialect_name == "oracle":
+        clause = (
+            f"SAMPLE BLOCK ({percent})" if method == "system" else f"SAMPLE ({percent})"
+        )
+        if seed is not None:
+            clause += f" SEED ({int(seed)})"
+    else:
+        return None
+    return clause
+
+
+# Aggregates that ignore NULL inputs, so that AGG(expr) over the rows matching a condition is equivalent to
+# AGG(CASE WHEN condition THEN expr END) over the whole selectable.
+_CONDITIONAL_AGGREGATE_FUNCTION_NAMES = {
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_samp",
+    "stdev",
+    "sum",
+}
+
+# Domain kwargs that only identify the selectable to scan (plus an optional row condition). Bundled metrics whose
+# compute domains differ only in their row condition can be computed in a single scan of that selectable.
+_SCAN_DOMAIN_KWARGS = {"batch_id", "table"}
+
+
+def _push_row_condition_into_aggregate(aggregate, condition):
+    """Rewrite AGG(expr) as AGG(CASE WHEN condition THEN expr END), so that the aggregate can be computed over an
+    unfiltered selectable. Returns None if the aggregate cannot be safely rewritten."""
+    if not isinstance(aggregate, sa.sql.functions.FunctionElement):
+        return None
+    function_name = getattr(aggregate, "name", "")
+    if function_name.lower() not in _CONDITIONAL_AGGREGATE_FUNCTION_NAMES:
+        return None
+    arguments = list(aggregate.clauses)
+    if len(arguments) != 1 or isinstance(arguments[0], sa.sql.elements.UnaryExpression):
+        # Multi-argument and DISTINCT aggregates are not rewritten
+        return None
+    argument = arguments[0]
+    if str(argument) == "*":
+        # COUNT(*) becomes COUNT(CASE WHEN condition THEN 1 END)
+        argument = sa.literal(1)
+    return getattr(sa.func, function_name)(sa.case([(condition, argument)]))
+
+
+def _contains_window_function(clause) -> bool:
+    return any(isinstance(element, Over) for element in iterate(clause, {}))
+
+
+class _WindowFunctionCompiler:
+    """Replaces the window functions of expressions by references to columns computing each distinct one once."""
+
+    WINDOW_COLUMN_PREFIX = "ge_window_"
+
+    def __init__(self):
+        # The name, rewritten window function and stage of each distinct window function, by compiled SQL
+        self.window_columns: Dict[Tuple, Tuple[str, Any, int]] = dict()
+
+    def rewrite(self, expression):
+        return replacement_traverse(expression, {}, self._replace)
+
+    def _replace(self, element):
+        if not isinstance(element, Over):
+            return None
+        # Window functions nested in this one (e.g. in its ORDER BY) are computed first
+        window_function = element._clone()
+        window_function._copy_internals(clone=lambda child, **kw: self.rewrite(child))
+        stages = {name: stage for name, _, stage in self.window_columns.values()}
+        nested_stages = [
+            stages[nested.name]
+            for nested in iterate(window_function, {})
+            if isinstance(nested, ColumnClause) and nested.name in stages
+        ]
+        if nested_stages:
+            stage = max(nested_stages) + 1
+        elif all(
+            spec is None
+            for spec in (
+                window_function.partition_by,
+                window_function.order_by,
+                window_function.range_,
+                window_function.rows,
+            )
+        ):
+            # An empty OVER clause sees the rows in the order they are read, so it is computed before any other
+            # window function reorders them
+            stage = 0
+        else:
+            stage = 1
+
+        compiled = window_function.compile()
+        key = (str(compiled), tuple(sorted(compiled.params.items(), key=repr)))
+        if key not in self.window_columns:
+            self.window_columns[key] = (
+                f"{self.WINDOW_COLUMN_PREFIX}{len(self.window_columns)}",
+                window_function,
+                stage,
+            )
+        return sa.column(self.window_columns[key][0])
+
+
+def compile_window_functions(expressions: List, selectable) -> Tuple[List, Any, int]:
+    """Rewrites expressions containing window functions, which can neither be aggregated nor filtered on directly, so
+    that they can be selected from (or filter) the returned selectable.
+
+    Each distinct window function (e.g. COUNT(*) OVER (PARTITION BY col)) is computed once, as a column of a CTE over
+    the selectable, and the expressions refer to that column instead, so that the conditions of many uniqueness checks
+    on a domain are evaluated in a single scan. Window functions with an empty OVER clause, which see
+    the rows in the order they are read, are computed in a first CTE, before the others (which may refer to them).
+
+    Returns:
+        The rewritten expressions, the selectable to select them from and the number of window columns it appends to
+        the columns of the original selectable (0, with the expressions and selectable unchanged, if there are no
+        window functions)
+    """
+    if not any(_contains_window_function(expression) for expression in expressions):
+        return expressions, selectable, 0
+    compiler = _WindowFunctionCompiler()
+    expressions = [compiler.rewrite(expression) for expression in expressions]
+
+    source = selectable.alias("ge_window_source")
+    source_name = "ge_window_source"
+    for stage in sorted({stage for _, _, stage in compiler.window_columns.values()}):
+        stage_name = f"ge_windowed_{stage}"
+        source = (
+            sa.select(
+                [sa.literal_column(f"{source_name}.*")]
+                + [
+                    window_function.label(name)
+                    for name, window_function, window_stage in compiler.window_columns.values()
+                    if window_stage == stage
+                ]
+            )
+            .select_from(source)
+            .cte(stage_name)
+        )
+        source_name = stage_name
+    return expressions, source, len(compiler.window_columns)
+
+
 class SqlAlchemyBatchData(object):
     """A class which represents a SQL alchemy batch, with properties including the construction of the batch itself
     and several getters used to access various properties."""
@@ -141,6 +340,8 @@ class SqlAlchemyBatchData(object):
         temp_table_name: str = None,
         temp_table_schema_name: str = None,
         use_quoted_name: bool = False,
+        session: SqlAlchemySession = None,
+        materialization: SqlAlchemyMaterialization = None,
     ):
         """A Constructor used to initialize and SqlAlchemy Batch, create an id for it, and verify that all necessary
         parameters have been provided. If a Query is given, also builds a temporary table for this query
@@ -171,6 +372,11 @@ class SqlAlchemyBatchData(object):
                     used if a temporary table is requested.
                 use_quoted_name (bool): \
                     If true, names should be quoted to preserve case sensitivity on databases that usually normalize them
+                session (SqlAlchemySession or None): \
+                    The session of the connection given as engine, if the batch is pinned to one; all queries on the
+                    batch (and its temporary table) are then run in that session
+                materialization (SqlAlchemyMaterialization or None): \
+                    The record of how the rows of the batch were materialized, if by a SqlAlchemyMaterializationManager
 
         The query that will be executed against the DB can be determined in any of three ways:
 
@@ -185,6 +391,8 @@ class SqlAlchemyBatchData(object):
 
         """
         self._engine = engine
+        self._session = session
+        self._materialization = materialization
         self._record_set_name = record_set_name or "great_expectations_sub_selection"
         if not isinstance(self._record_set_name, str):
             raise TypeError(
@@ -225,11 +433,7 @@ class SqlAlchemyBatchData(object):
             if temp_table_name:
                 generated_table_name = temp_table_name
             else:
-                # Suggestion: Pull this into a separate "_generate_temporary_table_name" method
-                generated_table_name = f"ge_tmp_{str(uuid.uuid4())[:8]}"
-                # mssql expects all temporary table names to have a prefix '#'
-                if engine.dialect.name.lower() == "mssql":
-                    generated_table_name = f"#{generated_table_name}"
+                generated_table_name = generate_temporary_table_name(engine.dialect)
                 if engine.dialect.name.lower() == "bigquery":
                     raise ValueError(
                         "No BigQuery dataset specified.  Include bigquery_temp_table in "
@@ -252,6 +456,9 @@ class SqlAlchemyBatchData(object):
         else:
             if query:
                 self._selectable = sa.text(query)
+            elif isinstance(selectable, sa.sql.expression.CTE):
+                # A CTE is already named; queries on the batch refer to it by name
+                self._selectable = selectable
             else:
                 self._selectable = selectable.alias(self._record_set_name)
 
@@ -264,6 +471,14 @@ class SqlAlchemyBatchData(object):
     def record_set_name(self):
         return self._record_set_name
 
+    @property
+    def session(self) -> Optional[SqlAlchemySession]:
+        return self._session
+
+    @property
+    def materialization(self) -> Optional[SqlAlchemyMaterialization]:
+        return self._materialization
+
     @property
     def selectable(self):
         return self._selectable
@@ -279,55 +494,38 @@ class SqlAlchemyBatchData(object):
         Create Temporary table based on sql query. This will be used as a basis for executing expectations.
         :param query:
         """
-        if self.sql_engine_dialect.name.lower() == "bigquery":
-            stmt = "CREATE OR REPLACE TABLE `{temp_table_name}` AS {query}".format(
-                temp_table_name=temp_table_name, query=query
-            )
-        elif self.sql_engine_dialect.name.lower() == "snowflake":
-            if temp_table_schema_name is not None:
-                temp_table_name = temp_table_schema_name + "." + temp_table_name
-            stmt = "CREATE OR REPLACE TEMPORARY TABLE {temp_table_name} AS {query}".format(
-                temp_table_name=temp_table_name, query=query
-            )
-        elif self.sql_engine_dialect.name == "mysql":
-            # Note: We can keep the "MySQL" clause separate for clarity, even though it is the same as the
-            # generic case.
-            stmt = "CREATE TEMPORARY TABLE {temp_table_name} AS {query}".format(
-                temp_table_name=temp_table_name, query=query
-            )
-        elif self.sql_engine_dialect.name == "mssql":
-            # Insert "into #{temp_table_name}" in the custom sql query right before the "from" clause
-            # Split is case sensitive so detect case.
-            # Note: transforming query to uppercase/lowercase has unintended consequences (i.e.,
-            # changing column names), so this is not an option!
-            query = query.string  # extracting string from MSSQLCompiler object
-            if "from" in query:
-                strsep = "from"
-            else:
-                strsep = "FROM"
-            querymod = query.split(strsep, maxsplit=1)
-            stmt = (querymod[0] + "into {temp_table_name} from" + querymod[1]).format(
-                temp_table_name=temp_table_name
-            )
+        stmt = get_create_temporary_table_statement(
+            self.sql_engine_dialect,
+            temp_table_name,
+            query,
+            temp_table_schema_name=temp_table_schema_name,
+        )
+        with self._session_lock():
+            self._engine.execute(stmt)
+
+    @contextlib.contextmanager
+    def _session_lock(self):
+        """Queries on a session are serialized; batches without one are free to query concurrently."""
+        if self._session is None:
+            yield
         else:
-            stmt = 'CREATE TEMPORARY TABLE "{temp_table_name}" AS {query}'.format(
-                temp_table_name=temp_table_name, query=query
-            )
-        self._engine.execute(stmt)
+            with self._session.lock:
+                yield
 
     def head(self, n=5, fetch_all=False):
         """Fetches the head of the table"""
 
-        if fetch_all:
-            result_object = self._engine.execute(
-                sa.select("*").select_from(self._selectable)
-            )
-        else:
-            result_object = self._engine.execute(
-                sa.select("*").limit(n).select_from(self._selectable)
-            )
+        with self._session_lock():
+            if fetch_all:
+                result_object = self._engine.execute(
+                    sa.select("*").select_from(self._selectable)
+                )
+            else:
+                result_object = self._engine.execute(
+                    sa.select("*").limit(n).select_from(self._selectable)
+                )
 
-        rows = result_object.fetchall()
+            rows = result_object.fetchall()
 
         # Note: Abe 20201119: This should be a GE type
         head_df = pd.DataFrame(rows, columns=result_object._metadata.keys)
@@ -337,10 +535,11 @@ class SqlAlchemyBatchData(object):
     def row_count(self):
         """Gets the number of rows"""
 
-        result_object = self._engine.execute(
-            sa.select([sa.func.count()]).select_from(self._selectable)
-        )
-        rows = result_object.fetchall()
+        with self._session_lock():
+            result_object = self._engine.execute(
+                sa.select([sa.func.count()]).select_from(self._selectable)
+            )
+            rows = result_object.fetchall()
 
         return rows[0][0]
 
@@ -355,6 +554,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string=None,
         url=None,
         batch_data_dict=None,
+        metric_cache=None,
+        max_batch_sessions=None,
+        max_concurrent_queries=None,
+        query_timeout=None,
+        materialization_strategy=None,
+        subselect_max_rows=None,
+        record_queries=None,
+        explain_queries=None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -381,8 +588,37 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                metric_cache (MetricCache or dict): \
+                    A MetricCache, or the config of one, in which to cache metric values computed on batches with
+                    a known fingerprint.
+                max_batch_sessions (int or None): \
+                    The number of dedicated connections (sessions) over which batches backed by temporary tables are
+                    spread; each batch is pinned to one, in which its temporary table is visible. Default 1.
+                max_concurrent_queries (int or None): \
+                    The maximum number of queries in flight at once when metrics are resolved concurrently. Queries
+                    on batches without a temporary table use the engine's connection pool (sized with the pool_size
+                    and max_overflow engine kwargs); those on the same session are serialized.
+                query_timeout (float or None): \
+                    The number of seconds after which a query is cancelled, raising a QueryTimeoutError.
+                materialization_strategy (str or None): \
+                    How the rows of batches are materialized unless their batch spec says otherwise: "temp_table"
+                    (the default), "cte", "subselect", or "auto" to use a subselect for batches the query planner
+                    estimates to hold at most subselect_max_rows rows, and a temporary table otherwise. Temporary
+                    tables are reused by batches of the same rows, and dropped when the engine is closed.
+                subselect_max_rows (int or None): \
+                    The largest estimated number of rows of a batch materialized as a subselect by the "auto"
+                    materialization strategy. Default 10000.
+                record_queries (bool or None): \
+                    If True, the queries run by each validation are recorded (with their SQL, the metrics they were
+                    run for, the rows they returned and their duration) by a QueryReportObserver of its own, whose
+                    report Validator.validate adds to the meta of the validation result as "query_report". Other
+                    observers can be added with add_query_observer.
+                explain_queries (bool or None): \
+                    If True, the recorded queries include their query plan, captured with EXPLAIN.
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)  # , **kwargs)
+        super().__init__(
+            name=name, batch_data_dict=batch_data_dict, metric_cache=metric_cache
+        )  # , **kwargs)
         self._name = name
 
         self._credentials = credentials
@@ -437,13 +673,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             self.dialect = None
 
-        if self.engine and self.engine.dialect.name.lower() in [
-            "sqlite",
-            "mssql",
-            "snowflake",
-        ]:
-            # sqlite/mssql temp tables only persist within a connection so override the engine
-            self.engine = self.engine.connect()
+        # Temporary tables only persist within a connection, so batches backed by one are pinned to a dedicated
+        # session, while other queries use the engine's connection pool
+        self._connection_manager = SqlAlchemyConnectionManager(
+            self.engine,
+            max_batch_sessions=max_batch_sessions,
+            max_concurrent_queries=max_concurrent_queries,
+            query_timeout=query_timeout,
+        )
+        self._materialization_manager = SqlAlchemyMaterializationManager(
+            self._connection_manager,
+            default_strategy=materialization_strategy,
+            subselect_max_rows=subselect_max_rows,
+        )
+        self._record_queries = bool(record_queries)
+        self._explain_queries = bool(explain_queries)
 
         # Send a connect event to provide dialect type
         if data_context is not None and getattr(
@@ -482,6 +726,83 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self):
         return self._url
 
+    @property
+    def connection_manager(self) -> SqlAlchemyConnectionManager:
+        return self._connection_manager
+
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Queries may only be issued concurrently when each thread can check out its own connection from the engine's
+        pool; a single shared Connection is not thread-safe."""
+        return self._connection_manager.supports_concurrent_queries
+
+    def get_connectable(
+        self, domain_kwargs: Optional[Dict] = None
+    ) -> ManagedConnectable:
+        """Returns the connectable through which to query the batch of the domain: its session, if it is pinned to
+        one (because its temporary table only exists there), and otherwise the connection pool.
+
+        Metrics query through the connectable rather than self.engine, so that their queries see the batch's
+        temporary table and are subject to the engine's limit on concurrent queries and query timeout.
+        """
+        batch_id = (domain_kwargs or {}).get("batch_id")
+        if batch_id is None:
+            batch_data = self.active_batch_data
+        else:
+            batch_data = self.loaded_batch_data_dict.get(batch_id)
+        session = getattr(batch_data, "session", None)
+        return ManagedConnectable(self._connection_manager, session=session)
+
+    def add_query_report_observer(self) -> Optional[QueryReportObserver]:
+        """If the engine was configured with record_queries, adds and returns a new QueryReportObserver, which records
+        the queries run until it is removed with remove_query_observer. Returns None otherwise.
+
+        Each validation records its queries with an observer of its own, so that the report of one validation does not
+        include the queries of those run before it. Queries run at the same time on the engine by another validation
+        are recorded as well.
+        """
+        if not self._record_queries:
+            return None
+        query_report_observer = QueryReportObserver(
+            capture_explain=self._explain_queries
+        )
+        self.add_query_observer(query_report_observer)
+        return query_report_observer
+
+    def add_query_observer(self, query_observer: QueryObserver) -> None:
+        """Reports each query the engine runs to the query observer (see QueryObserver)."""
+        self._connection_manager.add_query_observer(query_observer)
+
+    def remove_query_observer(self, query_observer: QueryObserver) -> None:
+        self._connection_manager.remove_query_observer(query_observer)
+
+    def resolve_metric_fn(
+        self,
+        metric_to_resolve: MetricConfiguration,
+        metric_fn: Callable,
+        metric_provider_kwargs: dict,
+    ) -> Any:
+        # Queries run by the metric function are reported as run for the metric
+        with attribute_queries_to_metrics([metric_to_resolve.id]):
+            return super().resolve_metric_fn(
+                metric_to_resolve, metric_fn, metric_provider_kwargs
+            )
+
+    @property
+    def materialization_manager(self) -> SqlAlchemyMaterializationManager:
+        return self._materialization_manager
+
+    def close(self) -> None:
+        """Drops the temporary tables of the batches loaded so far, and closes their sessions."""
+        self._materialization_manager.close()
+        self._connection_manager.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _build_engine(self, credentials, **kwargs) -> "sa.engine.Engine":
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -781,36 +1102,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         resolved_metrics = dict()
 
-        # We need a different query for each domain (where clause).
-        queries: Dict[Tuple, dict] = dict()
-        for (
-            metric_to_resolve,
-            engine_fn,
-            compute_domain_kwargs,
-            accessor_domain_kwargs,
-            metric_provider_kwargs,
-        ) in metric_fn_bundle:
-            if not isinstance(compute_domain_kwargs, IDDict):
-                compute_domain_kwargs = IDDict(compute_domain_kwargs)
-            domain_id = compute_domain_kwargs.to_id()
-            if domain_id not in queries:
-                queries[domain_id] = {
-                    "select": [],
-                    "ids": [],
-                    "domain_kwargs": compute_domain_kwargs,
-                }
-            queries[domain_id]["select"].append(
-                engine_fn.label(metric_to_resolve.metric_name)
-            )
-            queries[domain_id]["ids"].append(metric_to_resolve.id)
+        queries = self._plan_metric_bundle_queries(metric_fn_bundle)
         for query in queries.values():
             selectable, compute_domain_kwargs, _ = self.get_compute_domain(
                 query["domain_kwargs"], domain_type="identity"
             )
             assert len(query["select"]) == len(query["ids"])
-            res = self.engine.execute(
-                sa.select(query["select"]).select_from(selectable)
-            ).fetchall()
+            select, selectable, _ = compile_window_functions(
+                query["select"], selectable
+            )
+            with attribute_queries_to_metrics(query["ids"]):
+                res = (
+                    self.get_connectable(query["domain_kwargs"])
+                    .execute(sa.select(select).select_from(selectable))
+                    .fetchall()
+                )
             logger.debug(
                 f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
             )
@@ -826,6 +1132,101 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # Convert metrics to be serializable
         return resolved_metrics
 
+    def _plan_metric_bundle_queries(
+        self, metric_fn_bundle: Iterable[Tuple[MetricConfiguration, Any, dict, dict]],
+    ) -> Dict[Tuple, dict]:
+        """Group the metrics of a bundle into as few queries as possible.
+
+        Compute domains that differ only in their row_condition share one scan of the underlying selectable: each
+        domain's condition is pushed into its aggregates as a conditional aggregate (e.g.
+        SUM(CASE WHEN <condition> THEN ... END)). Domains that cannot be merged this way (other domain kwargs, other
+        condition parsers or aggregates that cannot be rewritten) get their own query, as before, as do aggregates of
+        window functions (see compile_window_functions), whose windows must only span the rows of their domain.
+
+        Returns:
+            A dictionary of queries, each with the labeled aggregates to "select", the metric "ids" they compute, the
+            "domain_kwargs" of the selectable to scan and the portion of the metric "bundle" it covers.
+        """
+        queries: Dict[Tuple, dict] = dict()
+        parsed_conditions: Dict[Tuple, Any] = dict()
+        for bundled_metric in metric_fn_bundle:
+            (
+                metric_to_resolve,
+                engine_fn,
+                compute_domain_kwargs,
+                accessor_domain_kwargs,
+                metric_provider_kwargs,
+            ) = bundled_metric
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            domain_id = compute_domain_kwargs.to_id()
+
+            query_id = ("domain", domain_id)
+            query_domain_kwargs = compute_domain_kwargs
+            aggregate = engine_fn
+            scan_domain_kwargs = self._get_scan_domain_kwargs(compute_domain_kwargs)
+            # Window functions must see only the rows of their own domain
+            if scan_domain_kwargs is not None and not _contains_window_function(
+                engine_fn
+            ):
+                if compute_domain_kwargs.get("row_condition") is not None:
+                    if domain_id not in parsed_conditions:
+                        parsed_conditions[domain_id] = parse_condition_to_sqlalchemy(
+                            compute_domain_kwargs["row_condition"]
+                        )
+                    aggregate = _push_row_condition_into_aggregate(
+                        engine_fn, parsed_conditions[domain_id]
+                    )
+                if aggregate is None:
+                    aggregate = engine_fn
+                else:
+                    query_id = ("scan", scan_domain_kwargs.to_id())
+                    query_domain_kwargs = scan_domain_kwargs
+
+            if query_id not in queries:
+                queries[query_id] = {
+                    "select": [],
+                    "ids": [],
+                    "domain_kwargs": query_domain_kwargs,
+                    "bundle": [],
+                }
+            queries[query_id]["select"].append(
+                aggregate.label(metric_to_resolve.metric_name)
+            )
+            queries[query_id]["ids"].append(metric_to_resolve.id)
+            queries[query_id]["bundle"].append(bundled_metric)
+        return queries
+
+    @staticmethod
+    def _get_scan_domain_kwargs(compute_domain_kwargs: IDDict) -> Optional[IDDict]:
+        """The domain kwargs of the selectable scanned for the given compute domain, or None if the compute domain is
+        not a (possibly row-conditioned) scan of a batch table."""
+        if not set(compute_domain_kwargs.keys()) <= _SCAN_DOMAIN_KWARGS | {
+            "row_condition",
+            "condition_parser",
+        }:
+            return None
+        if (
+            compute_domain_kwargs.get("row_condition") is not None
+            and compute_domain_kwargs.get("condition_parser")
+            != "great_expectations__experimental__"
+        ):
+            return None
+        return IDDict(
+            {
+                key: value
+                for key, value in compute_domain_kwargs.items()
+                if key in _SCAN_DOMAIN_KWARGS
+            }
+        )
+
+    def _partition_metric_fn_bundle(self, metric_fn_bundle: list) -> List[list]:
+        """Metrics that share a scan must be resolved together, so partition the bundle by planned query."""
+        return [
+            query["bundle"]
+            for query in self._plan_metric_bundle_queries(metric_fn_bundle).values()
+        ]
+
     ### Splitter methods for partitioning tables ###
 
     def _split_on_whole_table(
@@ -947,6 +1348,38 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             == hash_value
         )
 
+    def _sample_using_random_row_proportion(self, p: float = 0.1):
+        """Keep each row with probability p, on dialects whose random function returns values between 0 and 1 as well
+        as those (sqlite) returning integers"""
+        dialect_name = self.engine.dialect.name.lower()
+        if dialect_name == "sqlite":
+            return sa.func.abs(sa.func.random()) % 1000000 < int(p * 1000000)
+        if dialect_name in ("mysql", "bigquery"):
+            return sa.func.rand() < p
+        return sa.func.random() < p
+
+    def _sample_using_tablesample(
+        self, table_name: str, p: float = 0.1, method: str = "system", seed: int = None,
+    ):
+        """Sample proportion p of the rows of the table with the dialect's TABLESAMPLE (or SAMPLE) clause, which only
+        reads the sampled blocks (method "system") or rows (method "bernoulli") rather than filtering a full scan.
+
+        Dialects without such a clause fall back to keeping each row with probability p.
+        """
+        tablesample_clause = _get_tablesample_clause(
+            self.engine.dialect.name, p=p, method=method, seed=seed
+        )
+        if tablesample_clause is None:
+            logger.info(
+                f"{self.engine.dialect.name} has no {method} TABLESAMPLE clause; sampling rows with a random predicate"
+            )
+            return (
+                sa.select("*")
+                .select_from(sa.text(table_name))
+                .where(self._sample_using_random_row_proportion(p=p))
+            )
+        return sa.select("*").select_from(sa.text(f"{table_name} {tablesample_clause}"))
+
     def _build_selectable_from_batch_spec(self, batch_spec):
         table_name = batch_spec["table_name"]
         table_name: str = batch_spec["table_name"]
@@ -974,6 +1407,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     .limit(batch_spec["sampling_kwargs"]["n"])
                 )
 
+            elif batch_spec["sampling_method"] == "_sample_using_tablesample":
+                # Table sampling applies to the table read rather than filtering its rows
+                return self._sample_using_tablesample(
+                    table_name=table_name, **batch_spec.get("sampling_kwargs", {})
+                ).where(split_clause)
+
             else:
 
                 sampler_fn = getattr(self, batch_spec["sampling_method"])
@@ -988,6 +1427,44 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
         return sa.select("*").select_from(sa.text(table_name)).where(split_clause)
 
+    def get_sample_batch_data(
+        self,
+        batch_data: SqlAlchemyBatchData,
+        batch_spec: Optional[dict],
+        p: float,
+        seed: Optional[int] = None,
+    ) -> SqlAlchemyBatchData:
+        """Samples the rows of the table the batch was loaded from with _sample_using_tablesample, into a temporary
+        table so that every metric is computed on the same sample.
+
+        Rows rather than blocks are sampled, since the confidence intervals of approximate validation assume rows are
+        sampled independently of one another.
+        """
+        if (
+            batch_spec is None
+            or "table_name" not in batch_spec
+            or "sampling_method" in batch_spec
+        ):
+            raise NotImplementedError(
+                "Only batches of the (partitioned) rows of a table, without sampling, can be sampled"
+            )
+        sample_batch_spec = {
+            key: value
+            for key, value in batch_spec.items()
+            if key not in ("bigquery_temp_table", "create_temp_table")
+        }
+        sample_batch_spec.update(
+            {
+                "sampling_method": "_sample_using_tablesample",
+                "sampling_kwargs": {"p": p, "method": "bernoulli", "seed": seed},
+                "materialization_strategy": MaterializationStrategy.TEMP_TABLE.value,
+                # Without a seed, each sample is drawn anew
+                "reuse_materialization": seed is not None,
+            }
+        )
+        sample_batch_data, _ = self.get_batch_data_and_markers(sample_batch_spec)
+        return sample_batch_data
+
     def get_batch_data_and_markers(
         self, batch_spec
     ) -> Tuple[SqlAlchemyBatchData, BatchMarkers]:
@@ -997,9 +1474,26 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             temp_table_name = batch_spec.get("bigquery_temp_table")
         else:
             temp_table_name = None
-        batch_data = SqlAlchemyBatchData(
-            engine=self.engine, selectable=selectable, temp_table_name=temp_table_name
+        materialization = self._materialization_manager.materialize(
+            selectable, batch_spec, temp_table_name=temp_table_name
         )
+        if materialization.strategy == MaterializationStrategy.TEMP_TABLE:
+            # The temporary table is only visible to the session the batch is pinned to
+            batch_data = SqlAlchemyBatchData(
+                engine=materialization.session.connection,
+                table_name=materialization.table_name,
+                schema_name=materialization.schema_name,
+                session=materialization.session,
+                materialization=materialization,
+            )
+        else:
+            # A CTE or subquery can be run by any pooled connection
+            batch_data = SqlAlchemyBatchData(
+                engine=self.engine,
+                selectable=materialization.selectable,
+                create_temp_table=False,
+                materialization=materialization,
+            )
 
         batch_markers = BatchMarkers(
             {
@@ -0,0 +1,411 @@
+import datetime
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from enum import Enum
+from typing import Dict, List, Optional
+
+from great_expectations.execution_engine.sqlalchemy_connection_manager import (
+    SqlAlchemyConnectionManager,
+    SqlAlchemySession,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.schema import DropTable
+except ImportError:
+    sa = None
+    DropTable = None
+
+# Batches estimated to hold no more rows than this are validated through a subselect when the strategy is "auto"
+DEFAULT_SUBSELECT_MAX_ROWS = 10000
+
+# Batch spec keys that choose how a batch is materialized, rather than which rows it holds
+_MATERIALIZATION_BATCH_SPEC_KEYS = {
+    "create_temp_table",
+    "materialization_strategy",
+    "reuse_materialization",
+}
+
+
+class MaterializationStrategy(Enum):
+    TEMP_TABLE = "temp_table"
+    CTE = "cte"
+    SUBSELECT = "subselect"
+    AUTO = "auto"
+
+
+def get_create_temporary_table_statement(
+    dialect, temp_table_name: str, query, temp_table_schema_name: str = None
+) -> str:
+    """Returns the statement creating a temporary table holding the rows of the (compiled) query in the dialect."""
+    dialect_name = dialect.name.lower()
+    if dialect_name == "bigquery":
+        stmt = "CREATE OR REPLACE TABLE `{temp_table_name}` AS {query}".format(
+            temp_table_name=temp_table_name, query=query
+        )
+    elif dialect_name == "snowflake":
+        if temp_table_schema_name is not None:
+            temp_table_name = temp_table_schema_name + "." + temp_table_name
+        stmt = "CREATE OR REPLACE TEMPORARY TABLE {temp_table_name} AS {query}".format(
+            temp_table_name=temp_table_name, query=query
+        )
+    elif dialect_name == "mysql":
+        # Note: We can keep the "MySQL" clause separate for clarity, even though it is the same as the
+        # generic case.
+        stmt = "CREATE TEMPORARY TABLE {temp_table_name} AS {query}".format(
+            temp_table_name=temp_table_name, query=query
+        )
+    elif dialect_name == "mssql":
+        # Insert "into #{temp_table_name}" in the custom sql query right before the "from" clause
+        # Split is case sensitive so detect case.
+        # Note: transforming query to uppercase/lowercase has unintended consequences (i.e.,
+        # changing column names), so this is not an option!
+        query = query.string  # extracting string from MSSQLCompiler object
+        if "from" in query:
+            strsep = "from"
+        else:
+            strsep = "FROM"
+        querymod = query.split(strsep, maxsplit=1)
+        stmt = (querymod[0] + "into {temp_table_name} from" + querymod[1]).format(
+            temp_table_name=temp_table_name
+        )
+    else:
+        stmt = 'CREATE TEMPORARY TABLE "{temp_table_name}" AS {query}'.format(
+            temp_table_name=temp_table_name, query=query
+        )
+    return stmt
+
+
+def generate_temporary_table_name(dialect) -> str:
+    temp_table_name = f"ge_tmp_{str(uuid.uuid4())[:8]}"
+    # mssql expects all temporary table names to have a prefix '#'
+    if dialect.name.lower() == "mssql":
+        temp_table_name = f"#{temp_table_name}"
+    return temp_table_name
+
+
+class SqlAlchemyMaterialization:
+    """How the rows of a batch were made available to validation: as a temporary table (in a batch session), a CTE or
+    a subselect, and what it cost to materialize them."""
+
+    def __init__(
+        self,
+        strategy: MaterializationStrategy,
+        selectable=None,
+        key: str = None,
+        table_name: str = None,
+        schema_name: str = None,
+        session: SqlAlchemySession = None,
+        owns_table: bool = True,
+        estimated_row_count: Optional[int] = None,
+        materialization_seconds: float = 0.0,
+    ):
+        self._strategy = strategy
+        self._selectable = selectable
+        self._key = key
+        self._table_name = table_name
+        self._schema_name = schema_name
+        self._session = session
+        self._owns_table = owns_table
+        self._estimated_row_count = estimated_row_count
+        self._materialization_seconds = materialization_seconds
+        self._created_at = datetime.datetime.now(datetime.timezone.utc)
+        self._reuse_count = 0
+        self._dropped = False
+
+    @property
+    def strategy(self) -> MaterializationStrategy:
+        return self._strategy
+
+    @property
+    def selectable(self):
+        """The CTE or subselect of the batch (None for temporary tables, which are queried by name)."""
+        return self._selectable
+
+    @property
+    def key(self) -> Optional[str]:
+        return self._key
+
+    @property
+    def table_name(self) -> Optional[str]:
+        return self._table_name
+
+    @property
+    def schema_name(self) -> Optional[str]:
+        return self._schema_name
+
+    @property
+    def session(self) -> Optional[SqlAlchemySession]:
+        return self._session
+
+    @property
+    def estimated_row_count(self) -> Optional[int]:
+        return self._estimated_row_count
+
+    @property
+    def materialization_seconds(self) -> float:
+        """The time spent creating the temporary table (or estimating the size of the batch)."""
+        return self._materialization_seconds
+
+    @property
+    def reuse_count(self) -> int:
+        """The number of batches, beyond the first, validated against this temporary table."""
+        return self._reuse_count
+
+    @property
+    def dropped(self) -> bool:
+        return self._dropped
+
+    def to_json_dict(self) -> dict:
+        return {
+            "strategy": self._strategy.value,
+            "table_name": self._table_name,
+            "schema_name": self._schema_name,
+            "estimated_row_count": self._estimated_row_count,
+            "materialization_seconds": self._materialization_seconds,
+            "created_at": self._created_at.strftime("%Y%m%dT%H%M%S.%fZ"),
+            "reuse_count": self._reuse_count,
+            "dropped": self._dropped,
+        }
+
+
+class SqlAlchemyMaterializationManager:
+    """Materializes the batches of a SqlAlchemyExecutionEngine, choosing between a temporary table, a CTE and a
+    subselect, and keeps track of the temporary tables it creates:
+
+      - temporary tables are keyed by a hash of the compiled selectable and the batch spec, so that validators (and
+        checkpoint runs) loading the same batch from the same engine reuse the table rather than copying the rows
+        again; set reuse_materialization to False in the batch spec to materialize afresh
+      - the "auto" strategy estimates the number of rows of the batch (from the query plan, where the dialect offers
+        one) and validates batches of at most subselect_max_rows rows through a subselect, sparing the write; batches
+        of unknown size get a temporary table
+      - close drops every temporary table it created, in the session that created it, since connections returned to
+        the pool would otherwise keep them
+    """
+
+    def __init__(
+        self,
+        connection_manager: SqlAlchemyConnectionManager,
+        default_strategy: Optional[str] = None,
+        subselect_max_rows: Optional[int] = None,
+    ):
+        self._connection_manager = connection_manager
+        self._default_strategy = MaterializationStrategy(
+            default_strategy or MaterializationStrategy.TEMP_TABLE.value
+        )
+        self._subselect_max_rows = (
+            subselect_max_rows
+            if subselect_max_rows is not None
+            else DEFAULT_SUBSELECT_MAX_ROWS
+        )
+        self._temp_tables: Dict[str, SqlAlchemyMaterialization] = {}
+        self._materializations: List[SqlAlchemyMaterialization] = []
+        self._lock = threading.Lock()
+
+    @property
+    def default_strategy(self) -> MaterializationStrategy:
+        return self._default_strategy
+
+    @property
+    def materializations(self) -> List[SqlAlchemyMaterialization]:
+        """Every materialization made, in order, with its cost."""
+        return list(self._materializations)
+
+    def get_strategy(self, batch_spec: dict) -> MaterializationStrategy:
+        """Returns the strategy requested by the batch spec (where create_temp_table=False means a subselect), or the
+        default one."""
+        if batch_spec.get("materialization_strategy") is not None:
+            return MaterializationStrategy(batch_spec["materialization_strategy"])
+        if not batch_spec.get("create_temp_table", True):
+            return MaterializationStrategy.SUBSELECT
+        return self._default_strategy
+
+    def get_materialization_key(self, query, batch_spec: dict) -> str:
+        """Returns the key of a temporary table holding the rows of the compiled query for the batch spec."""
+        batch_spec_dict = {
+            key: value
+            for key, value in batch_spec.items()
+            if key not in _MATERIALIZATION_BATCH_SPEC_KEYS
+        }
+        return hashlib.md5(
+            (
+                str(query) + json.dumps(batch_spec_dict, sort_keys=True, default=str)
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def materialize(
+        self,
+        selectable,
+        batch_spec: dict,
+        record_set_name: str = "great_expectations_sub_selection",
+        temp_table_name: str = None,
+        temp_table_schema_name: str = None,
+    ) -> SqlAlchemyMaterialization:
+        """Materializes the rows of the selectable for a batch, reusing a temporary table of the same rows if there
+        is one."""
+        strategy = self.get_strategy(batch_spec)
+        estimated_row_count = None
+        start = time.perf_counter()
+        if strategy == MaterializationStrategy.AUTO:
+            estimated_row_count = self.estimate_row_count(selectable)
+            if (
+                estimated_row_count is not None
+                and estimated_row_count <= self._subselect_max_rows
+            ):
+                strategy = MaterializationStrategy.SUBSELECT
+            else:
+                strategy = MaterializationStrategy.TEMP_TABLE
+
+        if strategy == MaterializationStrategy.CTE:
+            materialization = SqlAlchemyMaterialization(
+                strategy,
+                selectable=selectable.cte(record_set_name),
+                estimated_row_count=estimated_row_count,
+                materialization_seconds=time.perf_counter() - start,
+            )
+        elif strategy == MaterializationStrategy.SUBSELECT:
+            materialization = SqlAlchemyMaterialization(
+                strategy,
+                selectable=selectable.alias(record_set_name),
+                estimated_row_count=estimated_row_count,
+                materialization_seconds=time.perf_counter() - start,
+            )
+        else:
+            return self._materialize_temp_table(
+                selectable,
+                batch_spec,
+                temp_table_name=temp_table_name,
+                temp_table_schema_name=temp_table_schema_name,
+                estimated_row_count=estimated_row_count,
+                start=start,
+            )
+        with self._lock:
+            self._materializations.append(materialization)
+        return materialization
+
+    def _materialize_temp_table(
+        self,
+        selectable,
+        batch_spec: dict,
+        temp_table_name: Optional[str],
+        temp_table_schema_name: Optional[str],
+        estimated_row_count: Optional[int],
+        start: float,
+    ) -> SqlAlchemyMaterialization:
+        dialect = self._connection_manager.engine.dialect
+        # compile selectable to sql statement
+        query = selectable.compile(
+            dialect=dialect, compile_kwargs={"literal_binds": True},
+        )
+        key = self.get_materialization_key(query, batch_spec)
+        with self._lock:
+            materialization = self._temp_tables.get(key)
+            if materialization is not None and batch_spec.get(
+                "reuse_materialization", True
+            ):
+                materialization.session.pin_batch()
+                materialization._reuse_count += 1
+                logger.debug(
+                    f"Reusing temporary table {materialization.table_name} for batch"
+                )
+                return materialization
+
+        owns_table = temp_table_name is None
+        if owns_table:
+            if dialect.name.lower() == "bigquery":
+                raise ValueError(
+                    "No BigQuery dataset specified.  Include bigquery_temp_table in "
+                    "batch_spec_passthrough or a specify a default dataset in engine url"
+                )
+            temp_table_name = generate_temporary_table_name(dialect)
+        # The temporary table is created in, and only visible to, the session the batch is pinned to
+        session = self._connection_manager.open_batch_session()
+        stmt = get_create_temporary_table_statement(
+            dialect,
+            temp_table_name,
+            query,
+            temp_table_schema_name=temp_table_schema_name,
+        )
+        with self._connection_manager.connect(session=session) as connection:
+            connection.execute(stmt)
+        materialization = SqlAlchemyMaterialization(
+            MaterializationStrategy.TEMP_TABLE,
+            key=key,
+            table_name=temp_table_name,
+            schema_name=temp_table_schema_name,
+            session=session,
+            owns_table=owns_table,
+            estimated_row_count=estimated_row_count,
+            materialization_seconds=time.perf_counter() - start,
+        )
+        logger.debug(
+            f"Materialized batch as temporary table {temp_table_name} in "
+            f"{materialization.materialization_seconds:.3f} seconds"
+        )
+        with self._lock:
+            # A fresh copy of the rows replaces any previous one for reuse, which stays until close
+            self._temp_tables[key] = materialization
+            self._materializations.append(materialization)
+        return materialization
+
+    def estimate_row_count(self, selectable) -> Optional[int]:
+        """Returns the number of rows of the selectable estimated by the query planner, or None if the dialect offers
+        no estimate."""
+        dialect = self._connection_manager.engine.dialect
+        if dialect.name.lower() != "postgresql":
+            return None
+        query = selectable.compile(
+            dialect=dialect, compile_kwargs={"literal_binds": True}
+        )
+        try:
+            plan = self._connection_manager.execute(
+                sa.text(f"EXPLAIN (FORMAT JSON) {query}")
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.debug(f"Unable to estimate the number of rows of the batch: {e}")
+            return None
+
+    def drop(self, materialization: SqlAlchemyMaterialization) -> None:
+        """Drops the temporary table of the materialization, if it was created by this manager."""
+        if (
+            materialization.strategy != MaterializationStrategy.TEMP_TABLE
+            or materialization.dropped
+            or not materialization._owns_table
+        ):
+            return
+        with self._lock:
+            if self._temp_tables.get(materialization.key) is materialization:
+                del self._temp_tables[materialization.key]
+        # Mark the table dropped first, so that a failure to drop it is not retried
+        materialization._dropped = True
+        try:
+            with self._connection_manager.connect(
+                session=materialization.session
+            ) as connection:
+                connection.execute(
+                    DropTable(
+                        sa.Table(
+                            materialization.table_name,
+                            sa.MetaData(),
+                            schema=materialization.schema_name,
+                        )
+                    )
+                )
+        except Exception as e:
+            logger.warning(
+                f"Unable to drop temporary table {materialization.table_name}: {e}"
+            )
+
+    def close(self) -> None:
+        """Drops every temporary table created by this manager."""
+        for materialization in self.materializations:
+            self.drop(materialization)
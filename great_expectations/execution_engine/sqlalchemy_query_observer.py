@@ -0,0 +1,220 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from great_expectations.core.util import convert_to_json_serializable
+
+logger = logging.getLogger(__name__)
+
+try:
+    from opentelemetry import trace as opentelemetry_trace
+except ImportError:
+    opentelemetry_trace = None
+
+# The ids of the metrics whose computation is running on each thread, to which its queries are attributed
+_metric_attribution = threading.local()
+
+
+@contextmanager
+def attribute_queries_to_metrics(metric_ids: Iterable[Tuple]):
+    """Attributes the queries run on this thread, until the context exits, to the given metrics."""
+    previous_metric_ids = getattr(_metric_attribution, "metric_ids", tuple())
+    _metric_attribution.metric_ids = tuple(metric_ids)
+    try:
+        yield
+    finally:
+        _metric_attribution.metric_ids = previous_metric_ids
+
+
+def get_attributed_metric_ids() -> Tuple[Tuple, ...]:
+    """Returns the ids of the metrics to which queries run on this thread are currently attributed."""
+    return getattr(_metric_attribution, "metric_ids", tuple())
+
+
+class QueryRecord:
+    """A query run by a SqlAlchemyExecutionEngine: its compiled SQL, the metrics it was run for, the rows it returned
+    and how long it took (including fetching its rows, for queries whose rows are fetched at once)."""
+
+    def __init__(
+        self,
+        sql: str,
+        parameters=None,
+        metric_ids: Tuple[Tuple, ...] = tuple(),
+        rows: Optional[int] = None,
+        start_time: float = None,
+        seconds: float = 0.0,
+        dialect: str = None,
+        explain: Optional[str] = None,
+    ):
+        self.sql = sql
+        self.parameters = parameters
+        self.metric_ids = metric_ids
+        self.rows = rows
+        self.start_time = start_time if start_time is not None else time.time()
+        self.seconds = seconds
+        self.dialect = dialect
+        self.explain = explain
+
+    def to_json_dict(self) -> dict:
+        return {
+            "sql": self.sql,
+            "parameters": repr(self.parameters) if self.parameters else None,
+            "metric_ids": convert_to_json_serializable(list(self.metric_ids)),
+            "rows": self.rows,
+            "start_time": self.start_time,
+            "seconds": self.seconds,
+            "dialect": self.dialect,
+            "explain": self.explain,
+        }
+
+
+class QueryObserver:
+    """Observes the queries run by a SqlAlchemyExecutionEngine (see SqlAlchemyExecutionEngine.add_query_observer).
+
+    on_query is called, on the thread that ran the query, with a QueryRecord of each query. If capture_explain is
+    True, the query plan of each query whose rows are fetched at once is captured with EXPLAIN (on dialects that have
+    it) and included in its record.
+    """
+
+    def __init__(self, capture_explain: bool = False):
+        self._capture_explain = capture_explain
+
+    @property
+    def capture_explain(self) -> bool:
+        return self._capture_explain
+
+    def on_query(self, record: QueryRecord) -> None:
+        raise NotImplementedError
+
+
+class QueryReportObserver(QueryObserver):
+    """Collects the records of the queries run, and summarizes them by metric and by expectation in a report."""
+
+    def __init__(self, capture_explain: bool = False):
+        super().__init__(capture_explain=capture_explain)
+        self._records: List[QueryRecord] = []
+        self._lock = threading.Lock()
+
+    @property
+    def records(self) -> List[QueryRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def on_query(self, record: QueryRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records = []
+
+    def get_report(
+        self, expectation_metric_ids: Optional[List[Tuple[dict, set]]] = None
+    ) -> dict:
+        """Returns a JSON-serializable report of the queries recorded, summarized by metric and, given pairs of
+        expectation configurations (as JSON dicts) and the ids of the metrics they depend on, by expectation.
+
+        A query run for metrics several expectations depend on counts towards each of them.
+        """
+        records = self.records
+        metrics: Dict[Tuple, dict] = {}
+        for record in records:
+            for metric_id in record.metric_ids:
+                summary = metrics.setdefault(
+                    metric_id,
+                    {
+                        "metric_id": convert_to_json_serializable(metric_id),
+                        "query_count": 0,
+                        "seconds": 0.0,
+                    },
+                )
+                summary["query_count"] += 1
+                summary["seconds"] += record.seconds
+
+        report = {
+            "query_count": len(records),
+            "seconds": sum(record.seconds for record in records),
+            "queries": [record.to_json_dict() for record in records],
+            "metrics": list(metrics.values()),
+        }
+        if expectation_metric_ids is not None:
+            expectations = []
+            for expectation_configuration, metric_ids in expectation_metric_ids:
+                expectation_records = [
+                    record
+                    for record in records
+                    if any(metric_id in metric_ids for metric_id in record.metric_ids)
+                ]
+                expectations.append(
+                    {
+                        "expectation_configuration": expectation_configuration,
+                        "query_count": len(expectation_records),
+                        "seconds": sum(
+                            record.seconds for record in expectation_records
+                        ),
+                    }
+                )
+            report["expectations"] = expectations
+        return report
+
+
+class QuerySpanObserver(QueryObserver):
+    """Emits an OpenTelemetry span for each query, with the attributes of the OpenTelemetry database semantic
+    conventions (db.system, db.statement) and the ids of the metrics the query was run for.
+
+    Spans are emitted through the given tracer, or that of the globally configured tracer provider if the
+    opentelemetry-api package is installed. Without it, spans are kept as dicts of the same shape in the spans
+    property.
+    """
+
+    SPAN_NAME = "great_expectations.query"
+
+    def __init__(self, tracer=None, capture_explain: bool = False):
+        super().__init__(capture_explain=capture_explain)
+        if tracer is None and opentelemetry_trace is not None:
+            tracer = opentelemetry_trace.get_tracer(__name__)
+        self._tracer = tracer
+        self._spans: List[dict] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> List[dict]:
+        with self._lock:
+            return list(self._spans)
+
+    @staticmethod
+    def get_span_attributes(record: QueryRecord) -> dict:
+        attributes = {
+            "db.system": record.dialect,
+            "db.statement": record.sql,
+            "great_expectations.metric_ids": [
+                str(metric_id) for metric_id in record.metric_ids
+            ],
+        }
+        if record.rows is not None:
+            attributes["db.rows"] = record.rows
+        if record.explain is not None:
+            attributes["db.explain"] = record.explain
+        return attributes
+
+    def on_query(self, record: QueryRecord) -> None:
+        attributes = self.get_span_attributes(record)
+        start_time_ns = int(record.start_time * 1e9)
+        end_time_ns = start_time_ns + int(record.seconds * 1e9)
+        if self._tracer is not None:
+            span = self._tracer.start_span(
+                self.SPAN_NAME, start_time=start_time_ns, attributes=attributes
+            )
+            span.end(end_time=end_time_ns)
+            return
+        with self._lock:
+            self._spans.append(
+                {
+                    "name": self.SPAN_NAME,
+                    "start_time": start_time_ns,
+                    "end_time": end_time_ns,
+                    "attributes": attributes,
+                }
+            )
@@ -6,6 +6,7 @@ import pandas as pd
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from ...render.renderer.renderer import renderer
 from ...render.types import RenderedStringTemplateContent
@@ -41,6 +42,10 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnExpectation):
                 ties_okay (boolean or None): \
                     If True, then the expectation will still succeed if values outside the designated set are as common \
                     (but not more common) than designated values
+                approximate (boolean): \
+                    If True, then only the len(value_set) + 1 most common values are fetched (with a bounded \
+                    Space-Saving sketch on chunked pandas batches) rather than counting every value, so values tied \
+                    for most common beyond those are not seen
 
             Other Parameters:
                 result_format (str or None): \
@@ -81,12 +86,14 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnExpectation):
     success_keys = (
         "value_set",
         "ties_okay",
+        "approximate",
     )
 
     # Default values
     default_kwarg_values = {
         "value_set": None,
         "ties_okay": None,
+        "approximate": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -172,6 +179,27 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnExpectation):
             )
         ]
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        success_kwargs = self.get_success_kwargs(configuration)
+        if success_kwargs.get("approximate"):
+            most_common_value = dependencies["metrics"].pop("column.most_common_value")
+            # One more value than the value set holds is enough to tell whether a value outside of it is as common
+            value_set = success_kwargs.get("value_set") or []
+            dependencies["metrics"]["column.value_counts.top_k"] = MetricConfiguration(
+                "column.value_counts.top_k",
+                most_common_value.metric_domain_kwargs,
+                {"k": len(value_set) + 1},
+            )
+        return dependencies
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
@@ -179,7 +207,13 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
-        most_common_value = metrics.get("column.most_common_value")
+        if self.get_success_kwargs(configuration).get("approximate"):
+            top_k_value_counts = metrics.get("column.value_counts.top_k")
+            most_common_value = list(
+                top_k_value_counts[top_k_value_counts == top_k_value_counts.max()].index
+            )
+        else:
+            most_common_value = metrics.get("column.most_common_value")
         value_set = configuration.kwargs.get("value_set") or []
         expected_value_set = set(value_set)
         ties_okay = configuration.kwargs.get("ties_okay")
@@ -47,6 +47,10 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean):
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        approximate (boolean):
+            If True, the number of unique values is estimated with a HyperLogLog sketch (or the database's approximate \
+            distinct count) rather than counted exactly, which avoids collecting the distinct values of high \
+            cardinality columns, default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -89,7 +93,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.unique_proportion",)
-    success_keys = ("min_value", "strict_min", "max_value", "strict_max")
+    success_keys = ("min_value", "strict_min", "max_value", "strict_max", "approximate")
 
     # Default values
     default_kwarg_values = {
@@ -97,6 +101,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "approximate": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
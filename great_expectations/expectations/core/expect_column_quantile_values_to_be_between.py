@@ -3,6 +3,7 @@ from typing import Dict, Optional
 import numpy as np
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.quantile_sketch import get_quantile_sketch_relative_error
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.expectations.expectation import (
@@ -158,10 +159,8 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
         else:
             allow_relative_error = False
 
-        if allow_relative_error is not False:
-            raise ValueError(
-                "PandasExecutionEngine does not support relative error in column quantiles."
-            )
+        # Raises a ValueError unless allow_relative_error is a boolean or a number between 0 and 1
+        get_quantile_sketch_relative_error(allow_relative_error)
 
         if len(quantiles) != len(quantile_value_ranges):
             raise ValueError(
@@ -6,6 +6,7 @@ import pandas as pd
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from ...render.renderer.renderer import renderer
 from ...render.types import RenderedStringTemplateContent
@@ -41,6 +42,12 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
                 max_value (int or None): \
                     The maximum number of unique values allowed.
 
+            Keyword Args:
+                approximate (boolean): \
+                    If True, the number of unique values is estimated with a HyperLogLog sketch (or the database's \
+                    approximate distinct count) rather than counted exactly, which avoids collecting the distinct \
+                    values of high cardinality columns.
+
             Other Parameters:
                 result_format (str or None): \
                     Which output mode to use: `BOOLEAN_ONLY`, `BASIC`, `COMPLETE`, or `SUMMARY`.
@@ -85,6 +92,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "approximate",
     )
 
     # Default values
@@ -93,6 +101,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "condition_parser": None,
         "min_value": None,
         "max_value": None,
+        "approximate": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -222,6 +231,27 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         else:
             return [template_string_object, "%.1f%%" % (100 * observed_value)]
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        if self.get_success_kwargs(configuration).get("approximate"):
+            distinct_values_count = dependencies["metrics"].pop(
+                "column.distinct_values.count"
+            )
+            dependencies["metrics"][
+                "column.distinct_values.count.approx"
+            ] = MetricConfiguration(
+                "column.distinct_values.count.approx",
+                distinct_values_count.metric_domain_kwargs,
+            )
+        return dependencies
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
@@ -229,8 +259,12 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
+        if self.get_success_kwargs(configuration).get("approximate"):
+            metric_name = "column.distinct_values.count.approx"
+        else:
+            metric_name = "column.distinct_values.count"
         return self._validate_metric_value_between(
-            metric_name="column.distinct_values.count",
+            metric_name=metric_name,
             configuration=configuration,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
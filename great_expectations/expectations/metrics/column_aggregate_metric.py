@@ -127,7 +127,9 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                     compute_domain_kwargs, domain_type=domain_type
                 )
                 column_name = accessor_domain_kwargs["column"]
-                sqlalchemy_engine = execution_engine.engine
+                sqlalchemy_engine = execution_engine.get_connectable(
+                    compute_domain_kwargs
+                )
                 dialect = sqlalchemy_engine.dialect
                 metric_aggregate = metric_fn(
                     cls,
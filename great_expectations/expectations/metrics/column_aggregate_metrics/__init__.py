@@ -1,8 +1,12 @@
-from .column_distinct_values import ColumnDistinctValues, ColumnDistinctValuesCount
+from .column_distinct_values import (
+    ColumnDistinctValues,
+    ColumnDistinctValuesCount,
+    ColumnDistinctValuesCountApprox,
+)
 from .column_histogram import ColumnHistogram
 from .column_max import ColumnMax
 from .column_mean import ColumnMean
-from .column_median import ColumnMedian
+from .column_median import ColumnMedian, ColumnMedianAggregate
 from .column_min import ColumnMin
 from .column_most_common_value import ColumnMostCommonValue
 from .column_parameterized_distribution_ks_test_p_value import (
@@ -13,5 +17,5 @@ from .column_proportion_of_unique_values import ColumnUniqueProportion
 from .column_quantile_values import ColumnQuantileValues
 from .column_standard_deviation import ColumnStandardDeviation
 from .column_sum import ColumnSum
-from .column_value_counts import ColumnValueCounts
+from .column_value_counts import ColumnValueCounts, ColumnValueCountsTopK
 from .column_values_between_count import ColumnValuesBetweenCount
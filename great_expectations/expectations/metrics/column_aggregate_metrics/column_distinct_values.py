@@ -1,6 +1,10 @@
 from typing import Any, Dict, Optional, Tuple
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.hyperloglog import (
+    DEFAULT_HYPERLOGLOG_PRECISION,
+    HyperLogLog,
+)
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -11,8 +15,10 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -143,3 +149,56 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
             )
 
         return dependencies
+
+
+class ColumnDistinctValuesCountApprox(ColumnMetricProvider):
+    """The approximate number of distinct values in a column, estimated with a HyperLogLog sketch (or the database's
+    own approximate distinct count) rather than by collecting the distinct values."""
+
+    metric_name = "column.distinct_values.count.approx"
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        sketch = HyperLogLog()
+        sketch.update(column)
+        return sketch.count()
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, _dialect, _column_name, **kwargs):
+        dialect_name = _dialect.name.lower()
+        if dialect_name in _APPROX_COUNT_DISTINCT_AGGREGATES_BY_DIALECT:
+            return _APPROX_COUNT_DISTINCT_AGGREGATES_BY_DIALECT[dialect_name](
+                column, _dialect, _column_name
+            )
+        # Without an approximate distinct count, the exact count is still computed without moving values out of the
+        # database
+        return sa.func.count(sa.distinct(column))
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    def _spark(cls, column, **kwargs):
+        return F.approx_count_distinct(
+            column,
+            rsd=HyperLogLog(DEFAULT_HYPERLOGLOG_PRECISION).relative_standard_error,
+        )
+
+
+def _get_redshift_approx_count_distinct(column, dialect, column_name):
+    quoted_column_name = dialect.identifier_preparer.quote(column_name)
+    return sa.literal_column(f"APPROXIMATE COUNT(DISTINCT {quoted_column_name})")
+
+
+# The aggregate estimating the number of distinct values in each dialect that has one
+_APPROX_COUNT_DISTINCT_AGGREGATES_BY_DIALECT = {
+    "snowflake": lambda column, dialect, column_name: sa.func.approx_count_distinct(
+        column
+    ),
+    "bigquery": lambda column, dialect, column_name: sa.func.approx_count_distinct(
+        column
+    ),
+    "oracle": lambda column, dialect, column_name: sa.func.approx_count_distinct(
+        column
+    ),
+    "awsathena": lambda column, dialect, column_name: sa.func.approx_distinct(column),
+    "presto": lambda column, dialect, column_name: sa.func.approx_distinct(column),
+    "redshift": _get_redshift_approx_count_distinct,
+}
@@ -1,8 +1,9 @@
 import copy
 import logging
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
+import pandas as pd
 
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine import (
@@ -40,8 +41,19 @@ class ColumnHistogram(ColumnMetricProvider):
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
         )
         column = accessor_domain_kwargs["column"]
-        bins = metric_value_kwargs["bins"]
-        hist, bin_edges = np.histogram(df[column], bins, density=False)
+        bins = np.asarray(metric_value_kwargs["bins"], dtype=float)
+        values = df[column].to_numpy()
+        if values.dtype.kind not in "iuf":
+            values = values[pd.notnull(values)].astype(float)
+
+        # Bin i holds bins[i] <= value < bins[i + 1], except the last, which also holds values equal to its upper
+        # edge; null values and values outside of the bins (which searchsorted places at either end) are not counted
+        bucket_indices = np.searchsorted(bins, values, side="right") - 1
+        bucket_indices[values == bins[-1]] = len(bins) - 2
+        bucket_indices = bucket_indices[
+            (bucket_indices >= 0) & (bucket_indices < len(bins) - 1)
+        ]
+        hist = np.bincount(bucket_indices, minlength=len(bins) - 1)
         return list(hist)
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -62,98 +74,42 @@ class ColumnHistogram(ColumnMetricProvider):
         selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
         )
-        column = accessor_domain_kwargs["column"]
-        bins = metric_value_kwargs["bins"]
-
-        case_conditions = []
-        idx = 0
-        if isinstance(bins, np.ndarray):
-            bins = bins.tolist()
-        else:
-            bins = list(bins)
-
-        # If we have an infinte lower bound, don't express that in sql
-        if (
-            bins[0]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_np", negative=True
-            )
-        ) or (
-            bins[0]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_cast", negative=True
-            )
-        ):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case([(sa.column(column) < bins[idx + 1], 1)], else_=0)
-                ).label("bin_" + str(idx))
-            )
-            idx += 1
-
-        for idx in range(idx, len(bins) - 2):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    bins[idx] <= sa.column(column),
-                                    sa.column(column) < bins[idx + 1],
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("bin_" + str(idx))
-            )
-
-        if (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_np", negative=False
-            )
-        ) or (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_cast", negative=False
-            )
-        ):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case([(bins[-2] <= sa.column(column), 1)], else_=0)
-                ).label("bin_" + str(len(bins) - 1))
-            )
-        else:
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    bins[-2] <= sa.column(column),
-                                    sa.column(column) <= bins[-1],
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("bin_" + str(len(bins) - 1))
-            )
-
-        query = (
-            sa.select(case_conditions)
-            .where(sa.column(column) != None,)
+        column = sa.column(accessor_domain_kwargs["column"])
+        bins = [float(edge) for edge in metric_value_kwargs["bins"]]
+        n_bins = len(bins) - 1
+
+        # Values outside of the bins are not counted; the last bin includes its upper edge. Infinite outer edges are
+        # not expressed in sql: those bins are open-ended
+        conditions = [column != None]
+        if not _is_infinite_edge(bins[0], negative=True):
+            conditions.append(column >= bins[0])
+        if not _is_infinite_edge(bins[-1]):
+            conditions.append(column <= bins[-1])
+
+        # Values are compared with the bin edges themselves, even for uniform bins, since computing the bin of a value
+        # arithmetically from the bin width misplaces values on the inner edges through floating point rounding
+        bucket = _get_binary_search_bucket_expression(column, bins, 0, n_bins - 1)
+
+        # Grouping on the bucket of a subquery, rather than on the expression itself, keeps databases that compare
+        # the GROUP BY and SELECT expressions textually (e.g. mssql, whose bound parameters differ) happy
+        buckets = (
+            sa.select([bucket.label("bucket")])
             .select_from(selectable)
+            .where(sa.and_(*conditions))
+            .alias("buckets")
         )
+        query = sa.select(
+            [buckets.c.bucket, sa.func.count().label("bucket_count")]
+        ).group_by(buckets.c.bucket)
+
+        # Only buckets that hold values are returned
+        hist = [0] * n_bins
+        connectable = execution_engine.get_connectable(metric_domain_kwargs)
+        for bucket_index, bucket_count in connectable.execute(query):
+            hist[int(bucket_index)] += bucket_count
 
         # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
-        hist = convert_to_json_serializable(
-            list(execution_engine.engine.execute(query).fetchone())
-        )
-        return hist
+        return convert_to_json_serializable(hist)
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -230,3 +186,35 @@ class ColumnHistogram(ColumnMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _is_infinite_edge(edge: float, negative: bool = False) -> bool:
+    return edge in (
+        get_sql_dialect_floating_point_infinity_value(
+            schema="api_np", negative=negative
+        ),
+        get_sql_dialect_floating_point_infinity_value(
+            schema="api_cast", negative=negative
+        ),
+    )
+
+
+def _get_binary_search_bucket_expression(
+    column, bins: List[float], first_bin: int, last_bin: int
+):
+    """Builds nested CASE expressions that find the bin of each value between first_bin and last_bin by bisecting the
+    bin edges, so that each value is compared with O(log(bins)) edges rather than all of them."""
+    if first_bin == last_bin:
+        return sa.literal(first_bin)
+    middle_bin = (first_bin + last_bin + 1) // 2
+    return sa.case(
+        [
+            (
+                column < bins[middle_bin],
+                _get_binary_search_bucket_expression(
+                    column, bins, first_bin, middle_bin - 1
+                ),
+            )
+        ],
+        else_=_get_binary_search_bucket_expression(column, bins, middle_bin, last_bin),
+    )
@@ -3,6 +3,10 @@ from typing import Any, Dict, Optional, Tuple
 import numpy as np
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.quantile_sketch import (
+    QuantileSketch,
+    get_quantile_sketch_relative_error,
+)
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -14,6 +18,7 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
@@ -24,15 +29,44 @@ from great_expectations.expectations.metrics.metric_provider import (
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
+class ColumnMedianAggregate(ColumnMetricProvider):
+    """MetricProvider Class for the median aggregate of the dialects that have one (see _MEDIAN_AGGREGATES_BY_DIALECT),
+    which is bundled with the other aggregates of its domain"""
+
+    metric_name = "column.median_aggregate"
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, _dialect, _column_name, **kwargs):
+        """SqlAlchemy Median Aggregate implementation"""
+        dialect_name = _dialect.name.lower()
+        if dialect_name not in _MEDIAN_AGGREGATES_BY_DIALECT:
+            raise NotImplementedError(
+                f"There is no median aggregate in dialect {dialect_name}"
+            )
+        if dialect_name in _DIALECTS_WITH_ONE_SORTED_AGGREGATE_PER_QUERY:
+            raise NotImplementedError(
+                f"The median aggregate of dialect {dialect_name} cannot be bundled with other aggregates"
+            )
+        return _MEDIAN_AGGREGATES_BY_DIALECT[dialect_name][0](
+            column, _dialect, _column_name
+        )
+
+
 class ColumnMedian(ColumnMetricProvider):
-    """MetricProvider Class for Aggregate Mean MetricProvider"""
+    """MetricProvider Class for Aggregate Median MetricProvider"""
 
     metric_name = "column.median"
+    value_keys = ("allow_relative_error",)
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    def _pandas(cls, column, allow_relative_error=False, **kwargs):
         """Pandas Median Implementation"""
-        return column.median()
+        relative_error = get_quantile_sketch_relative_error(allow_relative_error)
+        if relative_error is None:
+            return column.median()
+        sketch = QuantileSketch(relative_error=relative_error)
+        sketch.update(column.dropna().values)
+        return sketch.get_quantiles([0.5])[0]
 
     @metric_value(engine=SqlAlchemyExecutionEngine, metric_fn_type="value")
     def _sqlalchemy(
@@ -43,6 +77,14 @@ class ColumnMedian(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
+        """SqlAlchemy Median Implementation"""
+        # The median aggregate or quantile was computed beforehand, depending on the strategy of the dialect (see
+        # _get_evaluation_dependencies)
+        if "column.median_aggregate" in metrics:
+            return metrics["column.median_aggregate"]
+        if "column.quantile_values" in metrics:
+            return metrics["column.quantile_values"][0]
+
         (
             selectable,
             compute_domain_kwargs,
@@ -52,40 +94,41 @@ class ColumnMedian(ColumnMetricProvider):
         )
         column_name = accessor_domain_kwargs["column"]
         column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
-        dialect = sqlalchemy_engine.dialect
-        """SqlAlchemy Median Implementation"""
-        if dialect.name.lower() == "awsathena":
-            raise NotImplementedError("AWS Athena does not support OFFSET.")
-        nonnull_count = metrics.get("column_values.nonnull.count")
-        if not nonnull_count:
-            return None
-        element_values = sqlalchemy_engine.execute(
-            sa.select([column])
-            .order_by(column)
-            .where(column != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
-        )
+        sqlalchemy_engine = execution_engine.get_connectable(compute_domain_kwargs)
 
-        column_values = list(element_values.fetchall())
+        strategy = _get_sqlalchemy_median_strategy(
+            execution_engine.engine.dialect,
+            metric_value_kwargs.get("allow_relative_error", False),
+        )
+        if strategy == "unbundled":
+            # The median aggregate of the dialect must be the only sorted aggregate of its query
+            median_aggregate = _MEDIAN_AGGREGATES_BY_DIALECT[
+                execution_engine.engine.dialect.name.lower()
+            ][0](column, execution_engine.engine.dialect, column_name)
+            return sqlalchemy_engine.execute(
+                sa.select([median_aggregate]).select_from(selectable)
+            ).scalar()
 
-        if len(column_values) == 0:
-            column_median = None
-        elif nonnull_count % 2 == 0:
+        # Without a median aggregate, the center values of the sorted column are looked up with ORDER BY and OFFSET
+        nonnull_count = metrics["column_values.nonnull.count"]
+        if not nonnull_count:
+            return None
+        center_values = [
+            row[0]
+            for row in sqlalchemy_engine.execute(
+                sa.select([column])
+                .where(column != None)
+                .order_by(column)
+                .offset((nonnull_count - 1) // 2)
+                .limit(2 - nonnull_count % 2)
+                .select_from(selectable)
+            ).fetchall()
+        ]
+        if len(center_values) == 2:
             # An even number of column values: take the average of the two center values
-            column_median = (
-                float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
-                )
-                / 2.0
-            )  # Average center values
-        else:
-            # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
-        return column_median
+            return float(center_values[0] + center_values[1]) / 2.0
+        # An odd number of column values, we can just take the center value
+        return center_values[0]
 
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
     def _spark(
@@ -114,6 +157,11 @@ class ColumnMedian(ColumnMetricProvider):
         # in the degnerate case when n_values = 0
 
         """Spark Median Implementation"""
+        relative_error = get_quantile_sketch_relative_error(
+            metric_value_kwargs.get("allow_relative_error", False)
+        )
+        if relative_error is not None:
+            return df.approxQuantile(column, [0.5], relative_error)[0]
         table_row_count = metrics.get("table.row_count")
         result = df.approxQuantile(
             column, [0.5, 0.5 + (1 / (2 + (2 * table_row_count)))], 0
@@ -156,8 +204,89 @@ class ColumnMedian(ColumnMetricProvider):
         )
 
         if isinstance(execution_engine, SqlAlchemyExecutionEngine):
-            dependencies["column_values.nonnull.count"] = MetricConfiguration(
-                "column_values.nonnull.count", metric.metric_domain_kwargs
+            allow_relative_error = metric.metric_value_kwargs.get(
+                "allow_relative_error", False
+            )
+            strategy = _get_sqlalchemy_median_strategy(
+                execution_engine.engine.dialect, allow_relative_error
             )
+            if strategy in ["native", "approximate"]:
+                dependencies["column.median_aggregate"] = MetricConfiguration(
+                    "column.median_aggregate", metric.metric_domain_kwargs
+                )
+            elif strategy == "quantile":
+                dependencies["column.quantile_values"] = MetricConfiguration(
+                    "column.quantile_values",
+                    metric.metric_domain_kwargs,
+                    {
+                        "quantiles": (0.5,),
+                        "allow_relative_error": allow_relative_error,
+                    },
+                )
+            elif strategy == "ordered":
+                dependencies["column_values.nonnull.count"] = MetricConfiguration(
+                    "column_values.nonnull.count", metric.metric_domain_kwargs
+                )
 
         return dependencies
+
+
+def _get_bigquery_approximate_median(column, dialect, column_name):
+    quoted_column_name = dialect.identifier_preparer.quote(column_name)
+    return sa.literal_column(f"approx_quantiles({quoted_column_name}, 2)[OFFSET(1)]")
+
+
+# The aggregate computing the median in each dialect that has one, and whether it is approximate
+_MEDIAN_AGGREGATES_BY_DIALECT = {
+    "postgresql": (
+        lambda column, dialect, column_name: sa.func.percentile_cont(0.5).within_group(
+            column.asc()
+        ),
+        False,
+    ),
+    "redshift": (lambda column, dialect, column_name: sa.func.median(column), False),
+    "snowflake": (lambda column, dialect, column_name: sa.func.median(column), False),
+    "oracle": (lambda column, dialect, column_name: sa.func.median(column), False),
+    "awsathena": (
+        lambda column, dialect, column_name: sa.func.approx_percentile(column, 0.5),
+        True,
+    ),
+    "presto": (
+        lambda column, dialect, column_name: sa.func.approx_percentile(column, 0.5),
+        True,
+    ),
+    "bigquery": (_get_bigquery_approximate_median, True),
+}
+
+# Dialects in which all the sorted aggregates (MEDIAN, PERCENTILE_CONT, LISTAGG...) of a query must share the same
+# ordering, so that the median aggregates of several columns cannot be computed in the same query
+_DIALECTS_WITH_ONE_SORTED_AGGREGATE_PER_QUERY = {"redshift"}
+
+# Dialects without OFFSET, in which the median can only be approximated
+_DIALECTS_WITHOUT_OFFSET = {"awsathena"}
+
+
+def _get_sqlalchemy_median_strategy(dialect, allow_relative_error) -> str:
+    """Decides how the median is computed in the dialect:
+      - "native": with the dialect's exact median aggregate (column.median_aggregate)
+      - "unbundled": with the dialect's exact median aggregate, in a query of its own, where it cannot share a query
+        with the median aggregates of other columns
+      - "approximate": with the dialect's approximate median aggregate (column.median_aggregate), if approximation is
+        allowed (or the only way)
+      - "quantile": from column.quantile_values, which streams the column into a QuantileSketch where the dialect has
+        no percentile function, if approximation is allowed
+      - "ordered": from the center values of the sorted column, found with ORDER BY and OFFSET
+    """
+    dialect_name = dialect.name.lower()
+    approximate = get_quantile_sketch_relative_error(allow_relative_error) is not None
+    if dialect_name in _MEDIAN_AGGREGATES_BY_DIALECT:
+        is_approximate = _MEDIAN_AGGREGATES_BY_DIALECT[dialect_name][1]
+        if not is_approximate:
+            if dialect_name in _DIALECTS_WITH_ONE_SORTED_AGGREGATE_PER_QUERY:
+                return "unbundled"
+            return "native"
+        if approximate or dialect_name in _DIALECTS_WITHOUT_OFFSET:
+            return "approximate"
+    if approximate:
+        return "quantile"
+    return "ordered"
@@ -80,7 +80,9 @@ class ColumnPartition(ColumnMetricProvider):
         n_bins = metric.metric_value_kwargs.get(
             "n_bins", cls.default_kwarg_values["n_bins"]
         )
-        allow_relative_error = metric.metric_value_kwargs["allow_relative_error"]
+        allow_relative_error = metric.metric_value_kwargs.get(
+            "allow_relative_error", cls.default_kwarg_values["allow_relative_error"]
+        )
 
         if bins == "uniform":
             return {
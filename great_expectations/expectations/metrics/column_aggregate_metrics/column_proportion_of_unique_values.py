@@ -21,7 +21,14 @@ from great_expectations.validator.validation_graph import MetricConfiguration
 
 def unique_proportion(_metrics):
     total_values = _metrics.get("table.row_count")
-    unique_values = _metrics.get("column.distinct_values.count")
+    if "column.distinct_values.count.approx" in _metrics:
+        # An estimate of the number of distinct values may exceed the number of values
+        unique_values = min(
+            _metrics.get("column.distinct_values.count.approx"),
+            total_values - _metrics.get("column_values.nonnull.unexpected_count"),
+        )
+    else:
+        unique_values = _metrics.get("column.distinct_values.count")
     null_count = _metrics.get("column_values.nonnull.unexpected_count")
 
     if total_values > 0:
@@ -32,6 +39,9 @@ def unique_proportion(_metrics):
 
 class ColumnUniqueProportion(ColumnMetricProvider):
     metric_name = "column.unique_proportion"
+    value_keys = ("approximate",)
+
+    default_kwarg_values = {"approximate": False}
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(*args, metrics, **kwargs):
@@ -56,9 +66,13 @@ class ColumnUniqueProportion(ColumnMetricProvider):
         table_domain_kwargs = {
             k: v for k, v in metric.metric_domain_kwargs.items() if k != "column"
         }
+        if metric.metric_value_kwargs.get("approximate"):
+            distinct_values_count_metric_name = "column.distinct_values.count.approx"
+        else:
+            distinct_values_count_metric_name = "column.distinct_values.count"
         return {
-            "column.distinct_values.count": MetricConfiguration(
-                "column.distinct_values.count", metric.metric_domain_kwargs
+            distinct_values_count_metric_name: MetricConfiguration(
+                distinct_values_count_metric_name, metric.metric_domain_kwargs
             ),
             "table.row_count": MetricConfiguration(
                 "table.row_count", table_domain_kwargs
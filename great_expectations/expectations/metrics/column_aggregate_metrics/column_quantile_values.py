@@ -5,6 +5,10 @@ from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
+from great_expectations.core.quantile_sketch import (
+    QuantileSketch,
+    get_quantile_sketch_relative_error,
+)
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 
 try:
@@ -37,7 +41,10 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.util import (
+    attempt_allowing_relative_error,
+    get_column_quantiles_using_sketch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,10 +54,14 @@ class ColumnQuantileValues(ColumnMetricProvider):
     value_keys = ("quantiles", "allow_relative_error")
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, **kwargs):
+    def _pandas(cls, column, quantiles, allow_relative_error=False, **kwargs):
         """Quantile Function"""
-
-        return column.quantile(quantiles, interpolation="nearest").tolist()
+        relative_error = get_quantile_sketch_relative_error(allow_relative_error)
+        if relative_error is None:
+            return column.quantile(quantiles, interpolation="nearest").tolist()
+        sketch = QuantileSketch(relative_error=relative_error)
+        sketch.update(column.dropna().values)
+        return sketch.get_quantiles(quantiles)
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
@@ -70,7 +81,7 @@ class ColumnQuantileValues(ColumnMetricProvider):
         )
         column_name = accessor_domain_kwargs["column"]
         column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
+        sqlalchemy_engine = execution_engine.get_connectable(compute_domain_kwargs)
         dialect = sqlalchemy_engine.dialect
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
@@ -88,6 +99,17 @@ class ColumnQuantileValues(ColumnMetricProvider):
                 selectable=selectable,
                 sqlalchemy_engine=sqlalchemy_engine,
             )
+        elif dialect.name.lower() == "sqlite" or (
+            dialect.name.lower() == "mysql" and allow_relative_error
+        ):
+            # Neither dialect has percentile_disc: stream the column into a sketch rather than sorting the table
+            return get_column_quantiles_using_sketch(
+                column=column,
+                quantiles=quantiles,
+                relative_error=get_quantile_sketch_relative_error(allow_relative_error),
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+            )
         elif dialect.name.lower() == "mysql":
             return _get_column_quantiles_mysql(
                 column=column,
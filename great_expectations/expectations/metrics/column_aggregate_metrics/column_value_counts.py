@@ -2,6 +2,7 @@ from typing import Any, Dict, Tuple
 
 import pandas as pd
 
+from great_expectations.core.space_saving import get_top_k_counts
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -109,9 +110,11 @@ class ColumnValueCounts(ColumnMetricProvider):
                 query = query.order_by(sa.column(column))
         elif sort == "count":
             query = query.order_by(sa.column("count").desc())
-        results = execution_engine.engine.execute(
-            query.select_from(selectable)
-        ).fetchall()
+        results = (
+            execution_engine.get_connectable(metric_domain_kwargs)
+            .execute(query.select_from(selectable))
+            .fetchall()
+        )
         series = pd.Series(
             [row[1] for row in results],
             index=pd.Index(data=[row[0] for row in results], name="value"),
@@ -157,3 +160,100 @@ class ColumnValueCounts(ColumnMetricProvider):
             name="count",
         )
         return series
+
+
+class ColumnValueCountsTopK(ColumnMetricProvider):
+    """The counts of the k most common values of a column, most common first (ties broken by value), as a Series
+    like that of column.value_counts. Only k rows leave the database; on chunked pandas batch data, the counts are
+    estimated with a bounded SpaceSavingSketch."""
+
+    metric_name = "column.value_counts.top_k"
+    value_keys = ("k",)
+
+    default_kwarg_values = {"k": 10}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        k = _get_k(metric_value_kwargs)
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column = accessor_domain_kwargs["column"]
+        return get_top_k_counts(df[column].value_counts(), k)
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        k = _get_k(metric_value_kwargs)
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+        count = sa.func.count(column)
+        query = (
+            sa.select([column.label("value"), count.label("count")])
+            .where(column != None)
+            .group_by(column)
+            .order_by(count.desc(), column)
+            .limit(k)
+            .select_from(selectable)
+        )
+        results = (
+            execution_engine.get_connectable(metric_domain_kwargs)
+            .execute(query)
+            .fetchall()
+        )
+        return pd.Series(
+            [row[1] for row in results],
+            index=pd.Index(data=[row[0] for row in results], name="value"),
+            name="count",
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        k = _get_k(metric_value_kwargs)
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column = accessor_domain_kwargs["column"]
+        value_counts = (
+            df.select(column)
+            .where(F.col(column).isNotNull())
+            .groupBy(column)
+            .count()
+            .orderBy(F.desc("count"), F.asc(column))
+            .limit(k)
+            .collect()
+        )
+        return pd.Series(
+            [row["count"] for row in value_counts],
+            index=pd.Index(data=[row[column] for row in value_counts], name="value"),
+            name="count",
+        )
+
+
+def _get_k(metric_value_kwargs: Dict) -> int:
+    k = metric_value_kwargs.get("k", ColumnValueCountsTopK.default_kwarg_values["k"])
+    if not isinstance(k, int) or isinstance(k, bool) or k < 1:
+        raise ValueError("k must be a positive integer")
+    return k
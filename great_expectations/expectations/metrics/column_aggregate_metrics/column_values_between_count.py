@@ -196,9 +196,13 @@ class ColumnValuesBetweenCount(MetricProvider):
             else:
                 condition = sa.and_(column >= min_value, column <= max_value)
 
-        return execution_engine.engine.execute(
-            sa.select([sa.func.count()]).select_from(selectable).where(condition)
-        ).scalar()
+        return (
+            execution_engine.get_connectable(compute_domain_kwargs)
+            .execute(
+                sa.select([sa.func.count()]).select_from(selectable).where(condition)
+            )
+            .scalar()
+        )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
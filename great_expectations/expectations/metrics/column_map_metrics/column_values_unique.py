@@ -50,14 +50,7 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
         partial_fn_type=MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
     )
     def _sqlalchemy_window(cls, column, _table, **kwargs):
-        dup_query = (
-            sa.select([column])
-            .select_from(_table)
-            .group_by(column)
-            .having(sa.func.count(column) > 1)
-        )
-
-        return column.notin_(dup_query)
+        return sa.func.count().over(partition_by=column) <= 1
 
     @column_condition_partial(
         engine=SparkDFExecutionEngine,
@@ -1,11 +1,10 @@
-import uuid
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
 import numpy as np
+import pandas as pd
 
 from great_expectations.core import ExpectationConfiguration
-from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.exceptions.metric_exceptions import (
     MetricError,
     MetricProviderError,
@@ -22,6 +21,7 @@ from great_expectations.execution_engine.sparkdf_execution_engine import (
 )
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
+    compile_window_functions,
     sa,
 )
 from great_expectations.expectations.metrics.metric_provider import (
@@ -312,7 +312,7 @@ def column_condition_partial(
             MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
         ]:
             raise ValueError(
-                "SqlAlchemyExecutionEngine only supports map_condition_fn for column_condition_partial partial_fn_type"
+                "SqlAlchemyExecutionEngine only supports map_condition_fn and window_condition_fn for column_condition_partial partial_fn_type"
             )
 
         def wrapper(metric_fn: Callable):
@@ -344,7 +344,9 @@ def column_condition_partial(
                 )
                 column_name = accessor_domain_kwargs["column"]
                 dialect = execution_engine.dialect
-                sqlalchemy_engine = execution_engine.engine
+                sqlalchemy_engine = execution_engine.get_connectable(
+                    compute_domain_kwargs
+                )
 
                 expected_condition = metric_fn(
                     cls,
@@ -446,6 +448,55 @@ def column_condition_partial(
         raise ValueError("Unsupported engine for column_condition_partial")
 
 
+# Number of rows of a boolean map scanned at a time while looking for the first unexpected rows
+UNEXPECTED_POSITIONS_CHUNK_SIZE = 1000000
+
+
+def _pandas_unexpected_positions(
+    boolean_mapped_unexpected_values: Union[pd.Series, np.ndarray],
+    domain_index: pd.Index,
+    limit: Optional[int] = None,
+) -> np.ndarray:
+    """Returns the positions within the domain of the rows flagged as unexpected, stopping once limit positions have
+    been found, so that callers can select just those rows instead of filtering the whole domain."""
+    if isinstance(boolean_mapped_unexpected_values, pd.Series):
+        # A Series is aligned with the domain by label, an array by position
+        if not boolean_mapped_unexpected_values.index.equals(domain_index):
+            boolean_mapped_unexpected_values = boolean_mapped_unexpected_values.reindex(
+                domain_index
+            )
+        boolean_mapped_unexpected_values = boolean_mapped_unexpected_values.to_numpy()
+    else:
+        boolean_mapped_unexpected_values = np.asarray(boolean_mapped_unexpected_values)
+    if boolean_mapped_unexpected_values.dtype == bool:
+        mask = boolean_mapped_unexpected_values
+    else:
+        # Missing values in the map are not unexpected
+        mask = boolean_mapped_unexpected_values == True
+
+    if limit is None:
+        return np.flatnonzero(mask)
+    positions = []
+    found = 0
+    for start in range(0, len(mask), UNEXPECTED_POSITIONS_CHUNK_SIZE):
+        if found >= limit:
+            break
+        chunk_positions = np.flatnonzero(
+            mask[start : start + UNEXPECTED_POSITIONS_CHUNK_SIZE]
+        )[: limit - found]
+        positions.append(chunk_positions + start)
+        found += len(chunk_positions)
+    if len(positions) == 0:
+        return np.array([], dtype=np.int64)
+    return np.concatenate(positions)
+
+
+def _pandas_unexpected_positions_limit(result_format: dict) -> Optional[int]:
+    if result_format["result_format"] == "COMPLETE":
+        return None
+    return result_format["partial_unexpected_count"]
+
+
 def _pandas_map_condition_unexpected_count(
     cls,
     execution_engine: "PandasExecutionEngine",
@@ -493,15 +544,12 @@ def _pandas_column_map_condition_values(
             "_pandas_column_map_condition_values requires a column in accessor_domain_kwargs"
         )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(domain_values[boolean_map_unexpected_values == True])
-    else:
-        return list(
-            domain_values[boolean_map_unexpected_values == True][
-                : result_format["partial_unexpected_count"]
-            ]
-        )
+    unexpected_positions = _pandas_unexpected_positions(
+        boolean_map_unexpected_values,
+        domain_values.index,
+        limit=_pandas_unexpected_positions_limit(metric_value_kwargs["result_format"]),
+    )
+    return list(domain_values.iloc[unexpected_positions])
 
 
 def _pandas_column_map_series_and_domain_values(
@@ -548,25 +596,17 @@ def _pandas_column_map_series_and_domain_values(
             "_pandas_column_map_series_and_domain_values requires a column in accessor_domain_kwargs"
         )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return (
-            list(domain_values[boolean_map_unexpected_values == True]),
-            list(map_series[boolean_map_unexpected_values == True]),
-        )
-    else:
-        return (
-            list(
-                domain_values[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-            list(
-                map_series[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-        )
+    unexpected_positions = _pandas_unexpected_positions(
+        boolean_map_unexpected_values,
+        domain_values.index,
+        limit=_pandas_unexpected_positions_limit(metric_value_kwargs["result_format"]),
+    )
+    if not map_series.index.equals(domain_values.index):
+        map_series = map_series.reindex(domain_values.index)
+    return (
+        list(domain_values.iloc[unexpected_positions]),
+        list(map_series.iloc[unexpected_positions]),
+    )
 
 
 def _pandas_map_condition_index(
@@ -598,15 +638,12 @@ def _pandas_map_condition_index(
         df = df[df[accessor_domain_kwargs["column"]].notnull()]
     data = df[accessor_domain_kwargs["column"]]
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(df[boolean_mapped_unexpected_values == True].index)
-    else:
-        return list(
-            df[boolean_mapped_unexpected_values == True].index[
-                : result_format["partial_unexpected_count"]
-            ]
-        )
+    unexpected_positions = _pandas_unexpected_positions(
+        boolean_mapped_unexpected_values,
+        df.index,
+        limit=_pandas_unexpected_positions_limit(metric_value_kwargs["result_format"]),
+    )
+    return list(df.index[unexpected_positions])
 
 
 def _pandas_column_map_condition_value_counts(
@@ -728,57 +765,6 @@ def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
     )
 
 
-def _sqlalchemy_map_condition_unexpected_count_value(
-    cls,
-    execution_engine: "SqlAlchemyExecutionEngine",
-    metric_domain_kwargs: Dict,
-    metric_value_kwargs: Dict,
-    metrics: Dict[str, Any],
-    **kwargs,
-):
-    """Returns unexpected count for MapExpectations. This is a *value* metric, which is useful for
-    when the unexpected_condition is a window function.
-    """
-    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
-        "unexpected_condition"
-    )
-    (selectable, _, _,) = execution_engine.get_compute_domain(
-        compute_domain_kwargs, domain_type="identity"
-    )
-    temp_table_name: str = f"ge_tmp_{str(uuid.uuid4())[:8]}"
-    if execution_engine.engine.dialect.name.lower() == "mssql":
-        # mssql expects all temporary table names to have a prefix '#'
-        temp_table_name = f"#{temp_table_name}"
-
-    with execution_engine.engine.begin():
-        metadata: sa.MetaData = sa.MetaData(execution_engine.engine)
-        temp_table_obj: sa.Table = sa.Table(
-            temp_table_name,
-            metadata,
-            sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
-        )
-        temp_table_obj.create(execution_engine.engine, checkfirst=True)
-
-        count_case_statement: List[sa.sql.elements.Label] = [
-            sa.case([(unexpected_condition, 1,)], else_=0,).label("condition")
-        ]
-        inner_case_query: sa.sql.dml.Insert = temp_table_obj.insert().from_select(
-            count_case_statement,
-            sa.select(count_case_statement).select_from(selectable),
-        )
-        execution_engine.engine.execute(inner_case_query)
-
-    unexpected_count_query: sa.Select = sa.select(
-        [sa.func.sum(sa.column("condition")).label("unexpected_count"),]
-    ).select_from(temp_table_obj).alias("UnexpectedCountSubquery")
-
-    unexpected_count = execution_engine.engine.execute(
-        sa.select([unexpected_count_query.c.unexpected_count,])
-    ).scalar()
-
-    return convert_to_json_serializable(unexpected_count)
-
-
 def _sqlalchemy_column_map_condition_values(
     cls,
     execution_engine: "SqlAlchemyExecutionEngine",
@@ -804,6 +790,9 @@ def _sqlalchemy_column_map_condition_values(
             "_sqlalchemy_column_map_condition_values requires a column in accessor_domain_kwargs"
         )
 
+    (unexpected_condition,), selectable, _ = compile_window_functions(
+        [unexpected_condition], selectable
+    )
     query = (
         sa.select(
             [sa.column(accessor_domain_kwargs.get("column")).label("unexpected_values")]
@@ -813,10 +802,8 @@ def _sqlalchemy_column_map_condition_values(
     )
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
-    return [
-        val.unexpected_values
-        for val in execution_engine.engine.execute(query).fetchall()
-    ]
+    connectable = execution_engine.get_connectable(compute_domain_kwargs)
+    return [val.unexpected_values for val in connectable.execute(query).fetchall()]
 
 
 def _sqlalchemy_column_map_condition_value_counts(
@@ -842,12 +829,19 @@ def _sqlalchemy_column_map_condition_value_counts(
             "_sqlalchemy_column_map_condition_value_counts requires a column in accessor_domain_kwargs"
         )
     column = sa.column(accessor_domain_kwargs["column"])
-    return execution_engine.engine.execute(
-        sa.select([column, sa.func.count(column)])
-        .select_from(selectable)
-        .where(unexpected_condition)
-        .group_by(column)
-    ).fetchall()
+    (unexpected_condition,), selectable, _ = compile_window_functions(
+        [unexpected_condition], selectable
+    )
+    return (
+        execution_engine.get_connectable(compute_domain_kwargs)
+        .execute(
+            sa.select([column, sa.func.count(column)])
+            .select_from(selectable)
+            .where(unexpected_condition)
+            .group_by(column)
+        )
+        .fetchall()
+    )
 
 
 def _sqlalchemy_map_condition_rows(
@@ -870,12 +864,25 @@ def _sqlalchemy_map_condition_rows(
     )
 
     result_format = metric_value_kwargs["result_format"]
+    (
+        (unexpected_condition,),
+        selectable,
+        window_column_count,
+    ) = compile_window_functions([unexpected_condition], selectable)
     query = (
         sa.select([sa.text("*")]).select_from(selectable).where(unexpected_condition)
     )
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
-    return execution_engine.engine.execute(query).fetchall()
+    rows = (
+        execution_engine.get_connectable(compute_domain_kwargs)
+        .execute(query)
+        .fetchall()
+    )
+    if window_column_count:
+        # The window columns computed for the condition follow the columns of the domain
+        rows = [tuple(row)[:-window_column_count] for row in rows]
+    return rows
 
 
 def _spark_map_condition_unexpected_count_aggregate_fn(
@@ -1135,37 +1142,26 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=condition_provider,
                         metric_fn_type=metric_fn_type,
                     )
-                    if metric_fn_type == MetricPartialFunctionTypes.MAP_CONDITION_FN:
-                        register_metric(
-                            metric_name=metric_name + ".unexpected_count.aggregate_fn",
-                            metric_domain_keys=metric_domain_keys,
-                            metric_value_keys=metric_value_keys,
-                            execution_engine=engine,
-                            metric_class=cls,
-                            metric_provider=_sqlalchemy_map_condition_unexpected_count_aggregate_fn,
-                            metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
-                        )
-                        register_metric(
-                            metric_name=metric_name + ".unexpected_count",
-                            metric_domain_keys=metric_domain_keys,
-                            metric_value_keys=metric_value_keys,
-                            execution_engine=engine,
-                            metric_class=cls,
-                            metric_provider=None,
-                            metric_fn_type=MetricFunctionTypes.VALUE,
-                        )
-                    elif (
-                        metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN
-                    ):
-                        register_metric(
-                            metric_name=metric_name + ".unexpected_count",
-                            metric_domain_keys=metric_domain_keys,
-                            metric_value_keys=metric_value_keys,
-                            execution_engine=engine,
-                            metric_class=cls,
-                            metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
-                            metric_fn_type=MetricFunctionTypes.VALUE,
-                        )
+                    # Window conditions are bundled like map conditions: the window functions of all the conditions
+                    # on a domain are computed once, in a CTE (see compile_window_functions)
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_count.aggregate_fn",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=_sqlalchemy_map_condition_unexpected_count_aggregate_fn,
+                        metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+                    )
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_count",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=None,
+                        metric_fn_type=MetricFunctionTypes.VALUE,
+                    )
                     register_metric(
                         metric_name=metric_name + ".unexpected_rows",
                         metric_domain_keys=metric_domain_keys,
@@ -64,7 +64,11 @@ class ColumnTypes(TableMetricProvider):
             raise GreatExpectationsError(
                 "the requested batch is not available; please load the batch into the execution engine."
             )
-        return _get_sqlalchemy_column_metadata(execution_engine.engine, batch_data)
+        # Reflect on the batch's own connection, on which its temporary table (if any) is visible
+        with execution_engine.get_connectable(
+            metric_domain_kwargs
+        ).connect() as connection:
+            return _get_sqlalchemy_column_metadata(connection, batch_data)
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -4,6 +4,8 @@ from typing import Dict, List, Optional, Union
 import numpy as np
 from dateutil.parser import parse
 
+from great_expectations.core.quantile_sketch import QuantileSketch
+
 try:
     import psycopg2
     import sqlalchemy.dialects.postgresql.psycopg2 as sqlalchemy_psycopg2
@@ -37,6 +39,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# The number of rows fetched at a time when streaming a column into a QuantileSketch
+QUANTILE_SKETCH_FETCH_SIZE = 10000
+
 try:
     import pybigquery.sqlalchemy_bigquery
 
@@ -196,6 +201,36 @@ def attempt_allowing_relative_error(dialect):
     return detected_redshift or detected_psycopg2
 
 
+def get_column_quantiles_using_sketch(
+    column,
+    quantiles: List[float],
+    relative_error: Optional[float],
+    selectable,
+    sqlalchemy_engine,
+) -> list:
+    """Computes the quantiles in a single streaming pass over the non-null values of the column, holding at most a
+    QuantileSketch and QUANTILE_SKETCH_FETCH_SIZE rows in memory (every value, if relative_error is None)."""
+    sketch = QuantileSketch(relative_error=relative_error)
+    values_query = (
+        sa.select([column])
+        .where(column != None)
+        .select_from(selectable)
+        .execution_options(stream_results=True)
+    )
+    # The connection is held for as long as the result is streamed
+    with sqlalchemy_engine.connect() as connection:
+        result = connection.execute(values_query)
+        try:
+            while True:
+                rows = result.fetchmany(QUANTILE_SKETCH_FETCH_SIZE)
+                if len(rows) == 0:
+                    break
+                sketch.update([row[0] for row in rows])
+        finally:
+            result.close()
+    return sketch.get_quantiles(quantiles)
+
+
 def column_reflection_fallback(selectable, dialect, sqlalchemy_engine):
     """If we can't reflect the table, use a query to at least get column names."""
     col_info_dict_list: List[Dict]
@@ -225,7 +260,7 @@ object_id = OBJECT_ID('tempdb..{selectable}')
     else:
         query: Select = sa.select([sa.text("*")]).select_from(selectable).limit(1)
         result_object = sqlalchemy_engine.execute(query)
-        col_names = result_object._metadata.keys
+        col_names = list(result_object.keys())
         col_info_dict_list = [{"name": col_name} for col_name in col_names]
     return col_info_dict_list
 
@@ -380,11 +380,12 @@ class DefaultSiteSectionBuilder:
             )
 
     def build(self, resource_identifiers=None):
-        source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
-            source_store_keys = sorted(
-                source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
-            )[: self.validation_results_limit]
+            source_store_keys = self.source_store.get_latest_keys(
+                self.validation_results_limit
+            )
+        else:
+            source_store_keys = self.source_store.list_keys()
 
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
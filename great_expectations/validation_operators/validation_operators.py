@@ -1,4 +1,7 @@
+import concurrent.futures
+import contextlib
 import logging
+import threading
 import warnings
 from collections import OrderedDict
 
@@ -126,6 +129,20 @@ An instance of ActionListValidationOperator is included in the default configura
         action:
           class_name: UpdateDataDocsAction
 
+    # optional - the number of batches validated at the same time, on a pool of threads. While batches are being
+    # validated, the actions run on the results already available, one at a time and in the order in which
+    # validations finish. By default, batches are validated one after the other.
+    max_concurrency: 8
+
+When ``max_concurrency`` is set, the batches are validated independently of each other: a batch must not depend on
+evaluation parameters stored by the actions on another batch of the same run. Validators that share an execution engine
+(those of the same datasource) are still validated one after the other, since the engine holds their active batch: the
+Validators of a single datasource, as usually validated with batch requests, get no parallelism from
+``max_concurrency``. At most ``max_concurrency`` batches are validated at a time, whatever their datasources. The
+run results are still listed in the order of ``assets_to_validate``, and the first validation or action that raises an
+exception stops the run: the validations not yet started are cancelled, and the exception is raised once those in
+progress have finished.
+
 
 **Invocation**
 
@@ -194,11 +211,18 @@ The ``run`` method returns a ValidationOperatorResult object:
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        max_concurrency=None,
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
 
+        if max_concurrency is not None and (
+            not isinstance(max_concurrency, int) or max_concurrency < 1
+        ):
+            raise ValueError("max_concurrency must be a positive integer")
+        self.max_concurrency = max_concurrency
+
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
             "BOOLEAN_ONLY",
@@ -247,6 +271,10 @@ The ``run`` method returns a ValidationOperatorResult object:
                     "result_format": self.result_format,
                 },
             }
+            if self.max_concurrency is not None:
+                self._validation_operator_config["kwargs"][
+                    "max_concurrency"
+                ] = self.max_concurrency
         return self._validation_operator_config
 
     def _build_batch_from_item(self, item):
@@ -308,41 +336,32 @@ The ``run`` method returns a ValidationOperatorResult object:
         elif not isinstance(run_id, RunIdentifier):
             run_id = RunIdentifier(run_name=run_name, run_time=run_time)
 
-        run_results = {}
-
-        for item in assets_to_validate:
-            run_result_obj = {}
-            batch = self._build_batch_from_item(item)
-
-            if isinstance(batch, Validator):
-                batch_identifier = batch.active_batch_id
-            else:
-                batch_identifier = batch.batch_id
-
-            expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=batch._expectation_suite.expectation_suite_name
+        if self.max_concurrency is not None and self.max_concurrency > 1:
+            run_results = self._run_concurrently(
+                assets_to_validate, run_id, evaluation_parameters, result_format
             )
-            validation_result_id = ValidationResultIdentifier(
-                batch_identifier=batch_identifier,
-                expectation_suite_identifier=expectation_suite_identifier,
-                run_id=run_id,
-            )
-            batch_validation_result = batch.validate(
-                run_id=run_id,
-                result_format=result_format if result_format else self.result_format,
-                evaluation_parameters=evaluation_parameters,
-            )
-            run_result_obj["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(
-                batch,
-                expectation_suite_identifier,
-                batch._expectation_suite,
-                batch_validation_result,
-                run_id,
-            )
-
-            run_result_obj["actions_results"] = batch_actions_results
-            run_results[validation_result_id] = run_result_obj
+        else:
+            run_results = {}
+            for item in assets_to_validate:
+                (
+                    batch,
+                    expectation_suite_identifier,
+                    validation_result_id,
+                    batch_validation_result,
+                ) = self._validate_item(
+                    item, run_id, evaluation_parameters, result_format
+                )
+                batch_actions_results = self._run_actions(
+                    batch,
+                    expectation_suite_identifier,
+                    batch._expectation_suite,
+                    batch_validation_result,
+                    run_id,
+                )
+                run_results[validation_result_id] = {
+                    "validation_result": batch_validation_result,
+                    "actions_results": batch_actions_results,
+                }
 
         return ValidationOperatorResult(
             run_id=run_id,
@@ -351,6 +370,146 @@ The ``run`` method returns a ValidationOperatorResult object:
             evaluation_parameters=evaluation_parameters,
         )
 
+    def _validate_item(self, item, run_id, evaluation_parameters, result_format):
+        """Builds the batch of an item of assets_to_validate and validates it.
+
+        Returns:
+            The batch, the identifiers of its expectation suite and validation result, and the validation result
+        """
+        batch = self._build_batch_from_item(item)
+
+        if isinstance(batch, Validator):
+            if batch.batches:
+                # Validators of a datasource share its execution engine, whose active batch is the one loaded last:
+                # validate the batch of this validator, which was the active one when the validator was built
+                batch.execution_engine.active_batch_data_id = list(batch.batches)[-1]
+            batch_identifier = batch.active_batch_id
+        else:
+            batch_identifier = batch.batch_id
+
+        expectation_suite_identifier = ExpectationSuiteIdentifier(
+            expectation_suite_name=batch._expectation_suite.expectation_suite_name
+        )
+        validation_result_id = ValidationResultIdentifier(
+            batch_identifier=batch_identifier,
+            expectation_suite_identifier=expectation_suite_identifier,
+            run_id=run_id,
+        )
+        batch_validation_result = batch.validate(
+            run_id=run_id,
+            result_format=result_format if result_format else self.result_format,
+            evaluation_parameters=evaluation_parameters,
+        )
+        return (
+            batch,
+            expectation_suite_identifier,
+            validation_result_id,
+            batch_validation_result,
+        )
+
+    def _run_concurrently(
+        self, assets_to_validate, run_id, evaluation_parameters, result_format
+    ) -> dict:
+        """Validates the assets on a pool of max_concurrency threads, running the actions on each validation result,
+        one result at a time, on another thread as soon as it is available.
+
+        Validators sharing an execution engine are validated one after the other, on a thread of their own, since
+        the active batch (and the metric cache) of an execution engine can only serve one validation at a time, so
+        Validators of a single datasource are not validated concurrently. Those threads and the pool share
+        max_concurrency validation slots, so that no more than max_concurrency validations run at once.
+
+        The run results are returned in the order of assets_to_validate. The first exception raised by a validation or
+        an action cancels the validations and actions not yet started, and is raised once those in progress finish.
+        """
+        validation_futures = []
+        action_futures = []
+        with contextlib.ExitStack() as executors:
+            validation_executor = executors.enter_context(
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency)
+            )
+            action_executor = executors.enter_context(
+                concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            )
+            # The executor validating the validators of each execution engine, by id of the engine
+            execution_engine_executors = dict()
+            validation_slots = threading.BoundedSemaphore(self.max_concurrency)
+
+            def validate_item(*args):
+                with validation_slots:
+                    return self._validate_item(*args)
+
+            def cancel_pending():
+                for future in validation_futures + action_futures:
+                    future.cancel()
+
+            for item in assets_to_validate:
+                executor = validation_executor
+                if isinstance(item, Validator):
+                    engine_id = id(item.execution_engine)
+                    if engine_id not in execution_engine_executors:
+                        execution_engine_executors[engine_id] = executors.enter_context(
+                            concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                        )
+                    executor = execution_engine_executors[engine_id]
+                validation_futures.append(
+                    executor.submit(
+                        validate_item,
+                        item,
+                        run_id,
+                        evaluation_parameters,
+                        result_format,
+                    )
+                )
+            actions_by_validation = dict()
+            for validation_future in concurrent.futures.as_completed(
+                validation_futures
+            ):
+                failed_actions = [
+                    future
+                    for future in action_futures
+                    if future.done() and future.exception() is not None
+                ]
+                if validation_future.exception() is not None or failed_actions:
+                    cancel_pending()
+                    if validation_future.exception() is not None:
+                        raise validation_future.exception()
+                    raise failed_actions[0].exception()
+                (
+                    batch,
+                    expectation_suite_identifier,
+                    _,
+                    batch_validation_result,
+                ) = validation_future.result()
+                action_future = action_executor.submit(
+                    self._run_actions,
+                    batch,
+                    expectation_suite_identifier,
+                    batch._expectation_suite,
+                    batch_validation_result,
+                    run_id,
+                )
+                action_futures.append(action_future)
+                actions_by_validation[validation_future] = action_future
+
+            for action_future in action_futures:
+                if action_future.exception() is not None:
+                    cancel_pending()
+                    raise action_future.exception()
+
+        run_results = {}
+        for validation_future in validation_futures:
+            (
+                _,
+                _,
+                validation_result_id,
+                batch_validation_result,
+            ) = validation_future.result()
+            run_results[validation_result_id] = {
+                "validation_result": batch_validation_result,
+                "actions_results": actions_by_validation[validation_future].result(),
+            }
+        return run_results
+
     def _run_actions(
         self,
         batch,
@@ -1,7 +1,9 @@
 import copy
-from typing import Dict, List, Optional, Tuple, Union
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from great_expectations.core.id_dict import IDDict
+from great_expectations.exceptions import GreatExpectationsError
 
 
 class MetricConfiguration:
@@ -78,18 +80,244 @@ class MetricEdge:
 
 class ValidationGraph:
     def __init__(self, edges: Optional[List[MetricEdge]] = None):
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges = []
+        self._edge_ids = set()
+
+        # Adjacency index keyed by MetricConfiguration.id, maintained incrementally as edges are added so that
+        # scheduling never needs to walk (or copy) the full edge list.
+        self._metric_configurations: Dict[Tuple, MetricConfiguration] = {}
+        self._dependencies: Dict[Tuple, Set[Tuple]] = {}
+        self._dependents: Dict[Tuple, Set[Tuple]] = {}
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        if edges:
+            for edge in edges:
+                self.add(edge)
 
     def add(self, edge: MetricEdge):
         if edge.id not in self._edge_ids:
             self._edges.append(edge)
             self._edge_ids.add(edge.id)
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: MetricEdge):
+        left_id = self._index_metric_configuration(edge.left)
+        if edge.right is not None:
+            right_id = self._index_metric_configuration(edge.right)
+            self._dependencies[left_id].add(right_id)
+            self._dependents[right_id].add(left_id)
+
+    def _index_metric_configuration(self, metric_configuration: MetricConfiguration):
+        metric_id = metric_configuration.id
+        if metric_id not in self._metric_configurations:
+            self._metric_configurations[metric_id] = metric_configuration
+            self._dependencies[metric_id] = set()
+            self._dependents[metric_id] = set()
+        return metric_id
 
     @property
     def edges(self):
         return copy.deepcopy(self._edges)
+
+    @property
+    def metric_ids(self) -> List[Tuple]:
+        """The ids of all metrics in the graph, in the order in which they were first added."""
+        return list(self._metric_configurations.keys())
+
+    def has_metric(self, metric_id: Tuple) -> bool:
+        return metric_id in self._metric_configurations
+
+    def get_metric_configuration(self, metric_id: Tuple) -> MetricConfiguration:
+        return self._metric_configurations[metric_id]
+
+    def get_dependencies(self, metric_id: Tuple) -> Set[Tuple]:
+        """The ids of the metrics that the given metric depends on."""
+        return self._dependencies[metric_id]
+
+    def get_dependents(self, metric_id: Tuple) -> Set[Tuple]:
+        """The ids of the metrics that depend on the given metric."""
+        return self._dependents[metric_id]
+
+
+class MetricResolutionWave:
+    """A set of metrics released together by a ValidationGraphScheduler, along with the wall time spent resolving
+    them."""
+
+    def __init__(self, index: int, metric_ids: List[Tuple]):
+        self._index = index
+        self._metric_ids = metric_ids
+        self._started = time.perf_counter()
+        self._elapsed = None
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def metric_ids(self) -> List[Tuple]:
+        return self._metric_ids
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Seconds spent resolving the wave, or None if the wave has not completed."""
+        return self._elapsed
+
+    def complete(self):
+        self._elapsed = time.perf_counter() - self._started
+
+    def to_json_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "metric_ids": [list(metric_id) for metric_id in self.metric_ids],
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self):
+        return (
+            f"MetricResolutionWave(index={self.index}, metrics={len(self.metric_ids)}, "
+            f"elapsed={self.elapsed})"
+        )
+
+
+class ValidationGraphScheduler:
+    """Releases the metrics of a ValidationGraph in topological waves.
+
+    Each metric carries a counter of its not-yet-resolved dependencies; a metric is released as soon as that counter
+    reaches zero. Completing a wave only touches the dependents of the metrics in that wave, so the total
+    bookkeeping cost is linear in the size of the graph.
+
+    Usage:
+
+        scheduler = ValidationGraphScheduler(graph, metrics)
+        while scheduler.has_ready_metrics:
+            ready_metrics = scheduler.start_wave()
+            metrics.update(resolve(ready_metrics))
+            scheduler.complete_wave(metrics)
+    """
+
+    def __init__(
+        self,
+        graph: ValidationGraph,
+        metrics: Optional[Dict] = None,
+        target_metric_ids: Optional[Iterable[Tuple]] = None,
+    ):
+        """
+        Args:
+            graph: the ValidationGraph to schedule
+            metrics: metrics that are already available; these are never released
+            target_metric_ids: if provided, only these metrics and the unavailable metrics they (transitively) depend
+                on are released. Otherwise every unavailable metric in the graph is released.
+        """
+        if metrics is None:
+            metrics = dict()
+        self._graph = graph
+        self._unmet_dependency_counts: Dict[Tuple, int] = {}
+        self._ready: List[Tuple] = []
+        required_metric_ids = None
+        if target_metric_ids is not None:
+            required_metric_ids = self._get_required_metric_ids(
+                graph, metrics, target_metric_ids
+            )
+        for metric_id in graph.metric_ids:
+            if metric_id in metrics:
+                continue
+            if required_metric_ids is not None and metric_id not in required_metric_ids:
+                continue
+            unmet_dependency_count = len(
+                [
+                    dependency_id
+                    for dependency_id in graph.get_dependencies(metric_id)
+                    if dependency_id not in metrics
+                ]
+            )
+            self._unmet_dependency_counts[metric_id] = unmet_dependency_count
+            if unmet_dependency_count == 0:
+                self._ready.append(metric_id)
+        self._waves: List[MetricResolutionWave] = []
+        self._active_wave: Optional[MetricResolutionWave] = None
+
+    @staticmethod
+    def _get_required_metric_ids(
+        graph: ValidationGraph, metrics: Dict, target_metric_ids: Iterable[Tuple]
+    ) -> Set[Tuple]:
+        required_metric_ids = set()
+        to_visit = [
+            metric_id
+            for metric_id in target_metric_ids
+            if graph.has_metric(metric_id) and metric_id not in metrics
+        ]
+        while len(to_visit) > 0:
+            metric_id = to_visit.pop()
+            if metric_id in required_metric_ids:
+                continue
+            required_metric_ids.add(metric_id)
+            to_visit.extend(
+                dependency_id
+                for dependency_id in graph.get_dependencies(metric_id)
+                if dependency_id not in metrics
+            )
+        return required_metric_ids
+
+    @property
+    def has_ready_metrics(self) -> bool:
+        return len(self._ready) > 0
+
+    @property
+    def pending_metric_ids(self) -> Set[Tuple]:
+        """The ids of metrics that have not yet been resolved (including any in the active wave)."""
+        return set(self._unmet_dependency_counts.keys())
+
+    @property
+    def waves(self) -> List[MetricResolutionWave]:
+        return self._waves
+
+    def start_wave(self) -> List[MetricConfiguration]:
+        """Release all currently-ready metrics as a new wave and start its timer."""
+        if self._active_wave is not None:
+            raise GreatExpectationsError(
+                "Cannot start a new wave before the active wave has been completed."
+            )
+        metric_ids = self._ready
+        self._ready = []
+        self._active_wave = MetricResolutionWave(
+            index=len(self._waves), metric_ids=metric_ids
+        )
+        return [
+            self._graph.get_metric_configuration(metric_id) for metric_id in metric_ids
+        ]
+
+    def complete_wave(self, metrics: Dict) -> MetricResolutionWave:
+        """Mark the active wave as resolved and release every dependent whose dependencies are now all available.
+
+        Args:
+            metrics: the metrics available after resolving the active wave; every metric in the wave must be present.
+
+        Returns:
+            The completed MetricResolutionWave, including its elapsed time.
+        """
+        wave = self._active_wave
+        if wave is None:
+            raise GreatExpectationsError("There is no active wave to complete.")
+        wave.complete()
+        self._active_wave = None
+        self._waves.append(wave)
+
+        unresolved_metric_ids = [
+            metric_id for metric_id in wave.metric_ids if metric_id not in metrics
+        ]
+        if len(unresolved_metric_ids) > 0:
+            raise GreatExpectationsError(
+                f"Metrics were released for resolution but not resolved: {str(unresolved_metric_ids)}"
+            )
+
+        for metric_id in wave.metric_ids:
+            del self._unmet_dependency_counts[metric_id]
+            self._release_dependents(metric_id)
+        return wave
+
+    def _release_dependents(self, metric_id: Tuple):
+        for dependent_id in self._graph.get_dependents(metric_id):
+            if dependent_id not in self._unmet_dependency_counts:
+                continue
+            self._unmet_dependency_counts[dependent_id] -= 1
+            if self._unmet_dependency_counts[dependent_id] == 0:
+                self._ready.append(dependent_id)
@@ -3,14 +3,16 @@ import datetime
 import inspect
 import json
 import logging
+import math
 import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 from dateutil.parser import parse
+from scipy import stats
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.batch import Batch
@@ -25,7 +27,10 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
 from great_expectations.core.run_identifier import RunIdentifier
-from great_expectations.data_asset.util import recursively_convert_to_json_serializable
+from great_expectations.data_asset.util import (
+    parse_result_format,
+    recursively_convert_to_json_serializable,
+)
 from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
 from great_expectations.exceptions import (
@@ -43,7 +48,9 @@ from great_expectations.util import load_class, verify_dynamic_loading_support
 from great_expectations.validator.validation_graph import (
     MetricConfiguration,
     MetricEdge,
+    MetricResolutionWave,
     ValidationGraph,
+    ValidationGraphScheduler,
 )
 
 logger = logging.getLogger(__name__)
@@ -79,6 +86,9 @@ class Validator:
         self._execution_engine = execution_engine
         self._expose_dataframe_methods = False
         self._validator_config = {}
+        self._metric_resolution_waves = []
+        # The ids of the metrics each expectation of the latest graph_validate call depends on
+        self._expectation_metric_ids = []
 
         if batches is None:
             batches = tuple()
@@ -89,7 +99,9 @@ class Validator:
             assert isinstance(
                 batch, Batch
             ), "batches provided to Validator must be Great Expectations Batch objects"
-            self._execution_engine.load_batch_data(batch.id, batch.data)
+            self._execution_engine.load_batch_data(
+                batch.id, batch.data, batch_markers=batch.batch_markers
+            )
             self._batches[batch.id] = batch
 
         self.interactive_evaluation = interactive_evaluation
@@ -358,7 +370,9 @@ class Validator:
             catch_exceptions = False
 
         processed_configurations = []
+        target_metric_ids = []
         evrs = []
+        self._expectation_metric_ids = []
         for configuration in configurations:
             # Validating
             try:
@@ -383,6 +397,15 @@ class Validator:
                         runtime_configuration=runtime_configuration,
                     )
                 processed_configurations.append(configuration)
+                target_metric_ids.extend(
+                    metric.id for metric in validation_dependencies.values()
+                )
+                self._expectation_metric_ids.append(
+                    (
+                        configuration,
+                        _get_metric_dependency_ids(validation_dependencies.values()),
+                    )
+                )
             except Exception as err:
                 if catch_exceptions:
                     raised_exception = True
@@ -402,7 +425,9 @@ class Validator:
         if metrics is None:
             metrics = dict()
 
-        metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
+        metrics = self.resolve_validation_graph(
+            graph, metrics, runtime_configuration, target_metric_ids=target_metric_ids,
+        )
         for configuration in processed_configurations:
             try:
                 result = configuration.metrics_validate(
@@ -429,23 +454,207 @@ class Validator:
                     raise err
         return evrs
 
-    def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(graph, metrics)
-            metrics.update(
-                self._resolve_metrics(
-                    execution_engine=self._execution_engine,
-                    metrics_to_resolve=ready_metrics,
-                    metrics=metrics,
-                    runtime_configuration=runtime_configuration,
+    def _approximate_graph_validate(
+        self,
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: dict,
+        sample_proportion: float = 0.1,
+        seed: Optional[int] = None,
+        confidence_level: float = 0.95,
+    ) -> Tuple[List[ExpectationValidationResult], dict]:
+        """Validates the expectations with a mostly parameter on a random sample of about sample_proportion of the rows
+        of the active batch, and the others on the full batch.
+
+        The unexpected proportion of the (non-null) values of each sampled expectation is estimated with a Wilson score
+        interval at confidence_level. The sample's result stands if the interval lies entirely within (success) or
+        beyond (failure) the proportion 1 - mostly allows; otherwise the expectation is near its threshold and is
+        validated again on the full batch. Either way, the interval, in percent, is reported in the meta of the result
+        under "approximate_validation". Since no sample can show that there are no unexpected values at all,
+        expectations without mostly (or with mostly=1) that pass on the sample are always validated on the full batch.
+
+        Batches the execution engine cannot sample are validated in full.
+
+        Returns:
+            The validation results, in the order of the configurations, and a summary of the approximation
+        """
+        summary = {
+            "sample_proportion": sample_proportion,
+            "seed": seed,
+            "confidence_level": confidence_level,
+            "sampled_expectations": 0,
+            "escalated_expectations": 0,
+        }
+        sampled_configurations = [
+            configuration
+            for configuration in configurations
+            if _has_mostly_success_kwarg(configuration)
+        ]
+        full_configurations = [
+            configuration
+            for configuration in configurations
+            if not _has_mostly_success_kwarg(configuration)
+        ]
+
+        results = []
+        expectation_metric_ids = []
+        escalated_intervals = {}
+        if sampled_configurations:
+            active_batch_id = self.active_batch_id
+            try:
+                sample_batch_data = self._execution_engine.get_sample_batch_data(
+                    self._execution_engine.active_batch_data,
+                    self.active_batch_spec,
+                    p=sample_proportion,
+                    seed=seed,
+                )
+            except NotImplementedError as e:
+                logger.warning(
+                    f"Validating all expectations on the full batch, since it cannot be sampled: {e}"
+                )
+                sampled_configurations = []
+                full_configurations = configurations
+            else:
+                # The counts the intervals are estimated from are needed even if only success was requested
+                sample_runtime_configuration = dict(runtime_configuration)
+                result_format = parse_result_format(
+                    runtime_configuration.get("result_format") or "BASIC"
+                )
+                if result_format["result_format"] == "BOOLEAN_ONLY":
+                    sample_runtime_configuration["result_format"] = dict(
+                        result_format, result_format="BASIC"
+                    )
+
+                sample_batch_id = f"{active_batch_id}__sample"
+                self._execution_engine.load_batch_data(
+                    sample_batch_id, sample_batch_data
+                )
+                try:
+                    sample_results = self.graph_validate(
+                        sampled_configurations,
+                        runtime_configuration=sample_runtime_configuration,
+                    )
+                    expectation_metric_ids.extend(self._expectation_metric_ids)
+                finally:
+                    self._execution_engine.unload_batch_data(sample_batch_id)
+                    self._execution_engine.active_batch_data_id = active_batch_id
+
+                summary["sampled_expectations"] = len(sampled_configurations)
+                for sample_result in sample_results:
+                    configuration = sample_result.expectation_config
+                    interval = _get_unexpected_proportion_confidence_interval(
+                        sample_result, confidence_level
+                    )
+                    success = _get_approximate_success(sample_result, interval)
+                    if success is None and configuration is not None:
+                        escalated_intervals[id(configuration)] = interval
+                        full_configurations.append(configuration)
+                        continue
+                    if success is not None:
+                        sample_result.success = success
+                    sample_result.meta["approximate_validation"] = {
+                        "unexpected_percent_interval": _to_percent_interval(interval),
+                        "escalated": False,
+                    }
+                    results.append(sample_result)
+                summary["escalated_expectations"] = len(escalated_intervals)
+
+        if full_configurations:
+            full_results = self.graph_validate(
+                full_configurations, runtime_configuration=runtime_configuration
+            )
+            expectation_metric_ids.extend(self._expectation_metric_ids)
+            for full_result in full_results:
+                configuration = full_result.expectation_config
+                if id(configuration) in escalated_intervals:
+                    full_result.meta["approximate_validation"] = {
+                        "unexpected_percent_interval": _to_percent_interval(
+                            escalated_intervals[id(configuration)]
+                        ),
+                        "escalated": True,
+                    }
+                results.append(full_result)
+        self._expectation_metric_ids = expectation_metric_ids
+
+        # Restore the order of the configurations (results of configurations that could not be processed come last)
+        configuration_positions = {
+            id(configuration): position
+            for position, configuration in enumerate(configurations)
+        }
+        results.sort(
+            key=lambda result: configuration_positions.get(
+                id(result.expectation_config), len(configurations)
+            )
+        )
+        return results, summary
+
+    def resolve_validation_graph(
+        self, graph, metrics, runtime_configuration=None, target_metric_ids=None
+    ):
+        """Resolve the metrics in the validation graph, releasing metrics to the execution engine in topological
+        waves. Timings for each wave are available afterwards through the metric_resolution_waves property.
+
+        Metrics found in the execution engine's metric cache are not recomputed. If target_metric_ids is provided,
+        only those metrics and the metrics they depend on are resolved, so that the dependencies of cached metrics are
+        skipped as well.
+        """
+        metrics.update(
+            self._execution_engine.get_cached_metrics(
+                [
+                    graph.get_metric_configuration(metric_id)
+                    for metric_id in graph.metric_ids
+                    if metric_id not in metrics
+                ]
+            )
+        )
+        scheduler = ValidationGraphScheduler(
+            graph, metrics, target_metric_ids=target_metric_ids
+        )
+        self._metric_resolution_waves = scheduler.waves
+        # Let the execution engine keep domains shared by pending metrics available until the last of them resolves
+        self._execution_engine.retain_metric_domains(
+            [
+                graph.get_metric_configuration(metric_id)
+                for metric_id in scheduler.pending_metric_ids
+            ]
+        )
+        try:
+            while scheduler.has_ready_metrics:
+                ready_metrics = scheduler.start_wave()
+                metrics.update(
+                    self._resolve_metrics(
+                        execution_engine=self._execution_engine,
+                        metrics_to_resolve=ready_metrics,
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+                wave = scheduler.complete_wave(metrics)
+                self._execution_engine.release_metric_domains(ready_metrics)
+                logger.debug(
+                    f"Resolved metric wave {wave.index} ({len(wave.metric_ids)} metrics) in {wave.elapsed:.6f} seconds"
                 )
+        finally:
+            self._execution_engine.release_metric_domains(
+                [
+                    graph.get_metric_configuration(metric_id)
+                    for metric_id in scheduler.pending_metric_ids
+                ]
+            )
+
+        pending_metric_ids = scheduler.pending_metric_ids
+        if len(pending_metric_ids) > 0:
+            raise GreatExpectationsError(
+                f"Unable to resolve metrics due to circular or missing dependencies: {str(pending_metric_ids)}"
             )
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
 
         return metrics
 
+    @property
+    def metric_resolution_waves(self) -> List[MetricResolutionWave]:
+        """The waves (with timings) in which metrics were resolved by the most recent call to
+        resolve_validation_graph."""
+        return self._metric_resolution_waves
+
     def _parse_validation_graph(self, validation_graph, metrics):
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
@@ -475,9 +684,12 @@ class Validator:
         runtime_configuration: dict = None,
     ):
         """A means of accessing the Execution Engine's resolve_metrics method, where missing metric configurations are
-        resolved"""
+        resolved. A "max_workers" entry in the runtime configuration enables concurrent metric resolution."""
+        max_workers = None
+        if runtime_configuration is not None:
+            max_workers = runtime_configuration.get("max_workers")
         return execution_engine.resolve_metrics(
-            metrics_to_resolve, metrics, runtime_configuration
+            metrics_to_resolve, metrics, runtime_configuration, max_workers=max_workers,
         )
 
     def _initialize_expectations(
@@ -893,6 +1105,7 @@ class Validator:
         only_return_failures=False,
         run_name=None,
         run_time=None,
+        approximate=False,
     ):
         """Generates a JSON-formatted report describing the outcome of all expectations.
 
@@ -920,6 +1133,11 @@ class Validator:
                 etc.).
             only_return_failures (boolean): \
                 If True, expectation results are only returned when ``success = False`` \
+            approximate (boolean or dict): \
+                If True (or a dict of the sample_proportion, seed and confidence_level keyword arguments of \
+                approximate validation), expectations with a ``mostly`` parameter are validated on a random sample \
+                of the batch, and only those whose sample is inconclusive are validated on the full batch. \
+                See _approximate_graph_validate.
 
         Returns:
             A JSON-formatted dictionary containing a list of the validation results. \
@@ -959,6 +1177,7 @@ class Validator:
         Raises:
            AttributeError - if 'catch_exceptions'=None and an expectation throws an AttributeError
         """
+        query_report_observer = None
         try:
             validation_time = datetime.datetime.now(datetime.timezone.utc).strftime(
                 "%Y%m%dT%H%M%S.%fZ"
@@ -1095,13 +1314,32 @@ class Validator:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
-            results = self.graph_validate(
-                expectations_to_evaluate,
-                runtime_configuration={
-                    "catch_exceptions": catch_exceptions,
-                    "result_format": result_format,
-                },
-            )
+            # Engines recording their queries report those run for this validation in the meta of its result
+            if hasattr(self._execution_engine, "add_query_report_observer"):
+                query_report_observer = (
+                    self._execution_engine.add_query_report_observer()
+                )
+
+            runtime_configuration = {
+                "catch_exceptions": catch_exceptions,
+                "result_format": result_format,
+            }
+            approximate_validation_summary = None
+            if approximate:
+                approximation = {} if approximate is True else dict(approximate)
+                (
+                    results,
+                    approximate_validation_summary,
+                ) = self._approximate_graph_validate(
+                    expectations_to_evaluate,
+                    runtime_configuration=runtime_configuration,
+                    **approximation,
+                )
+            else:
+                results = self.graph_validate(
+                    expectations_to_evaluate,
+                    runtime_configuration=runtime_configuration,
+                )
             statistics = _calc_validation_statistics(results)
 
             if only_return_failures:
@@ -1133,6 +1371,15 @@ class Validator:
                     "validation_time": validation_time,
                 },
             )
+            if approximate_validation_summary is not None:
+                result.meta["approximate_validation"] = approximate_validation_summary
+            if query_report_observer is not None:
+                result.meta["query_report"] = query_report_observer.get_report(
+                    expectation_metric_ids=[
+                        (configuration.to_json_dict(), metric_ids)
+                        for configuration, metric_ids in self._expectation_metric_ids
+                    ]
+                )
 
             self._data_context = validate__data_context
         except Exception as e:
@@ -1146,6 +1393,8 @@ class Validator:
             raise
         finally:
             self._active_validation = False
+            if query_report_observer is not None:
+                self._execution_engine.remove_query_observer(query_report_observer)
 
         if getattr(data_context, "_usage_statistics_handler", None):
             handler = data_context._usage_statistics_handler
@@ -1255,6 +1504,87 @@ ValidationStatistics = namedtuple(
 )
 
 
+def _get_metric_dependency_ids(metrics: Iterable[MetricConfiguration]) -> set:
+    """Returns the ids of the metrics and of every metric they (transitively) depend on."""
+    metric_ids = set()
+    metrics = list(metrics)
+    while len(metrics) > 0:
+        metric = metrics.pop()
+        if metric.id in metric_ids:
+            continue
+        metric_ids.add(metric.id)
+        metrics.extend(metric.metric_dependencies.values())
+    return metric_ids
+
+
+def _has_mostly_success_kwarg(configuration: ExpectationConfiguration) -> bool:
+    try:
+        return (
+            "mostly"
+            in get_expectation_impl(configuration.expectation_type).success_keys
+        )
+    except Exception:
+        # Invalid configurations are reported by graph_validate
+        return False
+
+
+def _get_unexpected_proportion_confidence_interval(
+    result: ExpectationValidationResult, confidence_level: float
+) -> Optional[Tuple[float, float]]:
+    """Returns the Wilson score interval, at confidence_level, of the proportion of unexpected values among the
+    non-null values a (sample's) validation result counted, or None if it counted none."""
+    if result.exception_info.get("raised_exception"):
+        return None
+    unexpected_count = result.result.get("unexpected_count")
+    element_count = result.result.get("element_count")
+    if unexpected_count is None or element_count is None:
+        return None
+    nonnull_count = element_count - (result.result.get("missing_count") or 0)
+    if nonnull_count <= 0:
+        return None
+
+    z = stats.norm.ppf(1 - (1 - confidence_level) / 2)
+    proportion = unexpected_count / nonnull_count
+    denominator = 1 + z ** 2 / nonnull_count
+    center = (proportion + z ** 2 / (2 * nonnull_count)) / denominator
+    half_width = (
+        z
+        * math.sqrt(
+            proportion * (1 - proportion) / nonnull_count
+            + z ** 2 / (4 * nonnull_count ** 2)
+        )
+        / denominator
+    )
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def _get_approximate_success(
+    result: ExpectationValidationResult, interval: Optional[Tuple[float, float]]
+) -> Optional[bool]:
+    """Returns whether the expectation of a sample's validation result succeeds with confidence, given the interval of
+    its unexpected proportion, or None if the interval straddles the proportion its mostly parameter allows."""
+    if interval is None or result.expectation_config is None:
+        return None
+    mostly = result.expectation_config.kwargs.get("mostly", 1)
+    if not isinstance(mostly, (int, float)):
+        return None
+    allowed_unexpected_proportion = 1 - mostly
+    lower, upper = interval
+    if upper <= allowed_unexpected_proportion:
+        return True
+    if lower > allowed_unexpected_proportion:
+        return False
+    return None
+
+
+def _to_percent_interval(
+    interval: Optional[Tuple[float, float]]
+) -> Optional[List[float]]:
+    if interval is None:
+        return None
+    return [100 * interval[0], 100 * interval[1]]
+
+
 def _calc_validation_statistics(validation_results):
     """
     Calculate summary statistics for the validation results and
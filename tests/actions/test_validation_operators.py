@@ -1,11 +1,17 @@
 # TODO: ADD TESTS ONCE GET_BATCH IS INTEGRATED!
 
+import threading
+import time
+
 import pandas as pd
+import pytest
 from freezegun import freeze_time
 
 import great_expectations as ge
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.data_context import BaseDataContext
 from great_expectations.validation_operators.validation_operators import (
+    ActionListValidationOperator,
     WarningAndFailureExpectationSuitesValidationOperator,
 )
 
@@ -180,3 +186,221 @@ def test_errors_warnings_validation_operator_run_slack_query(
     print(json.dumps(slack_query, indent=2))
     print(json.dumps(expected_slack_query, indent=2))
     assert slack_query == expected_slack_query
+
+
+def _build_datasets_to_validate(count):
+    suite = ExpectationSuite(expectation_suite_name="concurrent_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "x", "min_value": 1, "max_value": 9},
+        )
+    )
+    return [
+        ge.dataset.PandasDataset(
+            pd.DataFrame({"x": [1, 2, 3, 4, 10 if i % 2 else 5]}),
+            expectation_suite=suite,
+            batch_kwargs={"ge_batch_id": f"batch_{i}"},
+        )
+        for i in range(count)
+    ]
+
+
+def test_action_list_validation_operator_run_concurrently(
+    basic_data_context_config_for_validation_operator, tmp_path_factory
+):
+    data_context = BaseDataContext(
+        basic_data_context_config_for_validation_operator,
+        str(tmp_path_factory.mktemp("great_expectations")),
+    )
+    action_list = [
+        {
+            "name": "store_validation_result",
+            "action": {
+                "class_name": "StoreValidationResultAction",
+                "target_store_name": "validation_result_store",
+            },
+        }
+    ]
+    serial_operator = ActionListValidationOperator(
+        data_context=data_context, action_list=action_list, name="serial"
+    )
+    concurrent_operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=action_list,
+        name="concurrent",
+        max_concurrency=4,
+    )
+    assert (
+        concurrent_operator.validation_operator_config["kwargs"]["max_concurrency"] == 4
+    )
+    assert "max_concurrency" not in serial_operator.validation_operator_config["kwargs"]
+
+    serial_result = serial_operator.run(
+        assets_to_validate=_build_datasets_to_validate(10), run_name="serial"
+    )
+    concurrent_result = concurrent_operator.run(
+        assets_to_validate=_build_datasets_to_validate(10), run_name="concurrent"
+    )
+
+    # run results are listed in the order of the assets, however validations were scheduled
+    assert [
+        validation_result_id.batch_identifier
+        for validation_result_id in concurrent_result.run_results
+    ] == [f"ge_batch_id=batch_{i}" for i in range(10)]
+    assert [
+        run_result["validation_result"].success
+        for run_result in concurrent_result.run_results.values()
+    ] == [
+        run_result["validation_result"].success
+        for run_result in serial_result.run_results.values()
+    ]
+    assert not concurrent_result.success
+    for validation_result_id, run_result in concurrent_result.run_results.items():
+        assert run_result["actions_results"] == {
+            "store_validation_result": {"class": "StoreValidationResultAction"}
+        }
+        assert (
+            data_context.validations_store.get(validation_result_id).statistics
+            == run_result["validation_result"].statistics
+        )
+
+
+def test_action_list_validation_operator_run_concurrently_fails_fast(
+    basic_data_context_config_for_validation_operator, tmp_path_factory
+):
+    data_context = BaseDataContext(
+        basic_data_context_config_for_validation_operator,
+        str(tmp_path_factory.mktemp("great_expectations")),
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context, action_list=[], name="test", max_concurrency=2,
+    )
+    datasets = _build_datasets_to_validate(20)
+
+    def fail(*args, **kwargs):
+        raise ValueError("validation failed")
+
+    datasets[0].validate = fail
+    with pytest.raises(ValueError, match="validation failed"):
+        operator.run(assets_to_validate=datasets, run_name="test")
+
+
+def test_action_list_validation_operator_run_concurrently_validators_of_one_datasource(
+    empty_data_context_v3,
+):
+    context = empty_data_context_v3
+    context.add_datasource(
+        "my_pipeline_datasource",
+        class_name="Datasource",
+        execution_engine={"class_name": "PandasExecutionEngine"},
+        data_connectors={
+            "my_runtime_data_connector": {
+                "class_name": "RuntimeDataConnector",
+                "runtime_keys": ["run_id"],
+            }
+        },
+    )
+    validators = []
+    # The validators share the execution engine of the datasource, which was last loaded with the batch of 8 rows
+    for run_id, row_count in [(1, 4), (2, 8)]:
+        suite = context.create_expectation_suite(f"rows_of_run_{run_id}")
+        suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_equal",
+                kwargs={"value": row_count},
+            )
+        )
+        validators.append(
+            context.get_validator(
+                datasource_name="my_pipeline_datasource",
+                data_connector_name="my_runtime_data_connector",
+                data_asset_name="IN_MEMORY_DATA_ASSET",
+                batch_data=pd.DataFrame({"x": range(row_count)}),
+                partition_request={"partition_identifiers": {"run_id": run_id}},
+                expectation_suite=suite,
+            )
+        )
+    assert validators[0].execution_engine is validators[1].execution_engine
+
+    operator = ActionListValidationOperator(
+        data_context=context, action_list=[], name="test", max_concurrency=2,
+    )
+    result = operator.run(assets_to_validate=validators, run_name="test")
+
+    assert [
+        validation_result_id.batch_identifier
+        for validation_result_id in result.run_results
+    ] == [list(validator.batches)[0] for validator in validators]
+    assert [
+        run_result["validation_result"].success
+        for run_result in result.run_results.values()
+    ] == [True, True]
+
+
+def test_action_list_validation_operator_run_concurrently_limits_validations(
+    empty_data_context_v3,
+):
+    context = empty_data_context_v3
+    suite = context.create_expectation_suite("rows")
+    assets_to_validate = _build_datasets_to_validate(4)
+    # Each datasource has an execution engine of its own, whose validators are validated on a thread of their own
+    for datasource_index in range(3):
+        context.add_datasource(
+            f"my_datasource_{datasource_index}",
+            class_name="Datasource",
+            execution_engine={"class_name": "PandasExecutionEngine"},
+            data_connectors={
+                "my_runtime_data_connector": {
+                    "class_name": "RuntimeDataConnector",
+                    "runtime_keys": ["run_id"],
+                }
+            },
+        )
+        assets_to_validate.append(
+            context.get_validator(
+                datasource_name=f"my_datasource_{datasource_index}",
+                data_connector_name="my_runtime_data_connector",
+                data_asset_name="IN_MEMORY_DATA_ASSET",
+                batch_data=pd.DataFrame({"x": range(4)}),
+                partition_request={"partition_identifiers": {"run_id": 1}},
+                expectation_suite=suite,
+            )
+        )
+
+    operator = ActionListValidationOperator(
+        data_context=context, action_list=[], name="test", max_concurrency=2,
+    )
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+    validate_item = operator._validate_item
+
+    def count_running_validations(*args, **kwargs):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        try:
+            time.sleep(0.05)
+            return validate_item(*args, **kwargs)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    operator._validate_item = count_running_validations
+    result = operator.run(assets_to_validate=assets_to_validate, run_name="test")
+
+    assert len(result.run_results) == 7
+    assert max_running[0] == 2
+
+
+def test_action_list_validation_operator_rejects_invalid_max_concurrency(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    with pytest.raises(ValueError):
+        ActionListValidationOperator(
+            data_context=basic_in_memory_data_context_for_validation_operator,
+            action_list=[],
+            name="test",
+            max_concurrency=0,
+        )
@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.hyperloglog import HyperLogLog
+
+
+def test_hyperloglog_is_nearly_exact_for_small_cardinalities():
+    sketch = HyperLogLog()
+    assert sketch.count() == 0
+
+    sketch.update(pd.Series(["a", "b", None, "a", np.nan, "c"]))
+    assert sketch.count() == 3
+
+    sketch.update([1, 2, 3, 2.5])
+    assert sketch.count() == 7
+
+
+@pytest.mark.parametrize("n_distinct", [1000, 100000])
+def test_hyperloglog_estimate_is_within_error(n_distinct):
+    values = np.random.RandomState(0).permutation(np.repeat(np.arange(n_distinct), 3))
+    sketch = HyperLogLog()
+    sketch.update(values)
+    assert abs(sketch.count() - n_distinct) <= 4 * sketch.relative_standard_error * (
+        n_distinct
+    )
+
+
+def test_hyperloglog_merged_chunks_match_single_pass():
+    values = np.arange(50000) % 20000
+    single_pass = HyperLogLog(precision=12)
+    single_pass.update(values)
+
+    merged = HyperLogLog(precision=12)
+    for chunk in np.array_split(values, 7):
+        chunk_sketch = HyperLogLog(precision=12)
+        chunk_sketch.update(chunk)
+        merged.merge(chunk_sketch)
+
+    assert merged.count() == single_pass.count()
+    with pytest.raises(ValueError):
+        merged.merge(HyperLogLog(precision=13))
+
+
+def test_hyperloglog_json_round_trip():
+    sketch = HyperLogLog(precision=11)
+    sketch.update(range(5000))
+    restored = HyperLogLog.from_json_dict(json.loads(json.dumps(sketch.to_json_dict())))
+    assert restored.count() == sketch.count()
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=4)
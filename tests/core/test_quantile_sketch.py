@@ -0,0 +1,85 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.quantile_sketch import (
+    DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR,
+    QuantileSketch,
+    get_quantile_sketch_relative_error,
+)
+
+QUANTILES = [0.0, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0]
+
+
+def _rank_errors(sorted_values, estimates, quantiles):
+    n = len(sorted_values)
+    return [
+        abs(np.searchsorted(sorted_values, estimate) - quantile * (n - 1)) / n
+        for estimate, quantile in zip(estimates, quantiles)
+    ]
+
+
+def test_get_quantile_sketch_relative_error():
+    assert get_quantile_sketch_relative_error(False) is None
+    assert get_quantile_sketch_relative_error(0) is None
+    assert (
+        get_quantile_sketch_relative_error(True)
+        == DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+    )
+    assert get_quantile_sketch_relative_error(0.05) == 0.05
+    with pytest.raises(ValueError):
+        get_quantile_sketch_relative_error(1.5)
+    with pytest.raises(ValueError):
+        get_quantile_sketch_relative_error("yes")
+
+
+def test_quantile_sketch_is_exact_for_small_inputs():
+    values = pd.Series([5, 1, 3, 2, 8, 9, 4, np.nan])
+    sketch = QuantileSketch(relative_error=0.01)
+    sketch.update(values.values)
+
+    assert sketch.is_exact
+    assert sketch.count == 7
+    assert (
+        sketch.get_quantiles(QUANTILES)
+        == values.quantile(QUANTILES, interpolation="nearest").tolist()
+    )
+
+
+def test_quantile_sketch_rank_error_is_bounded():
+    values = np.random.default_rng(42).normal(size=100000)
+    sketch = QuantileSketch(relative_error=0.01)
+    for chunk in np.array_split(values, 17):
+        sketch.update(chunk)
+
+    assert not sketch.is_exact
+    assert sum(len(level) for level in sketch._levels) < 1000
+    estimates = sketch.get_quantiles(QUANTILES)
+    assert estimates[0] == values.min() and estimates[-1] == values.max()
+    assert max(_rank_errors(np.sort(values), estimates, QUANTILES)) <= 0.01
+
+
+def test_quantile_sketches_merge_after_serialization():
+    values = np.random.default_rng(7).exponential(size=60000)
+    partition_sketches = []
+    for partition in np.array_split(values, 3):
+        sketch = QuantileSketch(relative_error=0.01)
+        sketch.update(partition)
+        # Per-partition sketches can be stored and merged later
+        partition_sketches.append(json.dumps(sketch.to_json_dict()))
+
+    merged = QuantileSketch(relative_error=0.01)
+    for serialized_sketch in partition_sketches:
+        merged.merge(QuantileSketch.from_json_dict(json.loads(serialized_sketch)))
+
+    assert merged.count == len(values)
+    assert (
+        max(_rank_errors(np.sort(values), merged.get_quantiles(QUANTILES), QUANTILES))
+        <= 0.01
+    )
+
+
+def test_empty_quantile_sketch():
+    assert QuantileSketch(relative_error=0.01).get_quantiles([0.5]) == [None]
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.space_saving import SpaceSavingSketch, get_top_k_counts
+
+
+def test_space_saving_is_exact_below_capacity():
+    sketch = SpaceSavingSketch(capacity=10)
+    sketch.update(pd.Series(["b", "a", "b", None, "c", "b", "a"]))
+
+    assert sketch.is_exact
+    top_k = sketch.get_top_k(2)
+    assert list(top_k.index) == ["b", "a"]
+    assert list(top_k.values) == [3, 2]
+
+    with pytest.raises(ValueError):
+        SpaceSavingSketch(capacity=0)
+
+
+def test_space_saving_finds_heavy_hitters_across_chunks():
+    values = np.random.RandomState(0).zipf(1.5, 100000)
+    sketch = SpaceSavingSketch(capacity=100)
+    for chunk in np.array_split(values, 20):
+        chunk_sketch = SpaceSavingSketch(capacity=100)
+        chunk_sketch.update(chunk)
+        sketch.merge(chunk_sketch)
+
+    expected = pd.Series(values).value_counts()
+    top_k = sketch.get_top_k(5)
+    assert list(top_k.index) == list(expected.index[:5])
+    # Counts are only ever overestimated, by at most the recorded error
+    errors = sketch.get_errors()
+    for value, count in top_k.items():
+        assert expected[value] <= count <= expected[value] + errors[value]
+    assert not sketch.is_exact
+
+
+def test_get_top_k_counts_breaks_ties_by_value():
+    counts = pd.Series({"c": 2, "a": 2, "b": 5, "d": 1})
+    top_k = get_top_k_counts(counts, 3)
+    assert list(top_k.index) == ["b", "a", "c"]
+    assert top_k.name == "count"
@@ -5,7 +5,7 @@ import pytest
 
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 
 def test_database_store_backend_schema_spec(caplog, sa, test_backends):
@@ -174,3 +174,70 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
     assert store_backend.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(store_backend.store_backend_id)
+
+
+def test_database_store_backend_set_many_and_get_many(sa):
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_set_many",
+        key_columns=["k1", "k2"],
+    )
+    statements = []
+
+    @sa.event.listens_for(store_backend.engine, "before_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    values = {("a", str(i)): f"value_{i}" for i in range(500)}
+    store_backend.set_many(values)
+    # All the keys are written with one statement, executed for all of them at once
+    assert len(statements) == 1
+
+    statements.clear()
+    assert store_backend.get_many(list(values)) == values
+    # Keys are read in batches of MAX_BIND_PARAMETERS bound parameters
+    assert len(statements) == 2
+
+    # Existing keys are updated, without touching other keys sharing their first element
+    store_backend.set_many({("a", "0"): "new_value", ("b", "0"): "other_value"})
+    store_backend.set(("a", "1"), "newer_value")
+    assert store_backend.get(("a", "0")) == "new_value"
+    assert store_backend.get(("a", "1")) == "newer_value"
+    assert store_backend.get(("a", "2")) == "value_2"
+    assert store_backend.get(("b", "0")) == "other_value"
+    assert len(store_backend.list_keys(("a",))) == 500
+    assert store_backend.list_keys(("b",)) == [("b", "0")]
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("a", "0"), ("c", "0")])
+
+
+def test_database_store_backend_set_many_without_dialect_upsert(sa, monkeypatch):
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_set_many_without_upsert",
+        key_columns=["k1", "k2"],
+    )
+    store_backend.set_many({("a", "0"): "value_0", ("a", "1"): "value_1"})
+
+    # Dialects without an upsert look up the existing keys, then update and insert
+    monkeypatch.setattr(store_backend.engine.dialect, "name", "mssql")
+    statements = []
+
+    @sa.event.listens_for(store_backend.engine, "before_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    store_backend.set_many(
+        {("a", "0"): "new_value_0", ("a", "1"): "new_value_1", ("b", "0"): "value"}
+    )
+    assert [statement.split()[0] for statement in statements] == [
+        "SELECT",
+        "UPDATE",
+        "INSERT",
+    ]
+    assert store_backend.get_many([("a", "0"), ("a", "1"), ("b", "0")]) == {
+        ("a", "0"): "new_value_0",
+        ("a", "1"): "new_value_1",
+        ("b", "0"): "value",
+    }
@@ -238,3 +238,44 @@ def test_database_evaluation_parameter_store_get_bind_params(param_store):
         "urn:great_expectations:validations:asset2.warning:"
         "expect_column_values_to_match_regex.result.unexpected_percent:column=mycol": 12.3456789,
     }
+
+
+def test_evaluation_parameter_store_set_many_and_get_bind_params_with_sqlite(sa):
+    param_store = instantiate_class_from_config(
+        config={
+            "class_name": "EvaluationParameterStore",
+            "store_backend": {"class_name": "DatabaseStoreBackend", "url": "sqlite://"},
+        },
+        config_defaults={"module_name": "great_expectations.data_context.store"},
+        runtime_environment={},
+    )
+    run_id = RunIdentifier(run_name="20191125T000000.000000Z")
+    other_run_id = RunIdentifier(run_name="20191126T000000.000000Z")
+    param_store.set_many(
+        {
+            ValidationMetricIdentifier(
+                run_id=run_id,
+                data_asset_name=None,
+                expectation_suite_identifier="asset.warning",
+                metric_name="expect_table_row_count_to_be_between.result.observed_value",
+                metric_kwargs_id=f"column=col_{i}",
+            ): i
+            for i in range(3)
+        }
+    )
+    param_store.set(
+        ValidationMetricIdentifier(
+            run_id=other_run_id,
+            data_asset_name=None,
+            expectation_suite_identifier="asset.warning",
+            metric_name="expect_table_row_count_to_be_between.result.observed_value",
+            metric_kwargs_id=None,
+        ),
+        3,
+    )
+
+    assert param_store.get_bind_params(run_id) == {
+        "urn:great_expectations:validations:asset.warning:"
+        f"expect_table_row_count_to_be_between.result.observed_value:column=col_{i}": i
+        for i in range(3)
+    }
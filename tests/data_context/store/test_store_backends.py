@@ -1,5 +1,6 @@
 import datetime
 import os
+import time
 import uuid
 from unittest.mock import patch
 
@@ -17,6 +18,7 @@ from great_expectations.data_context.store import (
     TupleGCSStoreBackend,
     TupleS3StoreBackend,
 )
+from great_expectations.data_context.store.tuple_store_backend import KeyIndexCache
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
@@ -892,3 +894,141 @@ def test_TupleGCSStoreBackend():
         == "https://storage.googleapis.com/leakybucket"
         + f"/this_is_a_test_prefix/my_suite_name/my_run_id/{run_time_string}/my_batch_id"
     )
+
+
+@mock_s3
+def test_TupleS3StoreBackend_list_keys_pages_and_fans_out_across_prefixes():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+    # More objects than fit in one page of list_objects_v2, under several "directories"
+    client = boto3.client("s3")
+    for directory in ["a", "b", "c"]:
+        for i in range(400):
+            client.put_object(
+                Bucket=bucket, Key=f"{prefix}/{directory}/{i}.json", Body=b"{}"
+            )
+    expected_keys = {
+        (directory, f"{i}.json") for directory in ["a", "b", "c"] for i in range(400)
+    }
+    expected_keys.add((".ge_store_backend_id",))
+
+    my_store = TupleS3StoreBackend(bucket=bucket, prefix=prefix)
+    keys = my_store.list_keys()
+    assert len(keys) == 1201
+    assert set(keys) == expected_keys
+
+    my_parallel_store = TupleS3StoreBackend(
+        bucket=bucket, prefix=prefix, list_keys_max_workers=3
+    )
+    parallel_keys = my_parallel_store.list_keys()
+    assert len(parallel_keys) == 1201
+    assert set(parallel_keys) == expected_keys
+
+    # The client is reused across calls
+    assert my_parallel_store._get_s3_client() is my_parallel_store._get_s3_client()
+
+
+@mock_s3
+def test_TupleS3StoreBackend_list_keys_cache():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        bucket=bucket, prefix=prefix, list_keys_cache_ttl_seconds=3600
+    )
+    my_store.set(("AAA",), "aaa")
+    assert set(my_store.list_keys()) == {("AAA",), (".ge_store_backend_id",)}
+    assert my_store.has_key(("AAA",))
+
+    # Objects written by others are not seen until the index expires...
+    boto3.client("s3").put_object(Bucket=bucket, Key=f"{prefix}/BBB", Body=b"bbb")
+    assert set(my_store.list_keys()) == {("AAA",), (".ge_store_backend_id",)}
+    assert not my_store.has_key(("BBB",))
+
+    # ...but keys set through the store backend are
+    my_store.set(("CCC",), "ccc")
+    assert set(my_store.list_keys()) == {
+        ("AAA",),
+        ("CCC",),
+        (".ge_store_backend_id",),
+    }
+
+    my_store._key_index.clear()
+    assert set(my_store.list_keys()) == {
+        ("AAA",),
+        ("BBB",),
+        ("CCC",),
+        (".ge_store_backend_id",),
+    }
+
+    my_uncached_store = TupleS3StoreBackend(bucket=bucket, prefix=prefix)
+    assert my_uncached_store.has_key(("BBB",))
+    assert not my_uncached_store.has_key(("DDD",))
+
+
+def test_KeyIndexCache_expires():
+    key_index = KeyIndexCache(ttl_seconds=0.5)
+    assert key_index.get() is None
+    key_index.add(("AAA",))
+    assert key_index.get() is None
+
+    key_index.set([("AAA",), ("BBB",)])
+    key_index.add(("CCC",))
+    assert key_index.get() == [("AAA",), ("BBB",), ("CCC",)]
+
+    with patch("time.monotonic", return_value=time.monotonic() + 1):
+        assert key_index.get() is None
+
+
+def test_TupleGCSStoreBackend_list_keys_fans_out_across_prefixes():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+    project = "dummy-project"
+
+    class MockBlob:
+        def __init__(self, name):
+            self.name = name
+
+    class MockBlobIterator(list):
+        prefixes = set()
+
+    def list_blobs(bucket_name, prefix, delimiter=None):
+        if delimiter is None:
+            return MockBlobIterator([MockBlob(f"{prefix}{i}.json") for i in range(2)])
+        blobs = MockBlobIterator([MockBlob(f"{prefix}.ge_store_backend_id")])
+        blobs.prefixes = {f"{prefix}b/", f"{prefix}a/"}
+        return blobs
+
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_client = mock_gcs_client.return_value
+        mock_client.list_blobs.side_effect = list_blobs
+
+        my_store = TupleGCSStoreBackend(
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+            suppress_store_backend_id=True,
+            list_keys_max_workers=2,
+        )
+        assert my_store.list_keys() == [
+            (".ge_store_backend_id",),
+            ("a", "0.json"),
+            ("a", "1.json"),
+            ("b", "0.json"),
+            ("b", "1.json"),
+        ]
+        mock_client.list_blobs.assert_any_call(
+            "leakybucket", prefix="this_is_a_test_prefix/", delimiter="/"
+        )
+        mock_client.list_blobs.assert_any_call(
+            "leakybucket", prefix="this_is_a_test_prefix/a/"
+        )
+        mock_client.list_blobs.assert_any_call(
+            "leakybucket", prefix="this_is_a_test_prefix/b/"
+        )
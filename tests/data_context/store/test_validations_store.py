@@ -1,4 +1,7 @@
 import datetime
+import json
+import os
+from unittest.mock import patch
 
 import boto3
 import pytest
@@ -10,11 +13,16 @@ from great_expectations.core import ExpectationSuiteValidationResult
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
 )
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store import ValidationsStore
+from great_expectations.data_context.store.validation_result_index import (
+    ValidationResultIndex,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.exceptions import DataContextError
 from great_expectations.util import gen_directory_tree_str
 
 
@@ -295,3 +303,147 @@ def test_ValidationsStore_with_DatabaseStoreBackend(sa):
     assert my_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(my_store.store_backend_id)
+
+
+def _validation_result_key(
+    expectation_suite_name, run_name, run_time, batch_identifier
+):
+    return ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(
+            expectation_suite_name=expectation_suite_name,
+        ),
+        run_id=RunIdentifier(run_name=run_name, run_time=run_time),
+        batch_identifier=batch_identifier,
+    )
+
+
+def test_ValidationsStore_with_index_and_TupleFileSystemStoreBackend(tmp_path_factory,):
+    path = str(
+        tmp_path_factory.mktemp(
+            "test_ValidationsStore_with_index_and_TupleFileSystemStoreBackend"
+        )
+    )
+    store_backend = {
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    runtime_environment = {"root_directory": path}
+
+    # Results stored before the index is used are indexed when it is first loaded
+    my_unindexed_store = ValidationsStore(
+        store_backend=store_backend, runtime_environment=runtime_environment
+    )
+    key_1 = _validation_result_key("suite_a", "run_1", "20200101T000000Z", "batch_1")
+    my_unindexed_store.set(key_1, ExpectationSuiteValidationResult(success=True))
+
+    my_store = ValidationsStore(
+        store_backend=store_backend,
+        runtime_environment=runtime_environment,
+        use_index=True,
+    )
+    key_2 = _validation_result_key("suite_b", "run_2", "20200103T000000Z", "batch_1")
+    key_3 = _validation_result_key("suite_a", "run_3", "20200102T000000Z", "batch_1")
+    key_4 = _validation_result_key("suite_a", "run_3", "20200102T000000Z", "batch_2")
+    for key in [key_2, key_3, key_4]:
+        my_store.set(key, ExpectationSuiteValidationResult(success=True))
+
+    assert my_store.get_latest_key("suite_a") == key_4
+    assert my_store.get_latest_key("suite_a", batch_identifier="batch_1") == key_3
+    assert (
+        my_store.get_latest_key(
+            "suite_a",
+            run_id=RunIdentifier(run_name="run_1", run_time="20200101T000000Z"),
+        )
+        == key_1
+    )
+    assert my_store.get_latest_key("suite_b", batch_identifier="batch_2") is None
+    assert my_store.get_latest_key("suite_c") is None
+    assert my_store.get_latest_keys(3) == [key_2, key_4, key_3]
+    assert my_store.get_latest_keys(5, expectation_suite_name="suite_a") == [
+        key_4,
+        key_3,
+        key_1,
+    ]
+    assert set(my_store.list_keys()) == {key_1, key_2, key_3, key_4}
+
+    # The unindexed store finds the same results by listing every key
+    assert my_unindexed_store.get_latest_key("suite_a") == key_4
+    assert my_unindexed_store.get_latest_keys(3) == [key_2, key_4, key_3]
+    assert ValidationResultIndex.MANIFEST_KEY not in [
+        key.to_tuple() for key in my_unindexed_store.list_keys()
+    ]
+
+    with open(
+        os.path.join(path, "my_store", ".ge_validation_result_index.json")
+    ) as manifest:
+        assert manifest.read().splitlines() == [
+            json.dumps(list(key.to_tuple())) for key in [key_1, key_3, key_4, key_2]
+        ]
+
+    # A new store loads the index from the manifest
+    my_other_store = ValidationsStore(
+        store_backend=store_backend,
+        runtime_environment=runtime_environment,
+        use_index=True,
+    )
+    with patch.object(
+        my_other_store.store_backend,
+        "list_keys",
+        side_effect=AssertionError("The store backend should not be listed"),
+    ):
+        assert my_other_store.get_latest_keys(1) == [key_2]
+
+
+@mock_s3
+def test_ValidationsStore_with_index_and_TupleS3StoreBackend():
+    bucket = "test_validation_store_bucket"
+    prefix = "test/prefix"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleS3StoreBackend",
+            "bucket": bucket,
+            "prefix": prefix,
+        },
+        use_index=True,
+    )
+    key_1 = _validation_result_key("suite_a", "run_1", "20200101T000000Z", "batch_1")
+    key_2 = _validation_result_key("suite_a", "run_2", "20200102T000000Z", "batch_1")
+    my_store.set(key_2, ExpectationSuiteValidationResult(success=False))
+    my_store.set(key_1, ExpectationSuiteValidationResult(success=True))
+
+    assert my_store.get_latest_key("suite_a") == key_2
+    assert my_store.get(my_store.get_latest_key("suite_a")).success is False
+    assert {
+        s3_object_info["Key"]
+        for s3_object_info in boto3.client("s3").list_objects_v2(
+            Bucket=bucket, Prefix=prefix
+        )["Contents"]
+    } == {
+        "test/prefix/.ge_store_backend_id",
+        "test/prefix/.ge_validation_result_index.json",
+        "test/prefix/suite_a/run_1/20200101T000000.000000Z/batch_1.json",
+        "test/prefix/suite_a/run_2/20200102T000000.000000Z/batch_1.json",
+    }
+
+
+def test_ValidationsStore_with_index_requires_tuple_store_backend(tmp_path_factory):
+    path = str(
+        tmp_path_factory.mktemp(
+            "test_ValidationsStore_with_index_requires_tuple_store_backend"
+        )
+    )
+    with pytest.raises(DataContextError):
+        ValidationsStore(
+            store_backend={
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "my_store/",
+                "filepath_template": "{0}/{1}/{2}/{3}.json",
+                "filepath_suffix": None,
+            },
+            runtime_environment={"root_directory": path},
+            use_index=True,
+        )
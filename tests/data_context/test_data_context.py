@@ -8,7 +8,11 @@ import pytest
 from freezegun import freeze_time
 from ruamel.yaml import YAML
 
-from great_expectations.core import ExpectationConfiguration, expectationSuiteSchema
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuiteValidationResult,
+    expectationSuiteSchema,
+)
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.run_identifier import RunIdentifier
@@ -21,6 +25,7 @@ from great_expectations.data_context.store import ExpectationsStore
 from great_expectations.data_context.types.base import DataContextConfig
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.dataset import Dataset
@@ -292,6 +297,36 @@ def test_data_context_get_validation_result(titanic_data_context):
     assert len(failed_validation_result.results) == 8
 
 
+def test_data_context_get_validation_result_gets_latest_result_of_suite(
+    empty_data_context,
+):
+    for expectation_suite_name, run_name, run_time, success in [
+        ("suite_a", "run_1", "20200101T000000Z", True),
+        ("suite_a", "run_2", "20200102T000000Z", False),
+        ("suite_b", "run_3", "20200103T000000Z", True),
+    ]:
+        empty_data_context.validations_store.set(
+            ValidationResultIdentifier(
+                expectation_suite_identifier=ExpectationSuiteIdentifier(
+                    expectation_suite_name
+                ),
+                run_id=RunIdentifier(run_name=run_name, run_time=run_time),
+                batch_identifier="batch_1",
+            ),
+            ExpectationSuiteValidationResult(success=success),
+        )
+
+    assert empty_data_context.get_validation_result("suite_a").success is False
+    assert (
+        empty_data_context.get_validation_result(
+            "suite_a",
+            run_id=RunIdentifier(run_name="run_1", run_time="20200101T000000Z"),
+        ).success
+        is True
+    )
+    assert empty_data_context.get_validation_result("suite_c") == {}
+
+
 def test_data_context_get_datasource(titanic_data_context):
     isinstance(titanic_data_context.get_datasource("mydatasource"), LegacyDatasource)
 
@@ -1568,6 +1603,103 @@ def test_get_checkpoint_raises_error_on_missing_batch_kwargs(empty_data_context)
         context.get_checkpoint("foo")
 
 
+def test_run_checkpoint_loads_each_batch_once(titanic_data_context):
+    yaml = YAML(typ="safe")
+    context = titanic_data_context
+    for suite_name, expectation_type in [
+        ("suite_one", "expect_column_values_to_not_be_null"),
+        ("suite_two", "expect_column_values_to_not_be_null"),
+        ("suite_three", "expect_column_to_exist"),
+    ]:
+        suite = context.create_expectation_suite(suite_name)
+        suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type=expectation_type, kwargs={"column": "Name"}
+            )
+        )
+        context.save_expectation_suite(suite)
+
+    batch_kwargs = {
+        "path": os.path.join(context.root_directory, "../data/Titanic.csv"),
+        "datasource": "mydatasource",
+        "reader_method": "read_csv",
+    }
+    checkpoint = {
+        "validation_operator_name": "action_list_operator",
+        "batches": [
+            {
+                "batch_kwargs": batch_kwargs,
+                "expectation_suite_names": ["suite_one", "suite_two"],
+            },
+            {"batch_kwargs": batch_kwargs, "expectation_suite_names": ["suite_three"]},
+        ],
+    }
+    with open(
+        os.path.join(context.root_directory, context.CHECKPOINTS_DIR, "foo.yml"), "w"
+    ) as f:
+        yaml.dump(checkpoint, f)
+
+    datasource = context.get_datasource("mydatasource")
+    with mock.patch.object(
+        datasource, "get_batch", wraps=datasource.get_batch
+    ) as mock_get_batch:
+        results = context.run_checkpoint("foo")
+
+    assert mock_get_batch.call_count == 1
+    assert results.success
+    assert sorted(
+        validation_result_id.expectation_suite_identifier.expectation_suite_name
+        for validation_result_id in results.run_results
+    ) == ["suite_one", "suite_three", "suite_two"]
+
+
+def test_get_batches_for_expectation_suites_share_data_and_cached_getters(
+    titanic_data_context,
+):
+    context = titanic_data_context
+    for suite_name in ["suite_one", "suite_two"]:
+        context.create_expectation_suite(suite_name)
+    batch_kwargs = {
+        "path": os.path.join(context.root_directory, "../data/Titanic.csv"),
+        "datasource": "mydatasource",
+        "reader_method": "read_csv",
+    }
+
+    first, second = context._get_batches_for_expectation_suites(
+        batch_kwargs, ["suite_one", "suite_two"]
+    )
+    assert first.get_expectation_suite().expectation_suite_name == "suite_one"
+    assert second.get_expectation_suite().expectation_suite_name == "suite_two"
+    assert first.batch_id == second.batch_id
+    assert second.get_row_count is first.get_row_count
+
+
+def test_get_batches_for_expectation_suites_materializes_queries_once(
+    sa, empty_data_context, tmp_path
+):
+    context = empty_data_context
+    db_path = str(tmp_path / "test.db")
+    engine = sa.create_engine(f"sqlite:///{db_path}")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql("test", engine, index=False)
+    context.add_datasource(
+        "sqlite",
+        class_name="SqlAlchemyDatasource",
+        credentials={"url": f"sqlite:///{db_path}"},
+    )
+    for suite_name in ["suite_one", "suite_two"]:
+        context.create_expectation_suite(suite_name)
+
+    first, second = context._get_batches_for_expectation_suites(
+        {"query": "SELECT * FROM test WHERE a > 1", "datasource": "sqlite"},
+        ["suite_one", "suite_two"],
+    )
+    assert first.generated_table_name is not None
+    assert second.generated_table_name is None
+    assert second._table.name == first.generated_table_name
+    assert second.get_row_count() == 2
+    assert second.expect_column_values_to_be_between("a", 2, 3).success
+
+
 def test_get_validator_with_instantiated_expectation_suite(
     empty_data_context_v3, tmp_path_factory
 ):
@@ -5,7 +5,11 @@ import pytest
 from ruamel.yaml import YAML
 
 from great_expectations.core.batch import BatchRequest, BatchSpec
-from great_expectations.datasource.data_connector import ConfiguredAssetSqlDataConnector
+from great_expectations.datasource.data_connector import (
+    ConfiguredAssetSqlDataConnector,
+    InferredAssetSqlDataConnector,
+)
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 
 yaml = YAML()
 
@@ -775,3 +779,126 @@ def test_behavior_with_whole_table_splitter(
     )
     assert len(batch_definition_list) == 1
     assert batch_definition_list[0]["partition_definition"] == {}
+
+
+def test_inferred_asset_sql_data_connector_lists_partitions_lazily(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+):
+    my_data_connector = InferredAssetSqlDataConnector(
+        name="my_sql_data_connector",
+        datasource_name="FAKE_Datasource_NAME",
+        execution_engine=test_cases_for_sql_data_connector_sqlite_execution_engine,
+        splitter_method="_split_on_column_value",
+        splitter_kwargs={"column_name": "date"},
+    )
+
+    # Tables without a "date" column are skipped from their metadata alone, without listing any partitions
+    assert "table_partitioned_by_date_column__A" in (
+        my_data_connector.get_available_data_asset_names()
+    )
+    assert "table_partitioned_by_timestamp_column__B" not in (
+        my_data_connector.get_available_data_asset_names()
+    )
+    assert not my_data_connector._data_references_cache
+
+    batch_definition_list = my_data_connector.get_batch_definition_list_from_batch_request(
+        BatchRequest(
+            datasource_name="FAKE_Datasource_NAME",
+            data_connector_name="my_sql_data_connector",
+            data_asset_name="table_partitioned_by_date_column__A",
+        )
+    )
+    assert len(batch_definition_list) == 30
+    assert list(my_data_connector._data_references_cache.keys()) == [
+        "table_partitioned_by_date_column__A"
+    ]
+
+    with pytest.raises(KeyError):
+        my_data_connector.get_batch_definition_list_from_batch_request(
+            BatchRequest(
+                datasource_name="FAKE_Datasource_NAME",
+                data_connector_name="my_sql_data_connector",
+                data_asset_name="table_partitioned_by_timestamp_column__B",
+            )
+        )
+
+
+@pytest.fixture
+def sqlite_events_execution_engine(sa, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    engine.execute("CREATE TABLE events (id INTEGER, day INTEGER)")
+    engine.execute("INSERT INTO events VALUES (1, 1), (2, 1), (3, 2)")
+    return SqlAlchemyExecutionEngine(engine=engine)
+
+
+def _get_event_days(data_connector):
+    return [
+        batch_definition["partition_definition"]["day"]
+        for batch_definition in data_connector.get_batch_definition_list_from_batch_request(
+            BatchRequest(
+                datasource_name="FAKE_Datasource_NAME",
+                data_connector_name="my_sql_data_connector",
+                data_asset_name="events",
+            )
+        )
+    ]
+
+
+@pytest.mark.parametrize("incremental_partition_refresh", [False, True])
+def test_partition_cache_ttl(
+    sqlite_events_execution_engine, incremental_partition_refresh
+):
+    my_data_connector = ConfiguredAssetSqlDataConnector(
+        name="my_sql_data_connector",
+        datasource_name="FAKE_Datasource_NAME",
+        execution_engine=sqlite_events_execution_engine,
+        data_assets={
+            "events": {
+                "splitter_method": "_split_on_column_value",
+                "splitter_kwargs": {"column_name": "day"},
+            }
+        },
+        partition_cache_ttl_seconds=3600,
+        incremental_partition_refresh=incremental_partition_refresh,
+    )
+    assert sorted(_get_event_days(my_data_connector)) == [1, 2]
+
+    sqlite_events_execution_engine.engine.execute(
+        "INSERT INTO events VALUES (4, 2), (5, 3)"
+    )
+    # The cached partitions have not expired yet
+    assert sorted(_get_event_days(my_data_connector)) == [1, 2]
+
+    my_data_connector._partition_cache_timestamps["events"] -= 3601
+    assert sorted(_get_event_days(my_data_connector)) == [1, 2, 3]
+
+
+def test_incremental_partition_refresh_only_lists_partitions_past_the_watermark(
+    sqlite_events_execution_engine,
+):
+    my_data_connector = ConfiguredAssetSqlDataConnector(
+        name="my_sql_data_connector",
+        datasource_name="FAKE_Datasource_NAME",
+        execution_engine=sqlite_events_execution_engine,
+        data_assets={
+            "events": {
+                "splitter_method": "_split_on_column_value",
+                "splitter_kwargs": {"column_name": "day"},
+            }
+        },
+        partition_cache_ttl_seconds=0,
+        incremental_partition_refresh=True,
+    )
+    assert sorted(_get_event_days(my_data_connector)) == [1, 2]
+    assert my_data_connector._partition_watermarks["events"] == 2
+
+    # Rows below the watermark are assumed never to be added, so their partitions are not listed again
+    sqlite_events_execution_engine.engine.execute(
+        "INSERT INTO events VALUES (4, 0), (5, 3)"
+    )
+    my_data_connector._partition_cache_timestamps["events"] -= 1
+    assert sorted(_get_event_days(my_data_connector)) == [1, 2, 3]
+    assert my_data_connector._partition_watermarks["events"] == 3
+
+    my_data_connector._refresh_data_references_cache()
+    assert sorted(_get_event_days(my_data_connector)) == [0, 1, 2, 3]
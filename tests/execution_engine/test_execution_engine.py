@@ -1,8 +1,11 @@
 import pandas as pd
 import pytest
 
+from great_expectations.core.batch import BatchMarkers
 from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.exceptions.metric_exceptions import MetricResolutionError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import InMemoryMetricCache
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -161,3 +164,88 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_resolve_metrics_concurrently_matches_serial_resolution():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        for column in ["a", "b"]
+        for metric_name in ["column.mean", "column.max", "column.min"]
+    ]
+
+    serial_metrics = engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+    concurrent_metrics = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, max_workers=4
+    )
+
+    assert concurrent_metrics == serial_metrics
+    # Results are merged in the order the metrics were requested, regardless of thread scheduling
+    assert list(concurrent_metrics.keys()) == [metric.id for metric in desired_metrics]
+
+
+def test_resolve_metrics_concurrently_attributes_exceptions_to_metric():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    good_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    bad_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "not_a_column"},
+        metric_value_kwargs=dict(),
+    )
+
+    with pytest.raises(MetricResolutionError) as error:
+        engine.resolve_metrics(
+            metrics_to_resolve=(good_metric, bad_metric), max_workers=2
+        )
+
+    assert error.value.failed_metrics == [bad_metric.id]
+    assert isinstance(error.value.__cause__, KeyError)
+
+
+def test_resolve_metrics_reuses_cached_metrics_for_batches_with_same_fingerprint():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    metric_cache = InMemoryMetricCache()
+    batch_markers = BatchMarkers(
+        {
+            "ge_load_time": "20210101T000000.000000Z",
+            "pandas_data_fingerprint": "8c46fdaf0bd356fd58b7bcd9b2e6012d",
+        }
+    )
+    desired_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+
+    engine = PandasExecutionEngine(metric_cache=metric_cache)
+    engine.load_batch_data("first_id", df, batch_markers=batch_markers)
+    metrics = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert metrics[desired_metric.id] == 2
+    assert len(metric_cache) == 1
+
+    # A new engine loaded with a batch carrying the same fingerprint reads the metric from the cache
+    other_engine = PandasExecutionEngine(metric_cache=metric_cache)
+    other_engine.load_batch_data(
+        "second_id", pd.DataFrame({"a": [100]}), batch_markers=batch_markers
+    )
+    assert other_engine.get_cached_metrics([desired_metric]) == {desired_metric.id: 2}
+    assert other_engine.resolve_metrics(metrics_to_resolve=(desired_metric,)) == {
+        desired_metric.id: 2
+    }
+
+    # Batches loaded without a fingerprint are never served from the cache
+    uncached_engine = PandasExecutionEngine(metric_cache=metric_cache)
+    uncached_engine.load_batch_data("third_id", pd.DataFrame({"a": [100]}))
+    assert uncached_engine.resolve_metrics(metrics_to_resolve=(desired_metric,)) == {
+        desired_metric.id: 100
+    }
@@ -0,0 +1,65 @@
+import os
+
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    SqliteMetricCache,
+)
+
+FIRST_KEY = ("fingerprint", ("column.mean", "column=a", "()"))
+SECOND_KEY = ("fingerprint", ("column.max", "column=a", "()"))
+THIRD_KEY = ("other_fingerprint", ("column.mean", "column=a", "()"))
+
+
+def test_in_memory_metric_cache_evicts_least_recently_used():
+    cache = InMemoryMetricCache(max_entries=2)
+    cache.set_many({FIRST_KEY: 1, SECOND_KEY: 2})
+    # Reading the first key makes the second key the least recently used
+    assert cache.get_many([FIRST_KEY]) == {FIRST_KEY: 1}
+    cache.set_many({THIRD_KEY: 3})
+
+    assert len(cache) == 2
+    assert cache.get_many([FIRST_KEY, SECOND_KEY, THIRD_KEY]) == {
+        FIRST_KEY: 1,
+        THIRD_KEY: 3,
+    }
+
+
+def test_in_memory_metric_cache_expires_entries():
+    cache = InMemoryMetricCache(ttl_seconds=-1)
+    cache.set_many({FIRST_KEY: 1})
+
+    assert cache.get_many([FIRST_KEY]) == {}
+    assert len(cache) == 0
+
+
+def test_sqlite_metric_cache_persists_across_instances(tmp_path_factory):
+    path = os.path.join(
+        str(tmp_path_factory.mktemp("metric_cache")), "cache", "metrics.db"
+    )
+    SqliteMetricCache(path).set_many({FIRST_KEY: [1, 2, 3], SECOND_KEY: {"a": 1}})
+
+    cache = SqliteMetricCache(path)
+    assert len(cache) == 2
+    assert cache.get_many([FIRST_KEY, SECOND_KEY, THIRD_KEY]) == {
+        FIRST_KEY: [1, 2, 3],
+        SECOND_KEY: {"a": 1},
+    }
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_sqlite_metric_cache_evicts_and_expires_entries(tmp_path_factory):
+    path = os.path.join(str(tmp_path_factory.mktemp("metric_cache")), "metrics.db")
+    cache = SqliteMetricCache(path, max_entries=2)
+    cache.set_many({FIRST_KEY: 1})
+    cache.set_many({SECOND_KEY: 2})
+    cache.set_many({THIRD_KEY: 3})
+    assert cache.get_many([FIRST_KEY, SECOND_KEY, THIRD_KEY]) == {
+        SECOND_KEY: 2,
+        THIRD_KEY: 3,
+    }
+
+    expiring_cache = SqliteMetricCache(path, ttl_seconds=-1)
+    assert expiring_cache.get_many([SECOND_KEY, THIRD_KEY]) == {}
+    assert len(expiring_cache) == 0
@@ -1,6 +1,8 @@
 import datetime
+import gzip
 import os
 import random
+from io import BytesIO
 from typing import List
 
 import boto3
@@ -174,6 +176,58 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_compute_domain_reuses_row_condition_filtered_data():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+
+    table_data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type="table"
+    )
+    column_data, _, accessor_kwargs = engine.get_compute_domain(
+        domain_kwargs={**domain_kwargs, "column": "a"}, domain_type="column"
+    )
+    # Both domains share the row_condition, so the batch is only filtered once
+    assert column_data is table_data
+    assert accessor_kwargs == {"column": "a"}
+
+    # Reloading the batch invalidates data filtered from it
+    engine.load_batch_data(batch_data=df[df["a"] > 2], batch_id="1234")
+    reloaded_data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type="table"
+    )
+    assert reloaded_data is not table_data
+    assert reloaded_data["a"].tolist() == [3]
+
+
+def test_get_compute_domain_row_condition_cache_is_memory_bounded():
+    df = pd.DataFrame({"a": list(range(100))})
+    row_conditions = ["a > 10", "a > 20", "a > 30"]
+    # Large enough for a single filtered frame, but not for two
+    max_bytes = int(
+        df.query(row_conditions[0], parser="pandas")
+        .reset_index(drop=True)
+        .memory_usage(index=True, deep=False)
+        .sum()
+        * 1.5
+    )
+    engine = PandasExecutionEngine(row_condition_cache_max_bytes=max_bytes)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    for row_condition in row_conditions:
+        engine.get_compute_domain(
+            domain_kwargs={
+                "row_condition": row_condition,
+                "condition_parser": "pandas",
+            },
+            domain_type="table",
+        )
+
+    assert list(engine._row_condition_cache.keys()) == [("1234", "a > 30", "pandas")]
+    assert engine._row_condition_cache_bytes <= max_bytes
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition():
     engine = PandasExecutionEngine()
@@ -379,6 +433,120 @@ def test_get_batch_with_split_on_whole_table_s3():
         )
 
 
+class _RecordingS3Client:
+    def __init__(self, client):
+        self._client = client
+        self.get_object_calls = []
+
+    def head_object(self, **kwargs):
+        return self._client.head_object(**kwargs)
+
+    def get_object(self, **kwargs):
+        self.get_object_calls.append(kwargs)
+        return self._client.get_object(**kwargs)
+
+
+@mock_s3
+def test_get_batch_data_from_s3_parquet_reads_only_needed_byte_ranges():
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(
+        data={
+            "col1": list(range(20000)),
+            "col2": [str(i) * 20 for i in range(20000)],
+            "col3": [i / 2 for i in range(20000)],
+        }
+    )
+    buffer = BytesIO()
+    pq.write_table(
+        pa.Table.from_pandas(test_df, preserve_index=False), buffer, row_group_size=100,
+    )
+    client.put_object(Bucket=bucket, Body=buffer.getvalue(), Key="path/A.parquet")
+
+    engine = PandasExecutionEngine()
+    engine._s3 = _RecordingS3Client(client)
+    # The buffer is smaller than the object, so that only the ranges read are fetched
+    engine.s3_read_buffer_size = 1024
+    batch_data = engine.get_batch_data(
+        batch_spec=S3BatchSpec(
+            s3=f"s3a://{bucket}/path/A.parquet",
+            reader_options={"columns": ["col3"], "filters": [("col1", ">=", 19500)]},
+        )
+    )
+
+    expected_df = test_df[test_df["col1"] >= 19500][["col3"]].reset_index(drop=True)
+    assert batch_data.equals(expected_df)
+    assert all("Range" in call for call in engine._s3.get_object_calls)
+    fetched_bytes = sum(
+        int(end) - int(start) + 1
+        for start, end in (
+            call["Range"][len("bytes=") :].split("-")
+            for call in engine._s3.get_object_calls
+        )
+    )
+    assert fetched_bytes < len(buffer.getvalue()) / 4
+
+
+@mock_s3
+def test_get_batch_data_from_s3_gzipped_csv():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+    client.put_object(
+        Bucket=bucket,
+        Body=gzip.compress(test_df.to_csv(index=False).encode("utf-8")),
+        Key="path/A.csv.gz",
+    )
+
+    batch_data = PandasExecutionEngine().get_batch_data(
+        batch_spec=S3BatchSpec(s3=f"s3a://{bucket}/path/A.csv.gz")
+    )
+    assert batch_data.equals(test_df)
+
+
+@mock_s3
+def test_get_batch_data_from_s3_ignores_non_gzip_content_encodings():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+    for key, body, content_encoding in [
+        ("path/A.csv", test_df.to_csv(index=False).encode("utf-8"), "identity"),
+        ("path/B.csv", test_df.to_csv(index=False).encode("utf-8"), "aws-chunked"),
+        (
+            "path/C.csv",
+            gzip.compress(test_df.to_csv(index=False).encode("utf-8")),
+            "gzip",
+        ),
+        (
+            "path/D.csv",
+            gzip.compress(test_df.to_csv(index=False).encode("utf-8")),
+            "gzip,aws-chunked",
+        ),
+    ]:
+        client.put_object(
+            Bucket=bucket, Body=body, Key=key, ContentEncoding=content_encoding
+        )
+        batch_data = PandasExecutionEngine().get_batch_data(
+            batch_spec=S3BatchSpec(s3=f"s3a://{bucket}/{key}")
+        )
+        assert batch_data.equals(test_df)
+
+
 def test_get_batch_with_split_on_column_value(test_df):
     split_df = PandasExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -588,3 +756,167 @@ def test_get_batch_with_split_on_divided_integer_and_sample_on_list(test_df):
     assert split_df.shape == (2, 10)
     assert split_df.id.min() == 54
     assert split_df.id.max() == 59
+
+
+@pytest.fixture
+def chunked_csv_path(tmp_path):
+    df = pd.DataFrame(
+        {
+            "a": [1, 5, 22, 3, 5, 10, None, 7, 2, 8, 4],
+            "b": ["x", "y", "x", "z", "x", "y", "y", None, "x", "z", "q"],
+        }
+    )
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _validate_expectations(engine, batch_spec, configurations):
+    from great_expectations.core.util import convert_to_json_serializable
+    from great_expectations.validator.validator import Validator
+
+    batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+    engine.load_batch_data("batch", batch_data)
+    results = Validator(execution_engine=engine).graph_validate(
+        configurations=configurations
+    )
+    return [
+        (result.success, convert_to_json_serializable(result.result))
+        for result in results
+    ]
+
+
+def test_chunked_batch_data_matches_in_memory_batch_data(chunked_csv_path):
+    from great_expectations.core.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+    from great_expectations.execution_engine.pandas_chunked_batch_data import (
+        PandasChunkedBatchData,
+    )
+
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal", kwargs={"value": 11}
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_stdev_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_distinct_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x", "y", "z"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x", "y"], "mostly": 0.5},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "a", "min_value": 2, "max_value": 9},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_quantile_values_to_be_between",
+            kwargs={
+                "column": "a",
+                "quantile_ranges": {
+                    "quantiles": [0.0, 0.5, 1.0],
+                    "value_ranges": [[0, 2], [4, 6], [20, 25]],
+                },
+                "allow_relative_error": True,
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_unique_value_count_to_be_between",
+            kwargs={"column": "b", "min_value": 3, "approximate": True},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_proportion_of_unique_values_to_be_between",
+            kwargs={"column": "a", "min_value": 0.5, "approximate": True},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_most_common_value_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x"], "approximate": True},
+        ),
+    ]
+
+    expected = _validate_expectations(
+        PandasExecutionEngine(), PathBatchSpec(path=chunked_csv_path), configurations
+    )
+
+    engine = PandasExecutionEngine()
+    chunked = _validate_expectations(
+        engine, PathBatchSpec(path=chunked_csv_path, chunk_size=3), configurations,
+    )
+    assert isinstance(engine.loaded_batch_data_dict["batch"], PandasChunkedBatchData)
+    # The standard deviation is merged across chunks, so it may differ in the last digits
+    assert chunked[2][1]["observed_value"] == pytest.approx(
+        expected[2][1]["observed_value"]
+    )
+    chunked[2][1]["observed_value"] = expected[2][1]["observed_value"]
+    assert chunked == expected
+
+
+def test_value_counts_partial_state():
+    from great_expectations.execution_engine.pandas_chunked_batch_data import (
+        PandasChunkMetricEvaluator,
+        ValueCountsPartialState,
+    )
+
+    metric_configuration = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "value", "collate": None},
+    )
+
+    # Without any chunk (e.g. an empty file), there are no values to count
+    state = ValueCountsPartialState(metric_configuration)
+    counts = state.get_value()
+    assert len(counts) == 0
+    assert counts.name == "count"
+
+    # Values of different types are merged and returned without being cast
+    state = ValueCountsPartialState(metric_configuration)
+    for chunk in [pd.Series([1, "x", 1], dtype=object), pd.Series(["x", 2.5, "y"])]:
+        state.update(
+            PandasChunkMetricEvaluator(
+                evaluate_metric=None,
+                get_column_values=lambda metric_domain_kwargs, chunk=chunk: chunk,
+            )
+        )
+    counts = state.get_value()
+    assert counts.to_dict() == {1: 2, 2.5: 1, "x": 2, "y": 1}
+    assert list(counts.index) == [1, 2.5, "x", "y"]
+
+
+def test_chunked_batch_data_with_unsupported_metric(chunked_csv_path):
+    engine = PandasExecutionEngine()
+    batch_data, _ = engine.get_batch_data_and_markers(
+        PathBatchSpec(path=chunked_csv_path, chunk_size=3)
+    )
+    engine.load_batch_data("batch", batch_data)
+
+    with pytest.raises(ge_exceptions.GreatExpectationsError):
+        engine.resolve_metrics(
+            [
+                MetricConfiguration(
+                    metric_name="column.median",
+                    metric_domain_kwargs={"column": "a"},
+                    metric_value_kwargs=dict(),
+                )
+            ]
+        )
+
+
+def test_chunked_batch_data_with_unsupported_batch_spec(test_df):
+    with pytest.raises(ge_exceptions.BatchSpecError):
+        PandasExecutionEngine().get_batch_data_and_markers(
+            RuntimeDataBatchSpec(batch_data=test_df, chunk_size=3)
+        )
@@ -945,6 +945,36 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_compute_domain_persists_domains_shared_by_retained_metrics(spark_session,):
+    df = spark_session.createDataFrame(
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    )
+    engine = SparkDFExecutionEngine(batch_data_dict={"1234": df})
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "spark"}
+    metrics = [
+        MetricConfiguration("column.max", {**domain_kwargs, "column": column})
+        for column in ["a", "b"]
+    ]
+
+    engine.retain_metric_domains(metrics)
+    first_data, _, _ = engine.get_compute_domain(
+        domain_kwargs={**domain_kwargs, "column": "a"}, domain_type="column"
+    )
+    second_data, _, _ = engine.get_compute_domain(
+        domain_kwargs={**domain_kwargs, "column": "b"}, domain_type="column"
+    )
+    # Both metrics share the filtered domain, which is persisted until the last of them is released
+    assert second_data is first_data
+    assert first_data.is_cached
+    assert engine.dataframe.is_cached
+
+    engine.release_metric_domains(metrics[:1])
+    assert first_data.is_cached
+    engine.release_metric_domains(metrics[1:])
+    assert not first_data.is_cached
+    assert not engine.dataframe.is_cached
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition():
     engine = _build_spark_engine(
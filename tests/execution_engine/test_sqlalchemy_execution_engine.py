@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from great_expectations.core.batch import Batch, BatchSpec
+from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.exceptions import InvalidConfigError
@@ -12,6 +13,16 @@ from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
+    _get_tablesample_clause,
+    compile_window_functions,
+)
+from great_expectations.execution_engine.sqlalchemy_materialization_manager import (
+    MaterializationStrategy,
+)
+from great_expectations.execution_engine.sqlalchemy_query_observer import (
+    QueryReportObserver,
+    QuerySpanObserver,
+    opentelemetry_trace,
 )
 from great_expectations.expectations.metrics import (
     ColumnMean,
@@ -192,6 +203,467 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+def test_sa_batch_aggregate_metrics_share_scan_across_row_conditions(sa):
+    engine = _build_sa_engine(
+        pd.DataFrame(
+            {"a": [1, 2, 1, 2, 3, None], "b": [4, 5, 6, 7, 8, 9], "c": [1] * 6}
+        )
+    )
+    domains = [
+        {"column": "a"},
+        {
+            "column": "a",
+            "row_condition": 'col("b")>5',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {
+            "column": "b",
+            "row_condition": 'col("a").notnull()',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {
+            "column": "c",
+            "row_condition": 'col("b")>100',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ]
+    partial_metrics = [
+        MetricConfiguration(
+            metric_name=f"{metric_name}.aggregate_fn",
+            metric_domain_kwargs=domain,
+            metric_value_kwargs=dict(),
+        )
+        for domain in domains
+        for metric_name in ["column.max", "column.sum"]
+    ]
+    partial_metrics.append(
+        MetricConfiguration(
+            metric_name="table.row_count.aggregate_fn",
+            metric_domain_kwargs={
+                "row_condition": 'col("b")>5',
+                "condition_parser": "great_expectations__experimental__",
+            },
+            metric_value_kwargs=dict(),
+        )
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=partial_metrics)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=partial_metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        for partial_metric in partial_metrics
+    ]
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine.engine, "before_cursor_execute", record_statement)
+    try:
+        res = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+    finally:
+        sa.event.remove(engine.engine, "before_cursor_execute", record_statement)
+
+    # Five distinct compute domains are computed in a single scan of the table
+    assert len(statements) == 1
+    assert [res[metric.id] for metric in desired_metrics] == [
+        3,
+        9,
+        3,
+        6,
+        8,
+        30,
+        None,
+        None,
+        4,
+    ]
+
+
+def test_compile_window_functions(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [3, 1, 3, None, 2, 4]}))
+    column = sa.column("a")
+    previous = sa.func.lag(column).over(
+        partition_by=sa.case([(column.is_(None), 1)], else_=0),
+        order_by=sa.func.row_number().over(),
+    )
+    expressions = [
+        sa.func.count().over(partition_by=column).label("count_a"),
+        (sa.func.count().over(partition_by=column) + 1).label("count_a_plus_one"),
+        previous.label("previous_a"),
+    ]
+    selectable = sa.table("test")
+    rewritten, windowed, window_column_count = compile_window_functions(
+        expressions, selectable
+    )
+    # the two identical window functions are computed once, after the row number the lag is ordered by
+    assert window_column_count == 3
+    sql = str(sa.select(rewritten).select_from(windowed))
+    assert sql.count(" OVER ") == 3
+    assert sql.index("ge_windowed_0 AS") < sql.index("ge_windowed_1 AS")
+
+    rows = engine.engine.execute(
+        sa.select(rewritten + [sa.column("a")]).select_from(windowed)
+    ).fetchall()
+    assert sorted(rows, key=lambda row: (row.a is None, row.a)) == [
+        (1, 2, 3, 1),
+        (1, 2, 3, 2),
+        (2, 3, None, 3),
+        (2, 3, 1, 3),
+        (1, 2, 2, 4),
+        (1, 2, None, None),
+    ]
+
+    # without window functions, the expressions and selectable are used as they are
+    expressions = [sa.func.max(column)]
+    assert compile_window_functions(expressions, selectable) == (
+        expressions,
+        selectable,
+        0,
+    )
+
+
+def test_sa_window_conditions_share_one_query(sa):
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 2, None, 3, 1], "b": [6, 5, 5, 4, None, 4]})
+    )
+    checks = [
+        ("column_values.unique", {"column": "a"}, dict()),
+        ("column_values.unique", {"column": "b"}, dict()),
+    ]
+    conditions = [
+        MetricConfiguration(
+            metric_name=f"{metric_name}.condition",
+            metric_domain_kwargs=domain,
+            metric_value_kwargs=value_kwargs,
+        )
+        for metric_name, domain, value_kwargs in checks
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=conditions)
+    partial_metrics = [
+        MetricConfiguration(
+            metric_name=f"{metric_name}.unexpected_count.aggregate_fn",
+            metric_domain_kwargs=domain,
+            metric_value_kwargs=value_kwargs,
+            metric_dependencies={"unexpected_condition": condition},
+        )
+        for (metric_name, domain, value_kwargs), condition in zip(checks, conditions)
+    ]
+    metrics = engine.resolve_metrics(
+        metrics_to_resolve=partial_metrics, metrics=metrics
+    )
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=f"{metric_name}.unexpected_count",
+            metric_domain_kwargs=domain,
+            metric_value_kwargs=value_kwargs,
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        for (metric_name, domain, value_kwargs), partial_metric in zip(
+            checks, partial_metrics
+        )
+    ]
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine.engine, "before_cursor_execute", record_statement)
+    try:
+        res = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+    finally:
+        sa.event.remove(engine.engine, "before_cursor_execute", record_statement)
+
+    # The window functions of both conditions are computed in a single query
+    assert len(statements) == 1
+    assert [res[metric.id] for metric in desired_metrics] == [4, 4]
+
+
+def test_sa_concurrent_metric_resolution_requires_connection_pool(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}))
+    # in-memory sqlite databases are private to their connection, so every thread would see a different database
+    assert not engine.supports_concurrent_metric_resolution
+
+    partial_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(partial_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"metric_partial_fn": partial_metric},
+    )
+    res = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics, max_workers=4
+    )
+    assert res[desired_metric.id] == 3
+
+
+def _build_sa_file_engine(tmp_path, **kwargs):
+    import sqlalchemy as sa
+
+    eng = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}).to_sql("test", eng, index=False)
+    return SqlAlchemyExecutionEngine(engine=eng, **kwargs)
+
+
+def test_sa_temp_table_batches_are_pinned_to_sessions(sa, tmp_path):
+    engine = _build_sa_file_engine(tmp_path, max_batch_sessions=2)
+    # sqlite connections may only be used on the thread that opened them
+    assert not engine.supports_concurrent_metric_resolution
+
+    batch_ids = []
+    for i in range(3):
+        batch_data, _ = engine.get_batch_data_and_markers(
+            BatchSpec(table_name="test", reuse_materialization=False)
+        )
+        engine.load_batch_data(f"batch_{i}", batch_data)
+        batch_ids.append(f"batch_{i}")
+
+    sessions = [
+        engine.loaded_batch_data_dict[batch_id].session for batch_id in batch_ids
+    ]
+    # the third batch shares a session with one of the first two
+    assert sessions[0] is not sessions[1]
+    assert sessions[2] in sessions[:2]
+    assert engine.connection_manager.engine is engine.engine
+
+    # each temporary table is only visible on the session of its batch, through which its metrics are resolved
+    for batch_id in batch_ids:
+        partial_metric = MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+            metric_value_kwargs=dict(),
+        )
+        metrics = engine.resolve_metrics(metrics_to_resolve=(partial_metric,))
+        desired_metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        res = engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric,), metrics=metrics, max_workers=4
+        )
+        assert res[desired_metric.id] == 3
+    engine.close()
+
+
+def test_sa_temp_tables_are_reused_and_dropped(sa, tmp_path):
+    engine = _build_sa_file_engine(tmp_path)
+    with engine:
+        batch_spec = BatchSpec(
+            table_name="test",
+            sampling_method="_sample_using_limit",
+            sampling_kwargs={"n": 4},
+        )
+        batch_data, _ = engine.get_batch_data_and_markers(batch_spec)
+        same_batch_data, _ = engine.get_batch_data_and_markers(BatchSpec(batch_spec))
+        other_batch_data, _ = engine.get_batch_data_and_markers(
+            BatchSpec(table_name="test")
+        )
+
+        materialization = batch_data.materialization
+        assert materialization.strategy == MaterializationStrategy.TEMP_TABLE
+        assert same_batch_data.materialization is materialization
+        assert same_batch_data.selectable.name == batch_data.selectable.name
+        assert materialization.reuse_count == 1
+        assert other_batch_data.materialization is not materialization
+        assert materialization.materialization_seconds > 0
+        assert engine.materialization_manager.materializations == [
+            materialization,
+            other_batch_data.materialization,
+        ]
+        assert batch_data.row_count() == 4
+        assert other_batch_data.row_count() == 6
+
+        session = materialization.session
+        temp_table_names = {
+            row[0]
+            for row in session.connection.execute(
+                "SELECT name FROM sqlite_temp_master WHERE type = 'table'"
+            ).fetchall()
+        }
+        assert temp_table_names == {
+            batch_data.selectable.name,
+            other_batch_data.selectable.name,
+        }
+
+    # the temporary tables are dropped when the engine is closed
+    assert materialization.dropped
+    assert other_batch_data.materialization.dropped
+
+
+@pytest.mark.parametrize(
+    "materialization_strategy,expected_strategy",
+    [
+        ("cte", MaterializationStrategy.CTE),
+        ("subselect", MaterializationStrategy.SUBSELECT),
+        # sqlite offers no estimate of the number of rows of a query
+        ("auto", MaterializationStrategy.TEMP_TABLE),
+    ],
+)
+def test_sa_materialization_strategies(
+    sa, tmp_path, materialization_strategy, expected_strategy
+):
+    engine = _build_sa_file_engine(
+        tmp_path, materialization_strategy=materialization_strategy
+    )
+    batch_data, _ = engine.get_batch_data_and_markers(BatchSpec(table_name="test"))
+    engine.load_batch_data("batch", batch_data)
+    assert batch_data.materialization.strategy == expected_strategy
+    assert (batch_data.session is None) == (
+        expected_strategy != MaterializationStrategy.TEMP_TABLE
+    )
+
+    partial_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={
+            "column": "a",
+            "row_condition": 'col("a")<3',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(partial_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={
+            "column": "a",
+            "row_condition": 'col("a")<3',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        metric_value_kwargs=dict(),
+        metric_dependencies={"metric_partial_fn": partial_metric},
+    )
+    res = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    assert res[desired_metric.id] == 2
+    engine.close()
+
+
+def test_sa_batch_without_temp_table_uses_connection_pool(sa, tmp_path):
+    engine = _build_sa_file_engine(tmp_path)
+    batch_data, _ = engine.get_batch_data_and_markers(
+        BatchSpec(table_name="test", create_temp_table=False)
+    )
+    assert batch_data.session is None
+    assert batch_data.row_count() == 6
+
+
+def test_sa_max_concurrent_queries(sa, tmp_path):
+    import threading
+
+    engine = _build_sa_file_engine(tmp_path, max_concurrent_queries=2)
+    connectable = engine.get_connectable()
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def query():
+        with connectable.connect() as connection:
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+            connection.execute("SELECT COUNT(*) FROM test").fetchall()
+            threading.Event().wait(0.05)
+            with lock:
+                in_flight.pop()
+
+    threads = [threading.Thread(target=query) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(max_in_flight) == 2
+
+
+def test_sa_query_timeout(sa, tmp_path):
+    from great_expectations.exceptions import QueryTimeoutError
+
+    engine = _build_sa_file_engine(tmp_path, query_timeout=0.1)
+    slow_query = (
+        "WITH RECURSIVE r(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM r WHERE n < 100000000) "
+        "SELECT COUNT(*) FROM r"
+    )
+    with pytest.raises(QueryTimeoutError):
+        engine.get_connectable().execute(slow_query)
+    # the engine remains usable after a timeout
+    assert engine.get_connectable().execute("SELECT COUNT(*) FROM test").scalar() == 6
+
+
+def test_sa_connection_manager_rejects_invalid_limits(sa, tmp_path):
+    with pytest.raises(ValueError):
+        _build_sa_file_engine(tmp_path, max_concurrent_queries=0)
+
+
+def test_sa_query_observers(sa, tmp_path):
+    engine = _build_sa_file_engine(tmp_path)
+    report_observer = QueryReportObserver()
+    span_observer = QuerySpanObserver()
+    engine.add_query_observer(report_observer)
+    engine.add_query_observer(span_observer)
+
+    batch_data, _ = engine.get_batch_data_and_markers(BatchSpec(table_name="test"))
+    engine.load_batch_data("batch", batch_data)
+    partial_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(partial_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"metric_partial_fn": partial_metric},
+    )
+    engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+
+    create_record, max_record = report_observer.records
+    # the temporary table is created on a connection handed out by the connection manager
+    assert create_record.sql.startswith("CREATE TEMPORARY TABLE")
+    assert create_record.metric_ids == tuple()
+    assert max_record.sql.startswith("SELECT max(a)")
+    assert max_record.metric_ids == (desired_metric.id,)
+    assert max_record.rows == 1
+    assert max_record.explain is None
+
+    report = report_observer.get_report()
+    assert report["query_count"] == 2
+    assert report["metrics"] == [
+        {
+            "metric_id": convert_to_json_serializable(desired_metric.id),
+            "query_count": 1,
+            "seconds": max_record.seconds,
+        }
+    ]
+
+    if opentelemetry_trace is None:
+        spans = span_observer.spans
+        assert [span["attributes"]["db.statement"] for span in spans] == [
+            create_record.sql,
+            max_record.sql,
+        ]
+        assert spans[1]["attributes"]["db.rows"] == 1
+        assert spans[1]["end_time"] >= spans[1]["start_time"]
+
+    engine.remove_query_observer(report_observer)
+    engine.get_connectable().execute("SELECT 1").fetchall()
+    assert len(report_observer.records) == 2
+    engine.close()
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs(sa):
     engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]}))
@@ -485,3 +957,65 @@ def test_resolve_metric_bundle_with_nonexistent_metric(sa):
             )
         )
         print(e)
+
+
+@pytest.mark.parametrize(
+    "dialect_name,method,seed,expected_clause",
+    [
+        ("postgresql", "system", None, "TABLESAMPLE SYSTEM (10.0)"),
+        ("postgresql", "bernoulli", 42, "TABLESAMPLE BERNOULLI (10.0) REPEATABLE (42)"),
+        ("mssql", "system", 42, "TABLESAMPLE SYSTEM (10.0 PERCENT) REPEATABLE (42)"),
+        ("mssql", "bernoulli", None, None),
+        ("bigquery", "system", 42, "TABLESAMPLE SYSTEM (10.0 PERCENT)"),
+        ("snowflake", "bernoulli", 42, "SAMPLE BERNOULLI (10.0) SEED (42)"),
+        ("oracle", "system", None, "SAMPLE BLOCK (10.0)"),
+        ("sqlite", "system", None, None),
+    ],
+)
+def test_get_tablesample_clause(dialect_name, method, seed, expected_clause):
+    assert (
+        _get_tablesample_clause(dialect_name, p=0.1, method=method, seed=seed)
+        == expected_clause
+    )
+
+
+def test_get_tablesample_clause_invalid_arguments():
+    with pytest.raises(ValueError):
+        _get_tablesample_clause("postgresql", p=0)
+    with pytest.raises(ValueError):
+        _get_tablesample_clause("postgresql", p=0.1, method="block")
+
+
+def test_sample_using_tablesample_falls_back_to_random_rows(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": range(10000)}))
+    batch_data, _ = engine.get_batch_data_and_markers(
+        BatchSpec(
+            table_name="test",
+            sampling_method="_sample_using_tablesample",
+            sampling_kwargs={"p": 0.1},
+        )
+    )
+    # sqlite has no TABLESAMPLE clause, so each row is kept with probability p
+    assert 700 < batch_data.row_count() < 1300
+
+
+def test_get_sample_batch_data(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": range(10000)}))
+    sample_batch_data = engine.get_sample_batch_data(
+        None, BatchSpec(table_name="test"), p=0.5
+    )
+    assert sample_batch_data.materialization.strategy == (
+        MaterializationStrategy.TEMP_TABLE
+    )
+    assert 4500 < sample_batch_data.row_count() < 5500
+
+    with pytest.raises(NotImplementedError):
+        engine.get_sample_batch_data(
+            None,
+            BatchSpec(
+                table_name="test",
+                sampling_method="_sample_using_limit",
+                sampling_kwargs={"n": 10},
+            ),
+            p=0.5,
+        )
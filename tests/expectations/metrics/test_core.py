@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from great_expectations.core.batch import Batch
 from great_expectations.execution_engine import (
@@ -264,6 +265,79 @@ def test_map_value_set_spark(spark_session):
     assert results == {desired_metric.id: 1}
 
 
+def test_map_value_set_pd_unexpected_values_and_index_are_truncated():
+    engine = _build_pandas_engine(
+        pd.DataFrame({"a": [1, None, 4, 2, 5, 6, 3, 7]}, index=list("abcdefgh"))
+    )
+    value_kwargs = {"value_set": [1, 2, 3]}
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.in_set.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=value_kwargs,
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+
+    metrics_to_resolve = {
+        (metric_name, result_format): MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                **value_kwargs,
+                "result_format": {
+                    "result_format": result_format,
+                    "partial_unexpected_count": 2,
+                },
+            },
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        for metric_name in [
+            "column_values.in_set.unexpected_values",
+            "column_values.in_set.unexpected_index_list",
+        ]
+        for result_format in ["SUMMARY", "COMPLETE"]
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve.values(), metrics=metrics
+    )
+    results = {key: results[metric.id] for key, metric in metrics_to_resolve.items()}
+
+    assert results == {
+        ("column_values.in_set.unexpected_values", "SUMMARY"): [4, 5],
+        ("column_values.in_set.unexpected_values", "COMPLETE"): [4, 5, 6, 7],
+        ("column_values.in_set.unexpected_index_list", "SUMMARY"): ["c", "e"],
+        ("column_values.in_set.unexpected_index_list", "COMPLETE"): [
+            "c",
+            "e",
+            "f",
+            "h",
+        ],
+    }
+
+
+def test_pandas_unexpected_positions_stop_at_limit(monkeypatch):
+    from great_expectations.expectations.metrics import map_metric
+
+    monkeypatch.setattr(map_metric, "UNEXPECTED_POSITIONS_CHUNK_SIZE", 3)
+    mask = pd.Series([False, True, False, True, True, None, True, False, True])
+
+    assert map_metric._pandas_unexpected_positions(
+        mask, mask.index, limit=3
+    ).tolist() == [1, 3, 4]
+    assert map_metric._pandas_unexpected_positions(mask, mask.index).tolist() == [
+        1,
+        3,
+        4,
+        6,
+        8,
+    ]
+    assert (
+        map_metric._pandas_unexpected_positions(
+            mask.to_numpy(), mask.index, limit=0
+        ).tolist()
+        == []
+    )
+
+
 def test_map_column_value_lengths_between_pd():
     engine = _build_pandas_engine(
         pd.DataFrame({"a": ["a", "aaa", "bcbc", "defgh", None]})
@@ -375,28 +449,25 @@ def test_map_unique_sa(sa):
     )
     metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
 
-    # This is no longer a MAP_CONDITION because mssql does not support it. Instead, it is a WINDOW_CONDITION
-    #
-    # aggregate_fn = MetricConfiguration(
-    #     metric_name="column_values.unique.unexpected_count.aggregate_fn",
-    #     metric_domain_kwargs={"column": "a"},
-    #     metric_value_kwargs=dict(),
-    #     metric_dependencies={"unexpected_condition": condition_metric},
-    # )
-    # aggregate_fn_metrics = engine.resolve_metrics(
-    #     metrics_to_resolve=(aggregate_fn,), metrics=metrics
-    # )
+    # The window function of the condition is computed in a CTE, from which the unexpected count is aggregated
+    aggregate_fn = MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"unexpected_condition": condition_metric},
+    )
+    aggregate_fn_metrics = engine.resolve_metrics(
+        metrics_to_resolve=(aggregate_fn,), metrics=metrics
+    )
 
     desired_metric = MetricConfiguration(
         metric_name="column_values.unique.unexpected_count",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=dict(),
-        # metric_dependencies={"metric_partial_fn": aggregate_fn},
-        metric_dependencies={"unexpected_condition": condition_metric},
+        metric_dependencies={"metric_partial_fn": aggregate_fn},
     )
     results = engine.resolve_metrics(
-        metrics_to_resolve=(desired_metric,),
-        metrics=metrics,  # metrics=aggregate_fn_metrics
+        metrics_to_resolve=(desired_metric,), metrics=aggregate_fn_metrics
     )
     assert results[desired_metric.id] == 2
 
@@ -681,6 +752,273 @@ def test_median_metric_spark(spark_session):
     assert results == {desired_metric.id: 2}
 
 
+def test_quantile_values_metric_pd_with_relative_error():
+    values = np.random.default_rng(0).uniform(size=50000)
+    engine = _build_pandas_engine(pd.DataFrame({"a": values}))
+
+    quantiles = [0.1, 0.5, 0.9]
+    exact = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": quantiles, "allow_relative_error": False},
+    )
+    approximate = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": quantiles, "allow_relative_error": 0.01},
+    )
+    median = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(exact, approximate, median))
+
+    assert (
+        results[exact.id]
+        == pd.Series(values).quantile(quantiles, interpolation="nearest").tolist()
+    )
+    # Uniform values: the rank error of the sketch bounds the error of the value
+    assert np.allclose(results[approximate.id], quantiles, atol=0.02)
+    assert abs(results[median.id] - 0.5) < 0.02
+
+
+def test_quantile_values_metric_sa_streams_sqlite_column(sa):
+    df = pd.DataFrame({"a": [5, 1, 3, None, 2, 8, 9, 4]})
+    engine = _build_sa_engine(df, sa)
+
+    quantiles = [0.0, 0.25, 0.5, 0.75, 1.0]
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": quantiles, "allow_relative_error": False},
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+
+    assert (
+        results[desired_metric.id]
+        == df["a"].quantile(quantiles, interpolation="nearest").tolist()
+    )
+
+
+def _resolve_metric_sa(engine, metric_configuration):
+    from great_expectations.validator.validation_graph import ValidationGraph
+    from great_expectations.validator.validator import Validator
+
+    validator = Validator(execution_engine=engine)
+    graph = ValidationGraph()
+    validator.build_metric_dependency_graph(
+        graph, metric_configuration, configuration=None, execution_engine=engine
+    )
+    metrics = dict()
+    validator.resolve_validation_graph(graph, metrics)
+    return metrics[metric_configuration.id]
+
+
+def test_median_metric_sa(sa):
+    for values, expected in [
+        ([1, 3, 2, None, 10], 2.5),
+        ([1, 3, 2, None, 10, 4], 3),
+        ([None, 7], 7),
+        ([None, None], None),
+    ]:
+        engine = _build_sa_engine(pd.DataFrame({"a": values}), sa)
+        median = MetricConfiguration(
+            metric_name="column.median",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=dict(),
+        )
+        assert _resolve_metric_sa(engine, median) == expected
+
+    # With allow_relative_error, SQLite streams the column into a quantile sketch
+    engine = _build_sa_engine(pd.DataFrame({"a": list(range(1001))}), sa)
+    median = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": True},
+    )
+    assert abs(_resolve_metric_sa(engine, median) - 500) <= 10
+
+
+def test_median_metric_sa_dialect_strategies(sa):
+    from sqlalchemy.dialects import postgresql
+
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_median import (
+        _MEDIAN_AGGREGATES_BY_DIALECT,
+        ColumnMedian,
+        _get_sqlalchemy_median_strategy,
+    )
+
+    class _Dialect:
+        def __init__(self, name):
+            self.name = name
+
+    assert _get_sqlalchemy_median_strategy(_Dialect("postgresql"), False) == "native"
+    assert _get_sqlalchemy_median_strategy(_Dialect("snowflake"), True) == "native"
+    # MEDIAN(a), MEDIAN(b) fails on Redshift, which requires all the sorted aggregates of a query to share an ordering
+    assert _get_sqlalchemy_median_strategy(_Dialect("redshift"), False) == "unbundled"
+    assert _get_sqlalchemy_median_strategy(_Dialect("redshift"), True) == "unbundled"
+    assert (
+        _get_sqlalchemy_median_strategy(_Dialect("awsathena"), False) == "approximate"
+    )
+    assert _get_sqlalchemy_median_strategy(_Dialect("bigquery"), False) == "ordered"
+    assert _get_sqlalchemy_median_strategy(_Dialect("bigquery"), 0.01) == "approximate"
+    assert _get_sqlalchemy_median_strategy(_Dialect("mysql"), True) == "quantile"
+    assert _get_sqlalchemy_median_strategy(_Dialect("sqlite"), False) == "ordered"
+
+    # The median aggregate of the dialects that have one is bundled with the other aggregates of its domain
+    assert get_metric_provider(
+        "column.median_aggregate.aggregate_fn",
+        SqlAlchemyExecutionEngine(engine=sa.create_engine("sqlite://")),
+    )
+    # SQLite has no median aggregate, so its median is looked up from the sorted column instead
+    dependencies = ColumnMedian.get_evaluation_dependencies(
+        MetricConfiguration("column.median", {"column": "a"}, dict()),
+        execution_engine=SqlAlchemyExecutionEngine(
+            engine=sa.create_engine("sqlite://")
+        ),
+    )
+    assert "column.median_aggregate" not in dependencies
+    assert "column_values.nonnull.count" in dependencies
+
+    aggregate = _MEDIAN_AGGREGATES_BY_DIALECT["postgresql"][0](
+        sa.column("a"), postgresql.dialect(), "a"
+    )
+    assert (
+        str(aggregate.compile(dialect=postgresql.dialect()))
+        == "percentile_cont(%(percentile_cont_1)s) WITHIN GROUP (ORDER BY a ASC)"
+    )
+
+
+def test_histogram_metric_pd_and_sa_match_numpy(sa):
+    values = [0, 0.1, 0.2, 0.25, 0.5, 0.99, 1, 1, 3, -2, None, 7.5, 10]
+    df = pd.DataFrame({"a": values})
+    nonnull_values = [value for value in values if value is not None]
+    pandas_engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    sa_engine = _build_sa_engine(df, sa)
+
+    for bins in [
+        tuple(np.linspace(0, 10, 11)),
+        (-2, 0, 2, 4),
+        (0, 0.2, 0.5, 1, 7.5, 8),
+        (0.5, 1),
+    ]:
+        expected = np.histogram(nonnull_values, bins)[0].tolist()
+        histogram = MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"bins": bins},
+        )
+        results = pandas_engine.resolve_metrics(metrics_to_resolve=(histogram,))
+        assert results[histogram.id] == expected
+        assert _resolve_metric_sa(sa_engine, histogram) == expected
+
+    # Infinite outer edges make the outer bins open-ended
+    for bins, expected in [
+        ((-np.inf, 0, 1, 2, np.inf), [1, 6, 2, 3]),
+        ((-np.inf, 0.2, 1, np.inf), [3, 4, 5]),
+        ((-np.inf, np.inf), [12]),
+    ]:
+        histogram = MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"bins": bins},
+        )
+        results = pandas_engine.resolve_metrics(metrics_to_resolve=(histogram,))
+        assert results[histogram.id] == expected
+        assert _resolve_metric_sa(sa_engine, histogram) == expected
+
+
+def test_histogram_metric_sa_groups_by_bucket(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": list(range(1000))}), sa)
+    statements = []
+
+    @sa.event.listens_for(engine.engine, "before_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    histogram = MetricConfiguration(
+        metric_name="column.histogram",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"bins": tuple(np.linspace(0, 999, 101))},
+    )
+    assert (
+        _resolve_metric_sa(engine, histogram)
+        == np.histogram(range(1000), np.linspace(0, 999, 101))[0].tolist()
+    )
+    histogram_statements = [
+        statement for statement in statements if "GROUP BY" in statement
+    ]
+    assert len(histogram_statements) == 1
+    # A single bucket expression, rather than an aggregate per bin
+    assert "sum(" not in histogram_statements[0].lower()
+
+
+def test_histogram_metric_sa_values_on_inner_edges(sa):
+    # Values on the inner edges of uniform bins belong to the bin they start, whatever the rounding of the bin width
+    for values, bins in [
+        ([9, 9, 3], tuple(np.linspace(0, 18, 15))),
+        ([0.3, 0.6, 0.7, 0.9], tuple(np.linspace(0, 1, 11))),
+        (list(np.linspace(-1, 2, 31)), tuple(np.linspace(-1, 2, 31))),
+    ]:
+        engine = _build_sa_engine(pd.DataFrame({"a": values}), sa)
+        histogram = MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"bins": bins},
+        )
+        assert (
+            _resolve_metric_sa(engine, histogram)
+            == np.histogram(values, bins)[0].tolist()
+        )
+
+
+def test_approx_distinct_values_count_metric_pd_and_sa(sa):
+    df = pd.DataFrame({"a": [1, 2, 2, None, 3, 3, 3], "b": list("xyzxyzw")})
+    pandas_engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    sa_engine = _build_sa_engine(df, sa)
+
+    for column, expected in [("a", 3), ("b", 4)]:
+        approx_count = MetricConfiguration(
+            metric_name="column.distinct_values.count.approx",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        results = pandas_engine.resolve_metrics(metrics_to_resolve=(approx_count,))
+        assert results[approx_count.id] == expected
+        # SQLite has no approximate distinct count, so the exact count is computed in the database
+        assert _resolve_metric_sa(sa_engine, approx_count) == expected
+
+
+def test_value_counts_top_k_metric_pd_and_sa(sa):
+    df = pd.DataFrame({"a": ["x", "y", "y", None, "z", "z", "w", "z"]})
+    pandas_engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    sa_engine = _build_sa_engine(df, sa)
+
+    top_k = MetricConfiguration(
+        metric_name="column.value_counts.top_k",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"k": 3},
+    )
+    expected = pd.Series(
+        [3, 2, 1], index=pd.Index(["z", "y", "w"], name="value"), name="count"
+    )
+    results = pandas_engine.resolve_metrics(metrics_to_resolve=(top_k,))
+    assert results[top_k.id].equals(expected)
+    assert _resolve_metric_sa(sa_engine, top_k).equals(expected)
+
+    with pytest.raises(ValueError):
+        pandas_engine.resolve_metrics(
+            metrics_to_resolve=(
+                MetricConfiguration(
+                    metric_name="column.value_counts.top_k",
+                    metric_domain_kwargs={"column": "a"},
+                    metric_value_kwargs={"k": 0},
+                ),
+            )
+        )
+
+
 def test_distinct_metric_spark(spark_session):
     engine = _build_spark_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}), spark_session)
 
@@ -0,0 +1,106 @@
+import pytest
+
+from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.validator.validation_graph import (
+    MetricConfiguration,
+    MetricEdge,
+    ValidationGraph,
+    ValidationGraphScheduler,
+)
+
+
+@pytest.fixture
+def diamond_graph():
+    """table.row_count and column.max both feed column.mean, which feeds column.z_score."""
+    row_count = MetricConfiguration("table.row_count", {})
+    column_max = MetricConfiguration("column.max", {"column": "a"})
+    mean = MetricConfiguration("column.mean", {"column": "a"})
+    z_score = MetricConfiguration("column.z_score", {"column": "a"})
+
+    graph = ValidationGraph()
+    graph.add(MetricEdge(z_score, mean))
+    graph.add(MetricEdge(mean, row_count))
+    graph.add(MetricEdge(mean, column_max))
+    graph.add(MetricEdge(row_count, None))
+    graph.add(MetricEdge(column_max, None))
+    return graph, (row_count, column_max, mean, z_score)
+
+
+def test_validation_graph_indexes_dependencies_by_metric_id(diamond_graph):
+    graph, (row_count, column_max, mean, z_score) = diamond_graph
+
+    assert graph.metric_ids == [z_score.id, mean.id, row_count.id, column_max.id]
+    assert graph.get_dependencies(mean.id) == {row_count.id, column_max.id}
+    assert graph.get_dependents(mean.id) == {z_score.id}
+    assert graph.get_dependencies(row_count.id) == set()
+
+    # Re-adding an equivalent edge built from distinct configuration objects is a no-op
+    graph.add(
+        MetricEdge(
+            MetricConfiguration("column.mean", {"column": "a"}),
+            MetricConfiguration("table.row_count", {}),
+        )
+    )
+    assert len(graph.edges) == 5
+    assert graph.get_metric_configuration(mean.id) is mean
+
+
+def test_scheduler_releases_metrics_in_topological_waves(diamond_graph):
+    graph, (row_count, column_max, mean, z_score) = diamond_graph
+    scheduler = ValidationGraphScheduler(graph)
+    metrics = {}
+
+    released = []
+    while scheduler.has_ready_metrics:
+        ready_metrics = scheduler.start_wave()
+        released.append([metric.id for metric in ready_metrics])
+        metrics.update({metric.id: None for metric in ready_metrics})
+        scheduler.complete_wave(metrics)
+
+    assert released == [[row_count.id, column_max.id], [mean.id], [z_score.id]]
+    assert scheduler.pending_metric_ids == set()
+    assert [wave.index for wave in scheduler.waves] == [0, 1, 2]
+    assert all(wave.elapsed is not None for wave in scheduler.waves)
+    assert scheduler.waves[1].to_json_dict()["metric_ids"] == [list(mean.id)]
+
+
+def test_scheduler_skips_metrics_that_are_already_available(diamond_graph):
+    graph, (row_count, column_max, mean, z_score) = diamond_graph
+    scheduler = ValidationGraphScheduler(
+        graph, metrics={row_count.id: 6, column_max.id: 22}
+    )
+
+    assert [metric.id for metric in scheduler.start_wave()] == [mean.id]
+
+
+def test_scheduler_requires_released_metrics_to_be_resolved(diamond_graph):
+    graph, _ = diamond_graph
+    scheduler = ValidationGraphScheduler(graph)
+    scheduler.start_wave()
+
+    with pytest.raises(GreatExpectationsError):
+        scheduler.complete_wave(metrics={})
+
+
+def test_scheduler_leaves_circular_dependencies_pending():
+    first = MetricConfiguration("first", {})
+    second = MetricConfiguration("second", {})
+    graph = ValidationGraph()
+    graph.add(MetricEdge(first, second))
+    graph.add(MetricEdge(second, first))
+
+    scheduler = ValidationGraphScheduler(graph)
+
+    assert not scheduler.has_ready_metrics
+    assert scheduler.pending_metric_ids == {first.id, second.id}
+
+
+def test_scheduler_only_resolves_dependencies_of_target_metrics(diamond_graph):
+    graph, (row_count, column_max, mean, z_score) = diamond_graph
+    # column.mean was found in the metric cache, so neither of its dependencies need be computed
+    scheduler = ValidationGraphScheduler(
+        graph, metrics={mean.id: 3}, target_metric_ids=[z_score.id]
+    )
+
+    assert scheduler.pending_metric_ids == {z_score.id}
+    assert [metric.id for metric in scheduler.start_wave()] == [z_score.id]
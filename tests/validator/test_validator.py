@@ -2,7 +2,12 @@ import pandas as pd
 
 import great_expectations.expectations.metrics
 from great_expectations.core import IDDict
-from great_expectations.core.batch import Batch, BatchRequest, PartitionRequest
+from great_expectations.core.batch import (
+    Batch,
+    BatchRequest,
+    PartitionDefinition,
+    PartitionRequest,
+)
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
@@ -183,6 +188,32 @@ def test_graph_validate(basic_datasource):
     ]
 
 
+def test_graph_validate_records_metric_resolution_waves():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    validator = Validator(execution_engine=engine)
+    validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_value_z_scores_to_be_less_than",
+                kwargs={"column": "b", "threshold": 4, "double_sided": True},
+            )
+        ]
+    )
+
+    waves = validator.metric_resolution_waves
+    assert len(waves) > 1
+    assert [wave.index for wave in waves] == list(range(len(waves)))
+    assert all(wave.elapsed >= 0 for wave in waves)
+    resolved_metric_ids = [metric_id for wave in waves for metric_id in wave.metric_ids]
+    # Every metric is released exactly once
+    assert len(resolved_metric_ids) == len(set(resolved_metric_ids))
+    resolved_metric_names = [metric_id[0] for metric_id in resolved_metric_ids]
+    assert resolved_metric_names.index("column.mean") < resolved_metric_names.index(
+        "column_values.z_score.map"
+    )
+
+
 # this might indicate that we need to validate configuration a little more strictly prior to actually validating
 def test_graph_validate_with_bad_config(basic_datasource):
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
@@ -327,3 +358,181 @@ def test_validator_default_expectation_args__sql(
     )
 
     print(my_validator.get_default_expectation_arguments())
+
+
+def test_validate_adds_query_report_to_meta(sa):
+    from great_expectations.core import ExpectationSuite
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyBatchData,
+    )
+
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]}).to_sql(
+        "test", eng, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=eng, record_queries=True, explain_queries=True
+    )
+    batch = Batch(data=SqlAlchemyBatchData(engine=eng, table_name="test"))
+    validator = Validator(execution_engine=engine, batches=(batch,))
+    suite = ExpectationSuite(
+        expectation_suite_name="test_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 30},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "b"},
+            ),
+        ],
+    )
+    result = validator.validate(expectation_suite=suite)
+
+    query_report = result.meta["query_report"]
+    assert query_report["query_count"] == len(query_report["queries"]) > 0
+    assert all(query["seconds"] >= 0 for query in query_report["queries"])
+    max_queries = [
+        query
+        for query in query_report["queries"]
+        if "column.max" in [metric_id[0] for metric_id in query["metric_ids"]]
+    ]
+    assert len(max_queries) == 1
+    assert "max(a)" in max_queries[0]["sql"]
+    assert max_queries[0]["rows"] == 1
+    assert max_queries[0]["explain"] is not None
+
+    expectation_summaries = query_report["expectations"]
+    assert [
+        summary["expectation_configuration"]["expectation_type"]
+        for summary in expectation_summaries
+    ] == ["expect_column_max_to_be_between", "expect_column_values_to_not_be_null"]
+    assert all(summary["query_count"] > 0 for summary in expectation_summaries)
+
+    # each validation reports its own queries, with an observer that is removed once it is done
+    assert engine._connection_manager.query_observers == []
+    other_suite = ExpectationSuite(
+        expectation_suite_name="other_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_min_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 30},
+            ),
+        ],
+    )
+    other_result = validator.validate(expectation_suite=other_suite)
+    other_metric_names = {
+        metric_id[0]
+        for query in other_result.meta["query_report"]["queries"]
+        for metric_id in query["metric_ids"]
+    }
+    assert "column.min" in other_metric_names
+    assert "column.max" not in other_metric_names
+    assert result.meta["query_report"] == query_report
+
+
+def _build_approximate_validation_suite():
+    from great_expectations.core import ExpectationSuite
+
+    return ExpectationSuite(
+        expectation_suite_name="test_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 1},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "a", "value_set": [0], "mostly": 0.5},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "a", "value_set": [0], "mostly": 0.99},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "b", "value_set": [0]},
+            ),
+        ],
+    )
+
+
+def _assert_approximate_validation_results(result, sample_element_count_range):
+    assert result.meta["approximate_validation"]["sampled_expectations"] == 3
+    assert result.meta["approximate_validation"]["escalated_expectations"] == 1
+    max_result, loose_result, tight_result, failing_result = result.results
+
+    # Expectations without mostly are validated on the full batch
+    assert max_result.success
+    assert "approximate_validation" not in max_result.meta
+
+    # 1% of the values of "a" are unexpected: clearly within what mostly=0.5 allows...
+    assert loose_result.success
+    assert loose_result.meta["approximate_validation"]["escalated"] is False
+    assert (
+        sample_element_count_range[0]
+        < loose_result.result["element_count"]
+        < sample_element_count_range[1]
+    )
+    lower, upper = loose_result.meta["approximate_validation"][
+        "unexpected_percent_interval"
+    ]
+    assert lower < upper < 50
+
+    # ...but too close to what mostly=0.99 allows to tell from the sample
+    assert tight_result.success
+    assert tight_result.meta["approximate_validation"]["escalated"] is True
+    assert tight_result.result["element_count"] == 10000
+
+    # Half of the values of "b" are unexpected
+    assert not failing_result.success
+    assert failing_result.meta["approximate_validation"]["escalated"] is False
+    assert result.statistics["unsuccessful_expectations"] == 1
+
+
+def test_validate_approximately():
+    df = pd.DataFrame({"a": [0] * 9900 + [1] * 100, "b": [0, 1] * 5000})
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=(Batch(data=df),)
+    )
+    result = validator.validate(
+        expectation_suite=_build_approximate_validation_suite(),
+        approximate={"sample_proportion": 0.1, "seed": 1},
+    )
+    assert result.meta["approximate_validation"]["seed"] == 1
+    _assert_approximate_validation_results(result, (999, 1001))
+    assert validator.execution_engine.active_batch_data.shape == (10000, 2)
+
+
+def test_validate_approximately_sql(sa):
+    from great_expectations.core.batch import BatchDefinition, BatchSpec
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [0] * 9900 + [1] * 100, "b": [0, 1] * 5000}).to_sql(
+        "test", eng, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+    batch_spec = BatchSpec(table_name="test")
+    batch_data, _ = engine.get_batch_data_and_markers(batch_spec)
+    batch = Batch(
+        data=batch_data,
+        batch_spec=batch_spec,
+        batch_definition=BatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="test",
+            partition_definition=PartitionDefinition({}),
+        ),
+    )
+    validator = Validator(execution_engine=engine, batches=(batch,))
+    result = validator.validate(
+        expectation_suite=_build_approximate_validation_suite(),
+        # sqlite samples cannot be seeded: a wide interval makes the outcome of each expectation (all but) certain
+        approximate={"confidence_level": 0.9999},
+    )
+    _assert_approximate_validation_results(result, (700, 1300))
+    assert list(engine.loaded_batch_data_dict.keys()) == [batch.id]
+    assert engine.active_batch_data_id == batch.id